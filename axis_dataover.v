@@ -0,0 +1,112 @@
+`timescale 1ns/1ps
+
+// AXI4-Stream 임계값 비교 스테이지 (dataover.v의 레지스터 출력 버전)
+//   - m_axis_tuser = (s_axis_tdata > threshold), signed 비교, 해당 비트와 같은 사이클에 출력
+//   - tdata/tkeep/tlast는 그대로 통과, 지연 PIPE_STAGES 클럭 (PIPE_STAGES < 1이면 1)
+//   - 단마다 valid를 두고 ready[i] = !valid[i] | ready[i+1]:
+//     출력이 막혀도 앞쪽 빈 단은 계속 채워지므로 백프레셔 아래에서도 클럭당 1비트, 빈 칸 없음
+//     (s_axis_tready는 단 수만큼의 OR 경로, 레지스터 아님)
+//   - PIPE_STAGES >= 2: 비교를 상위(signed)/하위(unsigned) 절반으로 나눠 0단에서 부분 비교,
+//     1단에서 합침 → 비교기 경로가 DATA_W/2 비트
+//   - threshold는 준정적 설정값 (바꾸면 이미 0단을 지난 비트에는 반영되지 않음)
+module axis_dataover #(
+    parameter integer DATA_W      = 32,
+    parameter integer KEEP_W      = (DATA_W/8),
+    parameter integer PIPE_STAGES = 2
+)(
+    input  wire                     aclk,
+    input  wire                     aresetn,
+
+    input  wire signed [DATA_W-1:0] threshold,
+
+    input  wire                     s_axis_tvalid,
+    output wire                     s_axis_tready,
+    input  wire [DATA_W-1:0]        s_axis_tdata,
+    input  wire [KEEP_W-1:0]        s_axis_tkeep,
+    input  wire                     s_axis_tlast,
+
+    output wire                     m_axis_tvalid,
+    input  wire                     m_axis_tready,
+    output wire [DATA_W-1:0]        m_axis_tdata,
+    output wire [KEEP_W-1:0]        m_axis_tkeep,
+    output wire                     m_axis_tlast,
+    output wire                     m_axis_tuser    // data_over
+);
+  localparam integer N     = (PIPE_STAGES > 1) ? PIPE_STAGES : 1;
+  localparam         SPLIT = (N > 1);
+  localparam integer LW    = DATA_W / 2;
+
+  // ---- 단별 레지스터 ----
+  reg               vld [0:N-1];
+  reg  [DATA_W-1:0] dat [0:N-1];
+  reg  [KEEP_W-1:0] kep [0:N-1];
+  reg               lst [0:N-1];
+  reg               ovr [0:N-1];            // 비교 결과 (SPLIT이면 1단부터 유효)
+  reg               hi_gt, hi_eq, lo_gt;    // SPLIT: 0단의 부분 비교 결과
+
+  // ---- 단별 ready: 비어 있거나 다음 단이 받을 수 있으면 적재 ----
+  wire [N:0] rdy;
+  assign rdy[N] = m_axis_tready;
+  genvar g;
+  generate for (g = 0; g < N; g = g + 1) begin : g_rdy
+    assign rdy[g] = !vld[g] || rdy[g+1];
+  end endgenerate
+
+  assign s_axis_tready = rdy[0];
+  assign m_axis_tvalid = vld[N-1];
+  assign m_axis_tdata  = dat[N-1];
+  assign m_axis_tkeep  = kep[N-1];
+  assign m_axis_tlast  = lst[N-1];
+  assign m_axis_tuser  = ovr[N-1];
+
+  // ---- 비교 ----
+  wire signed [DATA_W-LW-1:0] s_hi = s_axis_tdata[DATA_W-1:LW];
+  wire signed [DATA_W-LW-1:0] t_hi = threshold[DATA_W-1:LW];
+  wire        [LW-1:0]        s_lo = s_axis_tdata[LW-1:0];
+  wire        [LW-1:0]        t_lo = threshold[LW-1:0];
+  wire over_full  = ($signed(s_axis_tdata) > threshold);
+  wire over_split = hi_gt || (hi_eq && lo_gt);
+
+  // 0단: 입력 적재 + 비교 (데이터 경로는 리셋 없음, 유효성은 vld)
+  always @(posedge aclk) begin
+    if (!aresetn)
+      vld[0] <= 1'b0;
+    else if (rdy[0])
+      vld[0] <= s_axis_tvalid;
+  end
+
+  always @(posedge aclk) begin
+    if (rdy[0]) begin
+      dat[0] <= s_axis_tdata;
+      kep[0] <= s_axis_tkeep;
+      lst[0] <= s_axis_tlast;
+      if (SPLIT) begin
+        hi_gt <= (s_hi > t_hi);
+        hi_eq <= (s_hi == t_hi);
+        lo_gt <= (s_lo > t_lo);
+      end else begin
+        ovr[0] <= over_full;
+      end
+    end
+  end
+
+  // 1단 이후: 앞 단을 받아 전달 (1단에서 부분 비교 결과를 합침)
+  generate for (g = 1; g < N; g = g + 1) begin : g_stage
+    always @(posedge aclk) begin
+      if (!aresetn)
+        vld[g] <= 1'b0;
+      else if (rdy[g])
+        vld[g] <= vld[g-1];
+    end
+
+    always @(posedge aclk) begin
+      if (rdy[g]) begin
+        dat[g] <= dat[g-1];
+        kep[g] <= kep[g-1];
+        lst[g] <= lst[g-1];
+        ovr[g] <= (g == 1) ? over_split : ovr[g-1];
+      end
+    end
+  end endgenerate
+
+endmodule
@@ -0,0 +1,328 @@
+// axis_fifo_xpm의 행동(behavioral) 모델: XPM 라이브러리 없이 동작 (Icarus, Verilator 등)
+// axis_fifo_xpm.v 안에서 `ifdef VERILATOR / AXIS_FIFO_BEHAVIORAL 일 때 선택됨
+//
+// xpm_fifo_axis(common_clock, PACKET_FIFO="false")와 사이클 단위로 같게 동작하도록 구성:
+//   - RAM(DEPTH 워드) + FWFT 2단 출력 파이프라인(stage1 = 메모리 출력 레지스터, stage2 = m_axis)
+//     XPM의 fwft 상태기계(invalid / stage1_valid / stage2_valid / both_stages_valid)와 같은 전이
+//   - 쓰기 → m_axis_tvalid 지연: 핸드셰이크 에지 이후 2번째 에지에서 유효 (RAM → stage1 → stage2)
+//   - s_axis_tready = !RAM full && !rst_busy, 리셋 해제 후 RST_BUSY_CYCLES 동안 rst_busy 유지
+//   - prog_full: RAM 워드 수 >= PROG_FULL_THRESH, prog_empty: 전체 워드 수 <= PROG_EMPTY_THRESH
+//     (둘 다 레지스터 출력, 1클럭 지연)
+//   - wr_data_count: RAM 워드 수, rd_data_count: 전체 워드 수(RAM + 출력 2단), 폭이 좁으면 상위 비트
+//   - PACKET_FIFO="true": tlast까지 다 써진 패킷만 읽기 쪽에 보임 (store-and-forward)
+//     커밋 포인터(마지막 tlast 다음 주소)까지만 읽음, DEPTH보다 긴 패킷은 교착 (XPM과 동일 제약)
+//     패킷 모드의 지연은 XPM과 사이클 단위로 같지 않음
+// XPM과의 동치성은 sim_axis_fifo/ 의 cocotb 테스트로 확인 (Vivado/XPM 라이브러리가 있을 때)
+// DEPTH는 2의 거듭제곱
+//
+// 이 파일 아래쪽의 axis_fifo_beh_async는 CLOCKING_MODE="independent_clock"용 모델
+module axis_fifo_beh #(
+    parameter integer DATA_W = 32,
+    parameter integer KEEP_W = (DATA_W/8),
+    parameter integer USER_W = 0,
+    parameter integer DEPTH  = 1024,
+    parameter integer PROG_FULL_THRESH  = 10,
+    parameter integer PROG_EMPTY_THRESH = 10,
+    parameter integer RST_BUSY_CYCLES   = 4,
+    parameter         PACKET_FIFO       = "false",
+    parameter integer WR_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1,
+    parameter integer RD_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1
+)(
+    input  wire                 aclk,
+    input  wire                 aresetn,
+
+    // s_axis
+    input  wire                 s_axis_tvalid,
+    output wire                 s_axis_tready,
+    input  wire [DATA_W-1:0]    s_axis_tdata,
+    input  wire [KEEP_W-1:0]    s_axis_tkeep,
+    input  wire                 s_axis_tlast,
+    input  wire [(USER_W > 0 ? USER_W-1 : 0):0]    s_axis_tuser,
+
+    // m_axis
+    output wire                 m_axis_tvalid,
+    input  wire                 m_axis_tready,
+    output wire [DATA_W-1:0]    m_axis_tdata,
+    output wire [KEEP_W-1:0]    m_axis_tkeep,
+    output wire                 m_axis_tlast,
+    output wire [(USER_W > 0 ? USER_W-1 : 0):0]    m_axis_tuser,
+
+    // 상태/임계치
+    output reg                  prog_full,
+    output reg                  prog_empty,
+    output wire [WR_DATA_COUNT_WIDTH-1:0] wr_data_count,
+    output wire [RD_DATA_COUNT_WIDTH-1:0] rd_data_count
+);
+
+  localparam integer UW = (USER_W > 0) ? USER_W : 1;
+  localparam integer W  = DATA_W + KEEP_W + 1 + UW;
+  localparam integer AW = (DEPTH > 1) ? $clog2(DEPTH) : 1;
+  localparam integer BW = (RST_BUSY_CYCLES > 1) ? $clog2(RST_BUSY_CYCLES + 1) : 1;
+
+  localparam        PACKET = (PACKET_FIFO == "true");
+
+  // ---- RAM ----
+  reg  [W-1:0] mem [0:DEPTH-1];
+  reg  [AW:0]  wr_ptr;
+  reg  [AW:0]  wr_commit;                        // 패킷 모드: 마지막으로 완성된 패킷의 끝
+  reg  [AW:0]  rd_ptr;
+  wire [AW:0]  ram_count = wr_ptr - rd_ptr;
+  wire [AW:0]  rd_limit  = PACKET ? wr_commit : wr_ptr;
+  wire         ram_empty = (rd_limit == rd_ptr);  // 읽을 수 있는 워드 없음
+  wire         ram_full  = (ram_count == DEPTH);
+
+  // ---- FWFT 출력 파이프라인 ----
+  reg          st1_valid, st2_valid;
+  reg  [W-1:0] st1_data,  st2_data;
+
+  // ---- 리셋 busy ----
+  reg  [BW-1:0] busy_cnt;
+  wire          rst_busy = !aresetn || (busy_cnt != 0);
+
+  wire push    = s_axis_tvalid && s_axis_tready;
+  wire pop     = st2_valid && m_axis_tready;
+  wire st2_take = !st2_valid || pop;              // stage2가 이번 클럭에 비거나 비어 있음
+  wire st1_take = !st1_valid || st2_take;         // stage1이 비어 있거나 stage2로 넘어감
+  wire ram_rd   = st1_take && !ram_empty;
+
+  wire [AW+1:0] total = ram_count + st1_valid + st2_valid;
+  // DEPTH + 2워드까지 들어가므로 (AW+1)비트 최대값에서 포화
+  wire [AW:0]   count = total[AW+1] ? {(AW+1){1'b1}} : total[AW:0];
+
+  assign wr_data_count = ram_count >> (AW + 1 - WR_DATA_COUNT_WIDTH);
+  assign rd_data_count = count >> (AW + 1 - RD_DATA_COUNT_WIDTH);
+
+  assign s_axis_tready = !ram_full && !rst_busy;
+  assign m_axis_tvalid = st2_valid;
+  assign {m_axis_tuser, m_axis_tlast, m_axis_tkeep, m_axis_tdata} = st2_data;
+
+  always @(posedge aclk) begin
+    if (!aresetn) begin
+      wr_ptr     <= 0;
+      wr_commit  <= 0;
+      rd_ptr     <= 0;
+      st1_valid  <= 1'b0;
+      st2_valid  <= 1'b0;
+      busy_cnt   <= RST_BUSY_CYCLES;
+      prog_full  <= 1'b0;
+      prog_empty <= 1'b1;
+    end else begin
+      if (busy_cnt != 0)
+        busy_cnt <= busy_cnt - 1'b1;
+
+      if (push) begin
+        mem[wr_ptr[AW-1:0]] <= {s_axis_tuser, s_axis_tlast, s_axis_tkeep, s_axis_tdata};
+        wr_ptr <= wr_ptr + 1'b1;
+        if (s_axis_tlast)
+          wr_commit <= wr_ptr + 1'b1;
+      end
+
+      // stage2 ← stage1
+      if (st2_take) begin
+        st2_valid <= st1_valid;
+        st2_data  <= st1_data;
+      end
+      // stage1 ← RAM
+      if (st1_take) begin
+        st1_valid <= !ram_empty;
+        if (ram_rd) begin
+          st1_data <= mem[rd_ptr[AW-1:0]];
+          rd_ptr   <= rd_ptr + 1'b1;
+        end
+      end
+
+      prog_full  <= (ram_count >= PROG_FULL_THRESH);
+      prog_empty <= (total <= PROG_EMPTY_THRESH);
+    end
+  end
+
+endmodule
+
+// axis_fifo_xpm(CLOCKING_MODE="independent_clock")의 행동 모델
+//   - 쓰기 도메인 aclk(= XPM s_aclk), 읽기 도메인 m_aclk
+//   - 포인터는 Gray 코드로 CDC_SYNC_STAGES단 동기화 후 상대 도메인에서 비교 (표준 비동기 FIFO)
+//   - 읽기 쪽은 axis_fifo_beh와 같은 FWFT 2단 출력 파이프라인
+//   - aresetn은 쓰기 도메인 리셋, m_aclk 쪽으로 CDC_SYNC_STAGES단 동기화
+//     (XPM처럼 aresetn은 느린 클럭 기준 CDC_SYNC_STAGES+1 사이클 이상 유지해야 함)
+//   - s_axis_tready는 리셋 해제 후 RST_BUSY_CYCLES가 지나고 읽기 도메인 리셋 해제가 동기화되어 돌아온 뒤 1
+//   - prog_full / wr_data_count: 쓰기 도메인에서 본 RAM 워드 수 기준 (읽기 포인터는 동기화 지연만큼 늦게 반영)
+//   - prog_empty / rd_data_count: 읽기 도메인에서 본 전체 워드 수(RAM + 출력 2단) 기준
+//   - PACKET_FIFO="true": 쓰기 포인터 대신 커밋 포인터(완성된 패킷의 끝)를 읽기 도메인으로 넘김
+// 기능(순서, 유실 없음, 처리율, 동기화 단수만큼의 지연)은 XPM과 같지만 사이클 단위 동치는 아님
+module axis_fifo_beh_async #(
+    parameter integer DATA_W = 32,
+    parameter integer KEEP_W = (DATA_W/8),
+    parameter integer USER_W = 0,
+    parameter integer DEPTH  = 1024,
+    parameter integer PROG_FULL_THRESH  = 10,
+    parameter integer PROG_EMPTY_THRESH = 10,
+    parameter integer RST_BUSY_CYCLES   = 4,
+    parameter integer CDC_SYNC_STAGES   = 2,
+    parameter         PACKET_FIFO       = "false",
+    parameter integer WR_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1,
+    parameter integer RD_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1
+)(
+    input  wire                 aclk,
+    input  wire                 m_aclk,
+    input  wire                 aresetn,
+
+    // s_axis (aclk)
+    input  wire                 s_axis_tvalid,
+    output wire                 s_axis_tready,
+    input  wire [DATA_W-1:0]    s_axis_tdata,
+    input  wire [KEEP_W-1:0]    s_axis_tkeep,
+    input  wire                 s_axis_tlast,
+    input  wire [(USER_W > 0 ? USER_W-1 : 0):0]    s_axis_tuser,
+
+    // m_axis (m_aclk)
+    output wire                 m_axis_tvalid,
+    input  wire                 m_axis_tready,
+    output wire [DATA_W-1:0]    m_axis_tdata,
+    output wire [KEEP_W-1:0]    m_axis_tkeep,
+    output wire                 m_axis_tlast,
+    output wire [(USER_W > 0 ? USER_W-1 : 0):0]    m_axis_tuser,
+
+    // 상태/임계치
+    output reg                  prog_full,
+    output reg                  prog_empty,
+    output wire [WR_DATA_COUNT_WIDTH-1:0] wr_data_count,
+    output wire [RD_DATA_COUNT_WIDTH-1:0] rd_data_count
+);
+
+  localparam integer UW = (USER_W > 0) ? USER_W : 1;
+  localparam integer W  = DATA_W + KEEP_W + 1 + UW;
+  localparam integer AW = (DEPTH > 1) ? $clog2(DEPTH) : 1;
+  localparam integer BW = (RST_BUSY_CYCLES > 1) ? $clog2(RST_BUSY_CYCLES + 1) : 1;
+  localparam integer S  = (CDC_SYNC_STAGES > 1) ? CDC_SYNC_STAGES : 2;
+  localparam         PACKET = (PACKET_FIFO == "true");
+
+  function [AW:0] bin2gray(input [AW:0] b);
+    bin2gray = b ^ (b >> 1);
+  endfunction
+
+  function [AW:0] gray2bin(input [AW:0] g);
+    integer i;
+    begin
+      gray2bin[AW] = g[AW];
+      for (i = AW - 1; i >= 0; i = i - 1)
+        gray2bin[i] = gray2bin[i + 1] ^ g[i];
+    end
+  endfunction
+
+  reg  [W-1:0] mem [0:DEPTH-1];
+
+  // ---- 쓰기 도메인 (aclk) ----
+  reg  [AW:0]   wr_ptr, wr_gray;      // wr_gray: 읽기 쪽에 보이는 포인터 (패킷 모드에서는 커밋 포인터)
+  reg  [AW:0]   wr_commit;
+  reg  [AW:0]   rd_gray_s [0:S-1];    // 읽기 포인터 동기화 체인
+  reg  [S-1:0]  m_ack_s;              // 읽기 도메인 리셋 해제 동기화
+  reg  [BW-1:0] busy_cnt;
+  reg  [AW:0]   wr_count;
+
+  wire [AW:0]   rd_ptr_s  = gray2bin(rd_gray_s[S-1]);
+  wire [AW:0]   wr_used   = wr_ptr - rd_ptr_s;
+  wire          wr_full   = (wr_used == DEPTH);
+  wire          rst_busy  = !aresetn || (busy_cnt != 0) || !m_ack_s[S-1];
+  wire          push      = s_axis_tvalid && s_axis_tready;
+  wire [AW:0]   wr_next   = wr_ptr + push;
+  wire [AW:0]   wr_used_next = wr_next - rd_ptr_s;
+  wire [AW:0]   commit_next  = (push && s_axis_tlast) ? wr_next : wr_commit;
+
+  assign s_axis_tready = !wr_full && !rst_busy;
+  assign wr_data_count = wr_count >> (AW + 1 - WR_DATA_COUNT_WIDTH);
+
+  integer i;
+  always @(posedge aclk) begin
+    if (!aresetn) begin
+      wr_ptr    <= 0;
+      wr_gray   <= 0;
+      wr_commit <= 0;
+      for (i = 0; i < S; i = i + 1)
+        rd_gray_s[i] <= 0;
+      m_ack_s   <= 0;
+      busy_cnt  <= RST_BUSY_CYCLES;
+      wr_count  <= 0;
+      prog_full <= 1'b0;
+    end else begin
+      if (busy_cnt != 0)
+        busy_cnt <= busy_cnt - 1'b1;
+      m_ack_s <= {m_ack_s[S-2:0], m_rstn};
+      rd_gray_s[0] <= rd_gray;
+      for (i = 1; i < S; i = i + 1)
+        rd_gray_s[i] <= rd_gray_s[i - 1];
+
+      if (push)
+        mem[wr_ptr[AW-1:0]] <= {s_axis_tuser, s_axis_tlast, s_axis_tkeep, s_axis_tdata};
+      wr_ptr    <= wr_next;
+      wr_commit <= commit_next;
+      wr_gray   <= bin2gray(PACKET ? commit_next : wr_next);
+      wr_count  <= wr_used_next;
+      prog_full <= (wr_used_next >= PROG_FULL_THRESH);
+    end
+  end
+
+  // ---- 읽기 도메인 (m_aclk) ----
+  reg  [S-1:0]  m_rst_s;              // aresetn 동기화
+  wire          m_rstn = m_rst_s[S-1];
+  reg  [AW:0]   rd_ptr, rd_gray;
+  reg  [AW:0]   wr_gray_m [0:S-1];    // 쓰기 포인터 동기화 체인
+  reg  [AW+1:0] rd_count;
+  integer j;
+
+  reg           st1_valid, st2_valid;
+  reg  [W-1:0]  st1_data,  st2_data;
+
+  wire [AW:0]   wr_ptr_m  = gray2bin(wr_gray_m[S-1]);
+  wire [AW:0]   ram_count = wr_ptr_m - rd_ptr;
+  wire          ram_empty = (ram_count == 0);
+  wire          pop       = st2_valid && m_axis_tready;
+  wire          st2_take  = !st2_valid || pop;
+  wire          st1_take  = !st1_valid || st2_take;
+  wire          ram_rd    = st1_take && !ram_empty;
+  wire [AW:0]   rd_next   = rd_ptr + ram_rd;
+
+  // stage 이동 후의 워드 수: RAM + stage1 + stage2
+  wire          st1_next  = st1_take ? !ram_empty : st1_valid;
+  wire          st2_next  = st2_take ? st1_valid  : st2_valid;
+  wire [AW:0]   ram_next  = wr_ptr_m - rd_next;
+  wire [AW+1:0] rd_total  = ram_next + st1_next + st2_next;
+
+  assign m_axis_tvalid = st2_valid;
+  assign {m_axis_tuser, m_axis_tlast, m_axis_tkeep, m_axis_tdata} = st2_data;
+  assign rd_data_count = (rd_count[AW+1] ? {(AW+1){1'b1}} : rd_count[AW:0]) >> (AW + 1 - RD_DATA_COUNT_WIDTH);
+
+  always @(posedge m_aclk) begin
+    m_rst_s <= {m_rst_s[S-2:0], aresetn};
+    if (!m_rstn) begin
+      rd_ptr     <= 0;
+      rd_gray    <= 0;
+      for (j = 0; j < S; j = j + 1)
+        wr_gray_m[j] <= 0;
+      rd_count   <= 0;
+      st1_valid  <= 1'b0;
+      st2_valid  <= 1'b0;
+      prog_empty <= 1'b1;
+    end else begin
+      wr_gray_m[0] <= wr_gray;
+      for (j = 1; j < S; j = j + 1)
+        wr_gray_m[j] <= wr_gray_m[j - 1];
+
+      // stage2 ← stage1
+      if (st2_take) begin
+        st2_valid <= st1_valid;
+        st2_data  <= st1_data;
+      end
+      // stage1 ← RAM
+      if (st1_take) begin
+        st1_valid <= !ram_empty;
+        if (ram_rd)
+          st1_data <= mem[rd_ptr[AW-1:0]];
+      end
+      rd_ptr     <= rd_next;
+      rd_gray    <= bin2gray(rd_next);
+      rd_count   <= rd_total;
+      prog_empty <= (rd_total <= PROG_EMPTY_THRESH);
+    end
+  end
+
+endmodule
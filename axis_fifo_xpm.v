@@ -1,12 +1,35 @@
 // xpm_fifo_axis 기반, Vivado/Questa 모두 동작
+// XPM이 없는 시뮬레이터(Verilator) 또는 +define+AXIS_FIFO_BEHAVIORAL 이면
+// axis_fifo_beh.v(사이클 동등 행동 모델)로 대체: Vivado/XPM 컴파일 없이 Icarus에서도 동작
+// CLOCKING_MODE="independent_clock"이면 쓰기 aclk(= s_aclk) / 읽기 m_aclk 비동기 FIFO
+// (행동 모델은 axis_fifo_beh_async, 기능 동등·사이클 비동등)
+`ifdef VERILATOR
+  `ifndef AXIS_FIFO_BEHAVIORAL
+    `define AXIS_FIFO_BEHAVIORAL
+  `endif
+`endif
+
 module axis_fifo_xpm #(
     parameter integer DATA_W = 32,
     parameter integer KEEP_W = (DATA_W/8),
     parameter integer USER_W = 0,
-    parameter integer DEPTH  = 1024
+    parameter integer DEPTH  = 1024,
+    parameter integer PROG_FULL_THRESH  = 10,
+    parameter integer PROG_EMPTY_THRESH = 10,
+    // "auto" | "block" | "distributed" | "ultra": XPM 메모리 자원 선택 (행동 모델에서는 사용하지 않음)
+    parameter         FIFO_MEMORY_TYPE  = "auto",
+    // "common_clock" | "independent_clock"
+    parameter         CLOCKING_MODE     = "common_clock",
+    // "true": tlast까지 들어온 패킷만 내보냄 (store-and-forward), "false": cut-through
+    parameter         PACKET_FIFO       = "false",
+    parameter integer CDC_SYNC_STAGES   = 2,
+    // 1 .. log2(DEPTH)+1, 좁으면 상위 비트
+    parameter integer WR_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1,
+    parameter integer RD_DATA_COUNT_WIDTH = $clog2(DEPTH) + 1
 )(
-    input  wire                 aclk,
-    input  wire                 aresetn,
+    input  wire                 aclk,       // s_axis 클럭 (common_clock에서는 양쪽 공통)
+    input  wire                 m_aclk,     // m_axis 클럭 (independent_clock에서만 사용)
+    input  wire                 aresetn,    // aclk 도메인
 
     // s_axis
     input  wire                 s_axis_tvalid,
@@ -24,31 +47,100 @@ module axis_fifo_xpm #(
     output wire                 m_axis_tlast,
     output wire [(USER_W > 0 ? USER_W-1 : 0):0]    m_axis_tuser,
 
-    // 선택: 상태/임계치
+    // 선택: 상태/임계치 (prog_full, wr_data_count: aclk / prog_empty, rd_data_count: m_aclk 도메인)
     output wire                 prog_full,
-    output wire                 prog_empty
+    output wire                 prog_empty,
+    output wire [WR_DATA_COUNT_WIDTH-1:0] wr_data_count,
+    output wire [RD_DATA_COUNT_WIDTH-1:0] rd_data_count
 );
 
+`ifdef AXIS_FIFO_BEHAVIORAL
+generate if (CLOCKING_MODE == "independent_clock") begin : g_async
+  axis_fifo_beh_async #(
+    .DATA_W              (DATA_W),
+    .KEEP_W              (KEEP_W),
+    .USER_W              (USER_W),
+    .DEPTH               (DEPTH),
+    .PROG_FULL_THRESH    (PROG_FULL_THRESH),
+    .PROG_EMPTY_THRESH   (PROG_EMPTY_THRESH),
+    .CDC_SYNC_STAGES     (CDC_SYNC_STAGES),
+    .PACKET_FIFO         (PACKET_FIFO),
+    .WR_DATA_COUNT_WIDTH (WR_DATA_COUNT_WIDTH),
+    .RD_DATA_COUNT_WIDTH (RD_DATA_COUNT_WIDTH)
+  ) u_fifo_beh (
+    .aclk          (aclk),
+    .m_aclk        (m_aclk),
+    .aresetn       (aresetn),
+    .s_axis_tvalid (s_axis_tvalid),
+    .s_axis_tready (s_axis_tready),
+    .s_axis_tdata  (s_axis_tdata),
+    .s_axis_tkeep  (s_axis_tkeep),
+    .s_axis_tlast  (s_axis_tlast),
+    .s_axis_tuser  (s_axis_tuser),
+    .m_axis_tvalid (m_axis_tvalid),
+    .m_axis_tready (m_axis_tready),
+    .m_axis_tdata  (m_axis_tdata),
+    .m_axis_tkeep  (m_axis_tkeep),
+    .m_axis_tlast  (m_axis_tlast),
+    .m_axis_tuser  (m_axis_tuser),
+    .prog_full     (prog_full),
+    .prog_empty    (prog_empty),
+    .wr_data_count (wr_data_count),
+    .rd_data_count (rd_data_count)
+  );
+end else begin : g_sync
+  axis_fifo_beh #(
+    .DATA_W            (DATA_W),
+    .KEEP_W            (KEEP_W),
+    .USER_W            (USER_W),
+    .DEPTH             (DEPTH),
+    .PROG_FULL_THRESH  (PROG_FULL_THRESH),
+    .PROG_EMPTY_THRESH (PROG_EMPTY_THRESH),
+    .PACKET_FIFO       (PACKET_FIFO),
+    .WR_DATA_COUNT_WIDTH (WR_DATA_COUNT_WIDTH),
+    .RD_DATA_COUNT_WIDTH (RD_DATA_COUNT_WIDTH)
+  ) u_fifo_beh (
+    .aclk          (aclk),
+    .aresetn       (aresetn),
+    .s_axis_tvalid (s_axis_tvalid),
+    .s_axis_tready (s_axis_tready),
+    .s_axis_tdata  (s_axis_tdata),
+    .s_axis_tkeep  (s_axis_tkeep),
+    .s_axis_tlast  (s_axis_tlast),
+    .s_axis_tuser  (s_axis_tuser),
+    .m_axis_tvalid (m_axis_tvalid),
+    .m_axis_tready (m_axis_tready),
+    .m_axis_tdata  (m_axis_tdata),
+    .m_axis_tkeep  (m_axis_tkeep),
+    .m_axis_tlast  (m_axis_tlast),
+    .m_axis_tuser  (m_axis_tuser),
+    .prog_full     (prog_full),
+    .prog_empty    (prog_empty),
+    .wr_data_count (wr_data_count),
+    .rd_data_count (rd_data_count)
+  );
+end endgenerate
+`else
   xpm_fifo_axis #(
     // ========== 기본 설정 ==========   .CASCADE_HEIGHT(0),             // DECIMAL
-   .CDC_SYNC_STAGES(2),            // DECIMAL
-   .CLOCKING_MODE("common_clock"), // String
+   .CDC_SYNC_STAGES(CDC_SYNC_STAGES), // DECIMAL
+   .CLOCKING_MODE(CLOCKING_MODE),  // String
    .ECC_MODE("no_ecc"),            // String
    .EN_SIM_ASSERT_ERR("warning"),  // String
    .FIFO_DEPTH(DEPTH),              // DECIMAL
-   .FIFO_MEMORY_TYPE("auto"),      // String
-   .PACKET_FIFO("false"),          // String
-   .PROG_EMPTY_THRESH(10),         // DECIMAL
-   .PROG_FULL_THRESH(10),          // DECIMAL
-   .RD_DATA_COUNT_WIDTH(1),        // DECIMAL
+   .FIFO_MEMORY_TYPE(FIFO_MEMORY_TYPE), // String
+   .PACKET_FIFO(PACKET_FIFO),      // String
+   .PROG_EMPTY_THRESH(PROG_EMPTY_THRESH), // DECIMAL
+   .PROG_FULL_THRESH(PROG_FULL_THRESH),   // DECIMAL
+   .RD_DATA_COUNT_WIDTH(RD_DATA_COUNT_WIDTH), // DECIMAL
    .RELATED_CLOCKS(0),             // DECIMAL
    .SIM_ASSERT_CHK(0),             // DECIMAL; 0=disable simulation messages, 1=enable simulation messages
    .TDATA_WIDTH(DATA_W),               // DECIMAL
    .TDEST_WIDTH(1),                // DECIMAL
    .TID_WIDTH(1),                  // DECIMAL
    .TUSER_WIDTH(USER_W),           // DECIMAL
-   .USE_ADV_FEATURES("1000"),      // String
-   .WR_DATA_COUNT_WIDTH(1)         // DECIMAL
+   .USE_ADV_FEATURES("1606"),      // String; prog_full(bit1) + wr_data_count(bit2) + prog_empty(bit9) + rd_data_count(bit10)
+   .WR_DATA_COUNT_WIDTH(WR_DATA_COUNT_WIDTH)  // DECIMAL
   ) u_xpm_fifo_axis (
     .s_aresetn               (aresetn),
     .s_aclk                  (aclk),
@@ -77,16 +169,17 @@ module axis_fifo_xpm #(
     .prog_empty_axis              (prog_empty),
     // .wr_data_count           (),        // 비AXIS 카운트(미사용)
     // .rd_data_count           (),        // 비AXIS 카운트(미사용)
-    .wr_data_count_axis      (),        // AXIS 기준 write 카운트
-    .rd_data_count_axis      (),        // AXIS 기준 read 카운트
+    .wr_data_count_axis      (wr_data_count),   // AXIS 기준 write 카운트 (s_aclk)
+    .rd_data_count_axis      (rd_data_count),   // AXIS 기준 read 카운트 (m_aclk)
 
 
     .injectsbiterr_axis(1'b0),
     .injectdbiterr_axis(1'b0),
 
     // 비동기 모드에서만 쓰는 포트 (common_clock에서는 미사용)
-    .m_aclk                  (1'b0)
+    .m_aclk                  (m_aclk)
     // .s_axis_tready_early     ()
   );
+`endif
 
 endmodule
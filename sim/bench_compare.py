@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Compare benchmark runs recorded in a JSON history file (simlib.bench)
+
+    python3 sim/bench_compare.py sim_axis_master_file/bench_history.json
+    python3 sim/bench_compare.py history.json --baseline 0 --threshold 10
+    python3 sim/bench_compare.py history.json --list
+
+By default the latest run is compared with the one before it. The exit
+status is 1 if any metric got worse by more than the threshold (percent).
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simlib.bench import compare, format_table, load_history  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flag benchmark regressions between two recorded runs")
+    parser.add_argument("history")
+    parser.add_argument("--baseline", type=int, default=-2, help="index of the baseline run (default -2: previous)")
+    parser.add_argument("--current", type=int, default=-1, help="index of the run to check (default -1: latest)")
+    parser.add_argument("--threshold", type=float, default=5.0, help="allowed degradation in percent (default 5)")
+    parser.add_argument("--list", action="store_true", help="list the recorded runs")
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    if args.list:
+        for i, run in enumerate(history):
+            print(f"{i:3d}  {run.get('time')}  {run.get('rev') or '-':>9}  {run.get('sim') or '-':<8} "
+                  f"{len(run.get('points', []))} points  {run.get('label', '')}")
+        return 0
+    if len(history) < 2:
+        print(f"{args.history}: need at least two runs to compare ({len(history)} recorded)")
+        return 0
+
+    baseline, current = history[args.baseline], history[args.current]
+    rows = compare(baseline, current, args.threshold / 100.0)
+    print(f"baseline: {baseline.get('time')} {baseline.get('rev') or ''} {baseline.get('label', '')}")
+    print(f"current:  {current.get('time')} {current.get('rev') or ''} {current.get('label', '')}")
+    print(format_table(rows))
+    regressions = [r for r in rows if r[5]]
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:g}%")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
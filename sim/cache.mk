@@ -0,0 +1,25 @@
+# Content-hash compile cache for the cocotb flows (see sim/compile_cache.py)
+#
+# Include AFTER $(shell cocotb-config --makefiles)/Makefile.sim:
+#     include $(PWD)/../sim/cache.mk
+#
+# Icarus: the iverilog command is wrapped so an unchanged design (same source
+# content, compile args and iverilog version) is copied from the cache instead
+# of recompiled. Questa compiles inside cocotb's runsim.do on every run and
+# is not wrapped. SIM_CACHE=0 disables the cache, SIM_CACHE_DIR relocates it.
+
+SIM_CACHE ?= 1
+SIM_CACHE_PY := $(abspath $(dir $(lastword $(MAKEFILE_LIST))))/compile_cache.py
+export SIM_CACHE
+
+ifeq ($(SIM_CACHE),1)
+ifeq ($(SIM),icarus)
+    CMD := python3 $(SIM_CACHE_PY) $(CMD)
+endif
+endif
+
+.PHONY: cache-clear cache-stats
+cache-clear:
+	python3 $(SIM_CACHE_PY) --clear
+cache-stats:
+	python3 $(SIM_CACHE_PY) --stats
@@ -0,0 +1,32 @@
+# Simulator-side clock for the cocotb flows (see sim/cocotb_hdl_clock.v)
+#
+# Include BEFORE $(shell cocotb-config --makefiles)/Makefile.sim:
+#     include $(PWD)/../sim/clock.mk
+#
+# Adds the cocotb_hdl_clock root module, which drives HDL_CLOCK_SIGNAL
+# (default: <TOPLEVEL>.aclk) once Python enables it. Testers then use it
+# through simlib.tester.TesterBase.start_clock(); without the module they
+# fall back to cocotb.clock.Clock. HDL_CLOCK=0 leaves it out.
+# Supported on icarus and questa.
+
+HDL_CLOCK ?= 1
+# resolved now: cocotb's questa makefile later rewrites TOPLEVEL as "lib.top"
+HDL_CLOCK_SIGNAL := $(or $(HDL_CLOCK_SIGNAL),$(TOPLEVEL).aclk)
+HDL_CLOCK_V := $(abspath $(dir $(lastword $(MAKEFILE_LIST))))/cocotb_hdl_clock.v
+
+ifeq ($(HDL_CLOCK),1)
+ifneq ($(filter icarus questa,$(SIM)),)
+
+VERILOG_SOURCES += $(HDL_CLOCK_V)
+# tells simlib.tester the module exists
+PLUSARGS += +COCOTB_HDL_CLOCK
+
+ifeq ($(SIM),icarus)
+    COMPILE_ARGS += -DCOCOTB_CLOCK_TARGET=$(HDL_CLOCK_SIGNAL) -s cocotb_hdl_clock
+else
+    COMPILE_ARGS += +define+COCOTB_CLOCK_TARGET=$(HDL_CLOCK_SIGNAL)
+    SIM_ARGS += $(TOPLEVEL_LIBRARY).cocotb_hdl_clock
+endif
+
+endif
+endif
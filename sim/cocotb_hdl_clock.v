@@ -0,0 +1,33 @@
+// cocotb_hdl_clock.v
+// Simulator-side clock for cocotb testbenches (see sim/clock.mk, simlib/tester.py).
+//
+// Compiled as an extra root module. While `enable` is 1 it forces the
+// target clock net (`COCOTB_CLOCK_TARGET, e.g. top_axis_dataover.aclk) to a
+// clock toggled here every half_period_ps, so no Python code runs per edge.
+// Clearing `enable` releases the net again (a cocotb Clock can take over).
+`timescale 1ps/1ps
+
+`ifndef COCOTB_CLOCK_TARGET
+  `define COCOTB_CLOCK_TARGET aclk
+`endif
+
+module cocotb_hdl_clock;
+  reg        enable;
+  reg [31:0] half_period_ps;
+  reg        clk;
+
+  initial begin
+    enable         = 1'b0;
+    half_period_ps = 32'd5000;
+    clk            = 1'b0;
+  end
+
+  always @(posedge enable) force `COCOTB_CLOCK_TARGET = clk;
+  always @(negedge enable) release `COCOTB_CLOCK_TARGET;
+
+  // half_period_ps is re-read every edge, so a new period applies at once
+  always begin
+    wait (enable);
+    #(half_period_ps) if (enable) clk = ~clk;
+  end
+endmodule
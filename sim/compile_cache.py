@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Content-addressed compile cache for the cocotb flows
+
+Wraps the simulator compile command and reuses a previous output when nothing
+that affects it has changed:
+
+    python3 sim/compile_cache.py iverilog -o sim_build/sim.vvp ... a.v b.sv
+
+The key is a SHA-256 over
+
+  * the simulator version (first line of `<tool> -V`, plus the binary's identity),
+  * the command line with the output path and build-directory paths normalised,
+  * the content of every file argument (sources, -f command files) and of the
+    Verilog files in every -I include directory.
+
+On a hit the cached output is copied to the -o path and the compiler is not
+run at all; on a miss the command runs and its output is stored. Entries are
+written to a temporary file and moved into place with os.replace(), so parallel
+runs (sim/run_regression.py) can share one cache safely: the worst case is two
+runs compiling the same key and one rename winning with an identical file.
+
+The cache lives in sim/.simcache, or in $SIM_CACHE_DIR if set. Flows enable it
+by including sim/cache.mk after the cocotb Makefile.sim (SIM_CACHE=0 disables).
+
+    python3 sim/compile_cache.py --clear     # remove all entries
+    python3 sim/compile_cache.py --stats     # entry count and size
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".simcache")
+HDL_EXTS = (".v", ".sv", ".vh", ".svh", ".inc")
+
+
+def cache_dir():
+    return os.environ.get("SIM_CACHE_DIR") or DEFAULT_DIR
+
+
+def _log(msg):
+    sys.stderr.write(f"[compile_cache] {msg}\n")
+
+
+def _hash_file(h, path):
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+
+
+def tool_version(exe):
+    """Version banner of the compiler plus its resolved path/size/mtime"""
+    path = shutil.which(exe) or exe
+    ident = ""
+    try:
+        st = os.stat(path)
+        ident = f"{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        pass
+    try:
+        out = subprocess.run([path, "-V"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                             timeout=30).stdout.decode(errors="replace")
+        banner = out.strip().splitlines()[0] if out.strip() else ""
+    except (OSError, subprocess.SubprocessError):
+        banner = ""
+    return f"{banner}|{ident}"
+
+
+def output_path(cmd):
+    """The -o argument of the command (None if absent)"""
+    for i, arg in enumerate(cmd):
+        if arg == "-o" and i + 1 < len(cmd):
+            return cmd[i + 1]
+        if arg.startswith("-o") and len(arg) > 2:
+            return arg[2:]
+    return None
+
+
+def compute_key(cmd, output):
+    h = hashlib.sha256()
+    h.update(tool_version(cmd[0]).encode())
+    build_dir = os.path.dirname(os.path.abspath(output))
+
+    def norm(path):
+        # files generated in the build directory (cmds.f, ...) are keyed by
+        # content only, so isolated build directories share entries
+        ap = os.path.abspath(path)
+        if ap.startswith(build_dir + os.sep):
+            return "$BUILD/" + os.path.relpath(ap, build_dir)
+        return path
+
+    skip_next = False
+    for arg in cmd[1:]:
+        if skip_next:
+            h.update(b"\0-o $OUT")
+            skip_next = False
+            continue
+        if arg == "-o":
+            skip_next = True
+            continue
+        if arg.startswith("-o") and len(arg) > 2:
+            h.update(b"\0-o $OUT")
+            continue
+        if arg.startswith("-I") and os.path.isdir(arg[2:]):
+            h.update(b"\0-I" + norm(arg[2:]).encode())
+            inc = arg[2:]
+            for name in sorted(os.listdir(inc)):
+                if name.endswith(HDL_EXTS) and os.path.isfile(os.path.join(inc, name)):
+                    h.update(b"\0inc:" + name.encode())
+                    _hash_file(h, os.path.join(inc, name))
+            continue
+        if os.path.isfile(arg):
+            h.update(b"\0file:" + norm(arg).encode() + b"\0")
+            _hash_file(h, arg)
+            continue
+        h.update(b"\0" + arg.encode())
+    return h.hexdigest()
+
+
+def _entry(key):
+    return os.path.join(cache_dir(), key[:2], key)
+
+
+def _store(src, key):
+    dest = _entry(key)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f, open(src, "rb") as s:
+            shutil.copyfileobj(s, f)
+        os.replace(tmp, dest)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _copy_out(src, output):
+    # same temp + rename dance so a concurrent reader never sees a partial file
+    out_dir = os.path.dirname(os.path.abspath(output))
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=out_dir, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f, open(src, "rb") as s:
+        shutil.copyfileobj(s, f)
+    shutil.copymode(src, tmp)
+    os.replace(tmp, output)
+
+
+def run(cmd):
+    output = output_path(cmd)
+    if output is None or os.environ.get("SIM_CACHE") == "0":
+        return subprocess.call(cmd)
+
+    key = compute_key(cmd, output)
+    entry = _entry(key)
+    if os.path.isfile(entry):
+        _copy_out(entry, output)
+        _log(f"hit {key[:12]} -> {output}")
+        return 0
+
+    rc = subprocess.call(cmd)
+    if rc == 0 and os.path.isfile(output):
+        _store(output, key)
+        _log(f"miss {key[:12]}, stored")
+    return rc
+
+
+def stats():
+    n = size = 0
+    for dirpath, _, files in os.walk(cache_dir()):
+        for name in files:
+            if not name.startswith(".tmp-"):
+                n += 1
+                size += os.path.getsize(os.path.join(dirpath, name))
+    print(f"{cache_dir()}: {n} entries, {size / 1e6:.1f} MB")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ["--clear"]:
+        shutil.rmtree(cache_dir(), ignore_errors=True)
+        return 0
+    if argv == ["--stats"]:
+        stats()
+        return 0
+    if not argv:
+        sys.stderr.write(__doc__)
+        return 2
+    return run(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
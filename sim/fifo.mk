@@ -0,0 +1,50 @@
+# AXIS FIFO model selection for flows that use axis_fifo_xpm.v
+#
+# Include BEFORE $(shell cocotb-config --makefiles)/Makefile.sim:
+#     include $(PWD)/../sim/fifo.mk
+#
+# Adds axis_fifo_xpm.v and axis_fifo_beh.v to VERILOG_SOURCES and picks what
+# axis_fifo_xpm wraps:
+#
+#     FIFO_MODEL=beh   axis_fifo_beh (AXIS_FIFO_BEHAVIORAL define): no Vivado,
+#                      no XPM compile; works on icarus, verilator and questa
+#     FIFO_MODEL=xpm   xpm_fifo_axis, compiled from the XPM sources in XPM_DIR
+#                      (default $(XILINX_VIVADO)/data/ip/xpm); questa only
+#
+# Default: xpm on questa when XILINX_VIVADO is set, beh otherwise.
+# FIFO_MODEL is exported so the tests can see which model they run against.
+
+FIFO_RTL_DIR := $(abspath $(dir $(lastword $(MAKEFILE_LIST)))/..)
+
+ifneq ($(and $(XILINX_VIVADO),$(filter questa,$(SIM))),)
+    FIFO_MODEL ?= xpm
+else
+    FIFO_MODEL ?= beh
+endif
+XPM_DIR ?= $(XILINX_VIVADO)/data/ip/xpm
+
+VERILOG_SOURCES += $(FIFO_RTL_DIR)/axis_fifo_xpm.v $(FIFO_RTL_DIR)/axis_fifo_beh.v
+
+ifeq ($(FIFO_MODEL),beh)
+ifeq ($(SIM),questa)
+    COMPILE_ARGS += +define+AXIS_FIFO_BEHAVIORAL
+else
+    # icarus and verilator (verilator also selects it on its own)
+    COMPILE_ARGS += -DAXIS_FIFO_BEHAVIORAL
+endif
+else ifeq ($(FIFO_MODEL),xpm)
+ifneq ($(SIM),questa)
+    $(error FIFO_MODEL=xpm needs SIM=questa (xpm_fifo_axis does not build on $(SIM)))
+endif
+ifeq ($(wildcard $(XPM_DIR)/xpm_fifo/hdl/xpm_fifo.sv),)
+    $(error XPM sources not found in XPM_DIR=$(XPM_DIR) (set XILINX_VIVADO or use FIFO_MODEL=beh))
+endif
+    VERILOG_SOURCES += \
+	$(XPM_DIR)/xpm_cdc/hdl/xpm_cdc.sv \
+	$(XPM_DIR)/xpm_memory/hdl/xpm_memory.sv \
+	$(XPM_DIR)/xpm_fifo/hdl/xpm_fifo.sv
+else
+    $(error FIFO_MODEL must be beh or xpm (got "$(FIFO_MODEL)"))
+endif
+
+export FIFO_MODEL
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+FIFO depth sizing sweep for axis_fifo_xpm
+
+Runs `make sizing` in sim_axis_fifo (top_axis_fifo_sizing, test_fifo_sizing)
+once per DEPTH x FIFO_MEMORY_TYPE point under one producer burst profile and
+one consumer tready profile, and tabulates per point:
+
+    latency      min / mean / max cycles from write handshake to read handshake
+    peak occ     most beats inside the FIFO at once
+    prog_full    first cycle it was seen high and the cycles it stayed high
+    stalls       cycles the producer had a beat and s_axis_tready was low
+
+plus a block RAM / UltraRAM / LUTRAM estimate of the XPM memory. For every
+memory type the smallest depth with zero producer stalls is the recommended
+one.
+
+    python3 sim/fifo_sizing.py                                   # 16..1024, auto
+    python3 sim/fifo_sizing.py --producer burst:512:1536 --consumer markov:0.3:mean_stall=32
+    python3 sim/fifo_sizing.py --depths 64,128,256 --memory-types block,distributed,ultra
+
+Profiles use the specs of simlib.traffic.arrivals (producer) and
+simlib.backpressure.pattern_from_spec (consumer). PROG_FULL_THRESH follows
+the depth (--prog-full, fraction of DEPTH). With FIFO_MODEL=beh (no Vivado)
+the memory type does not change the simulation; it only selects the
+resource estimate. Output (default: fifo_sizing/):
+
+    fifo_sizing/<type>_<depth>/make.log      make output of the point
+    fifo_sizing/<type>_<depth>/report.json   measurements of the point
+    fifo_sizing/fifo_sizing.json             all points and the recommendations
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+from run_regression import REPO_ROOT
+
+
+FLOW = "sim_axis_fifo"
+MEMORY_TYPES = ("auto", "block", "distributed", "ultra")
+
+# xpm_fifo_axis stores tdata + tkeep + tlast + tuser per word (DATA_W=32, USER_W=1)
+WORD_BITS = 32 + 4 + 1 + 1
+# widest port of one primitive at its shallowest aspect ratio (depth, width)
+BRAM36_SHAPES = ((512, 72), (1024, 36), (2048, 18), (4096, 9), (8192, 4), (16384, 2), (32768, 1))
+URAM_SHAPE = (4096, 72)
+LUTRAM_BITS = 64        # one SLICEM LUT as 64x1 RAM
+
+
+def resources(depth, memory_type, width=WORD_BITS):
+    """Rough XPM memory cost of one FIFO: {'bram36', 'uram', 'lutram'} counts"""
+    if memory_type == "auto":
+        # Vivado's usual pick: LUTRAM for shallow FIFOs, block RAM otherwise
+        memory_type = "distributed" if depth * width <= 4096 else "block"
+    if memory_type == "block":
+        bram = min(math.ceil(depth / d) * math.ceil(width / w) for d, w in BRAM36_SHAPES)
+        return {"bram36": bram, "uram": 0, "lutram": 0}
+    if memory_type == "ultra":
+        d, w = URAM_SHAPE
+        return {"bram36": 0, "uram": math.ceil(depth / d) * math.ceil(width / w), "lutram": 0}
+    return {"bram36": 0, "uram": 0, "lutram": math.ceil(depth / LUTRAM_BITS) * width}
+
+
+def prog_full_thresh(depth, fraction):
+    """PROG_FULL_THRESH for a depth, kept inside xpm_fifo_axis' legal range"""
+    return max(5, min(depth - 5, round(depth * fraction)))
+
+
+def parse_depths(text):
+    depths = sorted({int(d) for d in text.split(",") if d})
+    for d in depths:
+        if d < 16 or d & (d - 1):
+            raise argparse.ArgumentTypeError(f"DEPTH {d} is not a power of two >= 16 (xpm_fifo_axis)")
+    return depths
+
+
+def run_point(depth, memory_type, args, out_dir):
+    """make sizing for one point; returns its report (or a failure record)"""
+    flow_dir = os.path.join(REPO_ROOT, FLOW)
+    work = os.path.join(out_dir, f"{memory_type}_{depth}")
+    os.makedirs(work, exist_ok=True)
+    report = os.path.join(work, "report.json")
+    if os.path.exists(report):
+        os.remove(report)
+    cmd = ["make", "sizing", f"SIM={args.sim}",
+           f"SIZING_DEPTH={depth}", f"SIZING_PROG_FULL={prog_full_thresh(depth, args.prog_full)}",
+           f"SIZING_MEMORY_TYPE={memory_type}", f"SIZING_PRODUCER={args.producer}",
+           f"SIZING_CONSUMER={args.consumer}", f"SIZING_CYCLES={args.cycles}",
+           f"SIZING_SEED={args.seed}", f"FIFO_REPORT={report}",
+           f"SIZING_BUILD={os.path.join(work, 'sim_build')}",
+           f"COCOTB_RESULTS_FILE={os.path.join(work, 'results.xml')}"] + list(args.make_arg)
+    env = dict(os.environ, PWD=flow_dir)
+
+    start = time.perf_counter()
+    with open(os.path.join(work, "make.log"), "w") as log:
+        log.write("$ " + " ".join(cmd) + "\n")
+        log.flush()
+        rc = subprocess.run(cmd, cwd=flow_dir, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+    elapsed = time.perf_counter() - start
+
+    if rc != 0 or not os.path.exists(report):
+        return {"depth": depth, "memory_type": memory_type, "ok": False, "rc": rc, "wall_s": elapsed}
+    with open(report) as f:
+        point = json.load(f)
+    point.update({"ok": True, "rc": rc, "wall_s": elapsed})
+    point.update(resources(depth, memory_type))
+    return point
+
+
+def recommend(points):
+    """{memory type: smallest passing depth with zero producer stalls (or None)}"""
+    best = {}
+    for p in sorted(points, key=lambda p: p["depth"]):
+        best.setdefault(p["memory_type"], None)
+        if p["ok"] and p["producer_stall_cycles"] == 0 and best[p["memory_type"]] is None:
+            best[p["memory_type"]] = p["depth"]
+    return best
+
+
+def _fmt(value, width):
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}}"
+
+
+def format_table(points):
+    best = recommend(points)
+    lines = [f"{'type':<12}{'depth':>6} {'pfull':>6}  {'lat min':>7} {'mean':>8} {'max':>6}  "
+             f"{'peak occ':>8}  {'pf first':>8} {'pf cyc':>7}  {'stalls':>7}  "
+             f"{'bram36':>6} {'uram':>4} {'lutram':>6}"]
+    for p in points:
+        if not p["ok"]:
+            lines.append(f"{p['memory_type']:<12}{p['depth']:>6}  FAIL (rc={p['rc']}, see make.log)")
+            continue
+        mark = "  <- recommended" if best.get(p["memory_type"]) == p["depth"] else ""
+        lines.append(f"{p['memory_type']:<12}{p['depth']:>6} {p['prog_full_thresh']:>6}  "
+                     f"{_fmt(p['latency_min'], 7)} {_fmt(p['latency_mean'], 8)} {_fmt(p['latency_max'], 6)}  "
+                     f"{p['peak_occupancy']:>8}  {_fmt(p['prog_full_first_cycle'], 8)} "
+                     f"{p['prog_full_cycles']:>7}  {p['producer_stall_cycles']:>7}  "
+                     f"{p['bram36']:>6} {p['uram']:>4} {p['lutram']:>6}{mark}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Sweep axis_fifo_xpm DEPTH / FIFO_MEMORY_TYPE "
+                                                 "under a producer and consumer profile")
+    parser.add_argument("--depths", type=parse_depths, default=parse_depths("16,32,64,128,256,512,1024"),
+                        help="comma-separated powers of two >= 16 (default: 16..1024)")
+    parser.add_argument("--memory-types", default="auto",
+                        help="comma-separated FIFO_MEMORY_TYPE values: " + ", ".join(MEMORY_TYPES)
+                             + " (default: %(default)s)")
+    parser.add_argument("--producer", default="burst:256:256",
+                        help="producer profile: full, burst:LEN:GAP, rate:P, frames:LEN:PERIOD "
+                             "(default: %(default)s)")
+    parser.add_argument("--consumer", default="duty:0.5:period=4",
+                        help="consumer tready: always or <kind>:<stall density>[:period=N|phase=N|mean_stall=N] "
+                             "(default: %(default)s)")
+    parser.add_argument("--cycles", type=int, default=20000, help="cycles per point (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the random profiles (default: %(default)s)")
+    parser.add_argument("--prog-full", type=float, default=0.75,
+                        help="PROG_FULL_THRESH as a fraction of DEPTH (default: %(default)s)")
+    parser.add_argument("--sim", default="icarus", help="simulator (default: %(default)s)")
+    parser.add_argument("-o", "--out", default=os.path.join(REPO_ROOT, "fifo_sizing"), help="output directory")
+    parser.add_argument("--make-arg", action="append", default=[], metavar="VAR=VALUE",
+                        help="extra make argument for every run (repeatable)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    memory_types = [t for t in args.memory_types.split(",") if t]
+    unknown = [t for t in memory_types if t not in MEMORY_TYPES]
+    if unknown:
+        print(f"unknown memory type(s): {', '.join(unknown)} (use {', '.join(MEMORY_TYPES)})")
+        return 1
+
+    out_dir = os.path.abspath(args.out)
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"producer {args.producer}, consumer {args.consumer}, {args.cycles} cycles on {args.sim}")
+    points = []
+    for memory_type in memory_types:
+        for depth in args.depths:
+            p = run_point(depth, memory_type, args, out_dir)
+            points.append(p)
+            status = (f"{p['producer_stall_cycles']} stall cycles, peak {p['peak_occupancy']}"
+                      if p["ok"] else "FAIL")
+            print(f"[{p['wall_s']:7.1f}s] {memory_type} / DEPTH={depth}: {status}", flush=True)
+
+    best = recommend(points)
+    report = os.path.join(out_dir, "fifo_sizing.json")
+    with open(report, "w") as f:
+        json.dump({"producer": args.producer, "consumer": args.consumer, "cycles": args.cycles,
+                   "seed": args.seed, "sim": args.sim, "recommended": best, "points": points}, f, indent=1)
+        f.write("\n")
+
+    print()
+    print(format_table(points))
+    print()
+    print("smallest depth without producer stalls:")
+    for memory_type in memory_types:
+        depth = best.get(memory_type)
+        print(f"  {memory_type}: " + (str(depth) if depth else f"none up to {args.depths[-1]}"))
+    print(f"measurements: {report}")
+    return 0 if all(p["ok"] for p in points) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Store-and-forward vs cut-through sweep of the FIFO example pipeline
+
+Runs test_fifo_example_throughput in sim_fifo_example once per
+PACKET_FIFO (false = cut-through, true = store-and-forward) x FRAME_BEATS x
+sink tready profile, with the source paced by SRC_BEAT_GAP so that it is
+slower than the sink, and tabulates per point:
+
+    first beat   first beat in -> first beat out of a frame (cycles, mean / max)
+    frame        first beat in -> last beat out of a frame (cycles, mean / max)
+    bubbles      cycles per frame the sink was ready in the middle of a frame
+                 with nothing to take (axis_sink_checker bubble_cycles)
+    rate         sink beats/cycle
+
+Each cut-through row is followed by the store-and-forward row of the same
+frame length and profile, with the latency it adds.
+
+    python3 sim/packet_fifo_sweep.py                                 # 8,64,256 beats, 4 profiles
+    python3 sim/packet_fifo_sweep.py --frame-beats 16,128 --sinks always,lfsr:64 --src-gap 3
+    python3 sim/packet_fifo_sweep.py --sim icarus --cycles 50000
+
+Sink profiles map to the SINK_* make variables of sim_fifo_example:
+
+    always              always ready
+    duty:PERIOD:STALL   STALL of every PERIOD cycles not ready
+    lfsr:THRESH         not ready with probability THRESH/256
+    burst:BEATS:STALL   STALL cycles not ready after every BEATS beats
+
+PACKET_FIFO and FRAME_BEATS are parameters, so every (mode, frame length)
+gets its own build; profiles and the gap are plusargs and reuse it. Output
+(default: packet_fifo/):
+
+    packet_fifo/<mode>_<beats>/<profile>/make.log      make output of the point
+    packet_fifo/<mode>_<beats>/<profile>/report.json   FIFO_REPORT of the point
+    packet_fifo/packet_fifo.json                       all points
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from run_regression import REPO_ROOT
+
+
+FLOW = "sim_fifo_example"
+MODES = ("false", "true")
+MAX_FRAME_BEATS = 1024      # store-and-forward needs the whole frame in the FIFO (DEPTH)
+
+# profile kind -> (SINK_READY, knob variables of its fields)
+SINK_KINDS = {
+    "always": ("always", ()),
+    "duty": ("duty", ("SINK_DUTY_PERIOD", "SINK_DUTY_STALL")),
+    "lfsr": ("lfsr", ("SINK_STALL_THRESH",)),
+    "burst": ("burst", ("SINK_BURST_BEATS", "SINK_BURST_STALL")),
+}
+
+
+def sink_make_args(spec):
+    """make arguments of a sink profile spec, e.g. "duty:4:2" """
+    kind, *fields = spec.split(":")
+    if kind not in SINK_KINDS:
+        raise argparse.ArgumentTypeError(f"unknown sink profile {spec!r} (use {', '.join(SINK_KINDS)})")
+    ready, knobs = SINK_KINDS[kind]
+    if len(fields) != len(knobs) or not all(f.isdigit() for f in fields):
+        raise argparse.ArgumentTypeError(f"sink profile {spec!r} needs {len(knobs)} integer field(s)")
+    return [f"SINK_READY={ready}"] + [f"{k}={v}" for k, v in zip(knobs, fields)]
+
+
+def parse_sinks(text):
+    sinks = [s for s in text.split(",") if s]
+    for spec in sinks:
+        sink_make_args(spec)
+    return sinks
+
+
+def parse_frame_beats(text):
+    beats = sorted({int(b) for b in text.split(",") if b})
+    for b in beats:
+        if not 1 < b <= MAX_FRAME_BEATS:
+            raise argparse.ArgumentTypeError(f"FRAME_BEATS {b} outside 2..{MAX_FRAME_BEATS}")
+    return beats
+
+
+def run_point(mode, frame_beats, sink, args, out_dir):
+    """One test_fifo_example_throughput run; returns its report (or a failure record)"""
+    flow_dir = os.path.join(REPO_ROOT, FLOW)
+    build = os.path.join(out_dir, f"{mode}_{frame_beats}")
+    work = os.path.join(build, sink.replace(":", "_"))
+    os.makedirs(work, exist_ok=True)
+    report = os.path.join(work, "report.json")
+    if os.path.exists(report):
+        os.remove(report)
+    cmd = ["make", f"SIM={args.sim}", "TESTCASE=test_fifo_example_throughput",
+           f"PACKET_FIFO={mode}", f"FRAME_BEATS={frame_beats}", f"SRC_BEAT_GAP={args.src_gap}",
+           f"FIFO_EXAMPLE_CYCLES={args.cycles}", f"FIFO_REPORT={report}",
+           f"SIM_BUILD={os.path.join(build, 'sim_build')}",
+           f"COCOTB_RESULTS_FILE={os.path.join(work, 'results.xml')}"] + sink_make_args(sink) + list(args.make_arg)
+    env = dict(os.environ, PWD=flow_dir)
+
+    start = time.perf_counter()
+    with open(os.path.join(work, "make.log"), "w") as log:
+        log.write("$ " + " ".join(cmd) + "\n")
+        log.flush()
+        rc = subprocess.run(cmd, cwd=flow_dir, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+    elapsed = time.perf_counter() - start
+
+    point = {"packet_fifo": mode, "frame_beats": frame_beats, "sink": sink}
+    if rc != 0 or not os.path.exists(report):
+        point.update({"ok": False, "rc": rc, "wall_s": elapsed})
+        return point
+    with open(report) as f:
+        point.update(json.load(f))
+    point.update({"ok": True, "rc": rc, "wall_s": elapsed, "sink": sink})
+    return point
+
+
+def _fmt(value, width, spec=""):
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}{spec}}"
+
+
+def format_table(points):
+    by_key = {(p["packet_fifo"], p["frame_beats"], p["sink"]): p for p in points}
+    lines = [f"{'mode':<7}{'beats':>6}  {'sink':<14}{'1st mean':>9} {'max':>6}  {'frame mean':>10} {'max':>6}  "
+             f"{'bubbles/fr':>10}  {'rate':>6}  {'+1st':>7} {'+frame':>7}"]
+    for p in points:
+        mode = "s&f" if p["packet_fifo"] == "true" else "cut"
+        if not p["ok"]:
+            lines.append(f"{mode:<7}{p['frame_beats']:>6}  {p['sink']:<14}FAIL (rc={p['rc']}, see make.log)")
+            continue
+        first, frame = p["first_beat_latency"], p["frame_latency"]
+        delta = ""
+        cut = by_key.get(("false", p["frame_beats"], p["sink"]))
+        if p["packet_fifo"] == "true" and cut and cut["ok"] and None not in (first["mean"], cut["first_beat_latency"]["mean"]):
+            delta = (f"  {first['mean'] - cut['first_beat_latency']['mean']:>+7.1f} "
+                     f"{frame['mean'] - cut['frame_latency']['mean']:>+7.1f}")
+        lines.append(f"{mode:<7}{p['frame_beats']:>6}  {p['sink']:<14}{_fmt(first['mean'], 9)} {_fmt(first['max'], 6)}  "
+                     f"{_fmt(frame['mean'], 10)} {_fmt(frame['max'], 6)}  "
+                     f"{p['bubbles_per_frame']:>10}  {p['sink_beats_per_cycle']:>6.3f}{delta}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Compare store-and-forward and cut-through axis_fifo_xpm "
+                                                 "in the FIFO example pipeline")
+    parser.add_argument("--frame-beats", type=parse_frame_beats, default=parse_frame_beats("8,64,256"),
+                        help="comma-separated frame lengths (default: 8,64,256)")
+    parser.add_argument("--sinks", type=parse_sinks, default=parse_sinks("always,duty:4:1,lfsr:64,burst:64:32"),
+                        help="comma-separated sink profiles: always, duty:PERIOD:STALL, lfsr:THRESH, "
+                             "burst:BEATS:STALL (default: always,duty:4:1,lfsr:64,burst:64:32)")
+    parser.add_argument("--src-gap", type=int, default=1,
+                        help="idle source cycles after every beat, SRC_BEAT_GAP (default: %(default)s)")
+    parser.add_argument("--cycles", type=int, default=20000, help="cycles per point (default: %(default)s)")
+    parser.add_argument("--sim", default="verilator", help="simulator (default: %(default)s)")
+    parser.add_argument("-o", "--out", default=os.path.join(REPO_ROOT, "packet_fifo"), help="output directory")
+    parser.add_argument("--make-arg", action="append", default=[], metavar="VAR=VALUE",
+                        help="extra make argument for every run (repeatable)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    out_dir = os.path.abspath(args.out)
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"SRC_BEAT_GAP={args.src_gap}, sinks {', '.join(args.sinks)}, {args.cycles} cycles on {args.sim}")
+    points = []
+    for frame_beats in args.frame_beats:
+        for sink in args.sinks:
+            for mode in MODES:
+                p = run_point(mode, frame_beats, sink, args, out_dir)
+                points.append(p)
+                status = (f"{p['sink_counters']['bubble_cycles']} bubble cycles, "
+                          f"frame latency {p['frame_latency']['mean']}" if p["ok"] else "FAIL")
+                print(f"[{p['wall_s']:7.1f}s] PACKET_FIFO={mode} FRAME_BEATS={frame_beats} {sink}: {status}",
+                      flush=True)
+
+    report = os.path.join(out_dir, "packet_fifo.json")
+    with open(report, "w") as f:
+        json.dump({"src_beat_gap": args.src_gap, "cycles": args.cycles, "sim": args.sim, "points": points},
+                  f, indent=1)
+        f.write("\n")
+
+    print()
+    print(format_table(points))
+    print()
+    print("cut = cut-through, s&f = store-and-forward (+1st/+frame: mean latency added over cut-through)")
+    print(f"measurements: {report}")
+    return 0 if all(p["ok"] for p in points) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Cross-simulator performance matrix for the cocotb flows
+
+Runs every flow (same discovery as run_regression.py) once per simulator
+that is installed here and has a cocotb makefile. Each run is a clean build
+(fresh SIM_BUILD, compile cache off) and is split into three phases:
+
+    compile   make start -> simulator elaboration starts
+    elab      elaboration / model build / design load -> cocotb starts
+    run       cocotb start -> simulator exit
+
+Phase boundaries are the arrival times of marker lines in the make output
+(the echoed run command, Questa's "# vsim" transcript line, cocotb's first
+log line). Icarus compiles and elaborates in one iverilog call, so its elab
+phase is only the vvp design load. Peak RSS is ru_maxrss of the make process
+tree from os.wait4, which in practice is the simulator.
+
+    python3 sim/perf_matrix.py                         # all flows x installed simulators
+    python3 sim/perf_matrix.py --sims icarus,verilator sim_dataover
+    python3 sim/perf_matrix.py --list                  # simulators found / skipped
+
+Simulators that are not installed are skipped with a note, so the matrix
+also runs on a machine with only Icarus. Runs execute one at a time so the
+timings do not disturb each other. Output (default: perf_matrix/):
+
+    perf_matrix/<flow>/<sim>/make.log       make output, lines prefixed with seconds since start
+    perf_matrix/perf_matrix.json            all measurements
+
+The JSON feeds `run_regression.py --sim-from perf_matrix/perf_matrix.json`,
+which runs every flow on its fastest passing simulator.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from run_regression import REPO_ROOT, discover_flows, flow_tag
+
+
+# tools that must be on PATH for each cocotb SIM value
+SIMULATORS = {
+    "icarus": ("iverilog", "vvp"),
+    "verilator": ("verilator",),
+    "questa": ("vlog", "vsim"),
+    "xsim": ("xvlog", "xelab", "xsim"),
+}
+
+# first output line of the elaboration phase, per simulator
+ELAB_MARKERS = {
+    "icarus": re.compile(r"/vvp\s"),
+    "verilator": re.compile(r"\bmake\b.*-f Vtop\.mk"),
+    "questa": re.compile(r"^#\s+vsim\s"),
+}
+# first cocotb log line: the design is loaded and Python is running
+RUN_MARKER = re.compile(r"^\s*-\.--ns\s+\w+\s+gpi|cocotb\.regression|Running on ")
+
+
+def cocotb_simulators():
+    """SIM values cocotb has a makefile for"""
+    try:
+        out = subprocess.run(["cocotb-config", "--makefiles"], stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return set()
+    directory = os.path.join(out.stdout.decode().strip(), "simulators")
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return set()
+    return {n[len("Makefile."):] for n in names if n.startswith("Makefile.")}
+
+
+def available_simulators(wanted=None):
+    """(usable, skipped) where skipped maps simulator -> reason"""
+    supported = cocotb_simulators()
+    usable, skipped = [], {}
+    for sim in wanted or SIMULATORS:
+        tools = SIMULATORS.get(sim, (sim,))
+        missing = [t for t in tools if shutil.which(t) is None]
+        if missing:
+            skipped[sim] = "not installed (" + ", ".join(missing) + ")"
+        elif sim not in supported:
+            skipped[sim] = "no cocotb makefile"
+        else:
+            usable.append(sim)
+    return usable, skipped
+
+
+def split_phases(events, sim, end):
+    """Phase durations from [(t, line)] output events and the end time"""
+    elab_at = run_at = None
+    marker = ELAB_MARKERS.get(sim)
+    for t, line in events:
+        if elab_at is None and marker is not None and marker.search(line):
+            elab_at = t
+        if run_at is None and RUN_MARKER.search(line):
+            run_at = t
+            break
+    if run_at is None:
+        # never reached cocotb: everything counts as compile
+        return {"compile": end, "elab": None, "run": None}
+    if elab_at is None or elab_at > run_at:
+        elab_at = run_at
+    return {"compile": elab_at, "elab": run_at - elab_at, "run": end - run_at}
+
+
+def run_point(flow, sim, out_dir, make_args=()):
+    """Clean build + run of one flow on one simulator"""
+    flow_dir = os.path.join(REPO_ROOT, flow)
+    work = os.path.join(out_dir, flow_tag(flow), sim)
+    shutil.rmtree(work, ignore_errors=True)
+    os.makedirs(work)
+    results = os.path.join(work, "results.xml")
+    cmd = ["make", "sim", f"SIM={sim}",
+           f"SIM_BUILD={os.path.join(work, 'sim_build')}",
+           f"COCOTB_RESULTS_FILE={results}", "SIM_CACHE=0"] + list(make_args)
+    env = dict(os.environ, PWD=flow_dir)
+
+    events = []
+    start = time.perf_counter()
+    with open(os.path.join(work, "make.log"), "w") as log:
+        log.write("$ " + " ".join(cmd) + "\n")
+        proc = subprocess.Popen(cmd, cwd=flow_dir, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, errors="replace")
+        for line in proc.stdout:
+            t = time.perf_counter() - start
+            events.append((t, line))
+            log.write(f"[{t:9.3f}] {line}")
+        proc.stdout.close()
+        # wait4 instead of wait(): the rusage covers the waited-for process tree
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    end = time.perf_counter() - start
+
+    tests = failures = 0
+    if os.path.exists(results):
+        for tc in ET.parse(results).getroot().iter("testcase"):
+            tests += 1
+            failures += tc.find("failure") is not None or tc.find("error") is not None
+    ok = proc.returncode == 0 and tests > 0 and failures == 0
+
+    point = {"flow": flow, "sim": sim, "rc": proc.returncode, "ok": ok,
+             "tests": tests, "failures": failures, "total_s": end,
+             "peak_rss_mb": usage.ru_maxrss / 1024}
+    point.update({f"{p}_s": v for p, v in split_phases(events, sim, end).items()})
+    return point
+
+
+def fastest(points):
+    """{flow: fastest passing point} by total time"""
+    best = {}
+    for p in points:
+        if p["ok"] and (p["flow"] not in best or p["total_s"] < best[p["flow"]]["total_s"]):
+            best[p["flow"]] = p
+    return best
+
+
+def _fmt(value, width=8):
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}.2f}"
+
+
+def format_matrix(points):
+    width = max([len(p["flow"]) for p in points] + [4])
+    best = fastest(points)
+    lines = [f"{'flow':<{width}}  {'sim':<9} {'compile':>8} {'elab':>8} {'run':>8} "
+             f"{'total':>8} {'rss MB':>7}  status"]
+    for p in points:
+        status = "ok" if p["ok"] else f"FAIL (rc={p['rc']}, {p['failures']}/{p['tests']} failed)"
+        if best.get(p["flow"]) is p:
+            status += "  <- fastest"
+        lines.append(f"{p['flow']:<{width}}  {p['sim']:<9} {_fmt(p['compile_s'])} "
+                     f"{_fmt(p['elab_s'])} {_fmt(p['run_s'])} {p['total_s']:>8.2f} "
+                     f"{p['peak_rss_mb']:>7.0f}  {status}")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Time every cocotb flow on every installed simulator")
+    parser.add_argument("flows", nargs="*", help="flow directories (default: all discovered)")
+    parser.add_argument("--sims", default=",".join(SIMULATORS),
+                        help="comma-separated simulators to try (default: %(default)s)")
+    parser.add_argument("-o", "--out", default=os.path.join(REPO_ROOT, "perf_matrix"), help="output directory")
+    parser.add_argument("--make-arg", action="append", default=[], metavar="VAR=VALUE",
+                        help="extra make argument for every run (repeatable)")
+    parser.add_argument("--list", action="store_true", help="show usable and skipped simulators and exit")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sims, skipped = available_simulators([s for s in args.sims.split(",") if s])
+    for sim, reason in skipped.items():
+        print(f"skipping {sim}: {reason}")
+    if args.list:
+        print("usable: " + (", ".join(sims) or "none"))
+        return 0
+    if not sims:
+        print("no usable simulator found")
+        return 1
+
+    flows = [os.path.normpath(f) for f in args.flows] or discover_flows()
+    os.makedirs(args.out, exist_ok=True)
+    points = []
+    for flow in flows:
+        for sim in sims:
+            p = run_point(flow, sim, os.path.abspath(args.out), args.make_arg)
+            points.append(p)
+            print(f"[{p['total_s']:7.1f}s] {flow} / {sim}: {'ok' if p['ok'] else 'FAIL'}", flush=True)
+
+    report = os.path.join(args.out, "perf_matrix.json")
+    with open(report, "w") as f:
+        json.dump({"sims": sims, "skipped": skipped, "points": points}, f, indent=1)
+        f.write("\n")
+
+    print()
+    print(format_matrix(points))
+    best = fastest(points)
+    print()
+    print("fastest simulator per flow:")
+    for flow in flows:
+        print(f"  {flow}: {best[flow]['sim'] if flow in best else 'none passed'}")
+    print(f"measurements: {report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
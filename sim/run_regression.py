@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Parallel regression runner for the cocotb flows in this repository
+
+Finds every directory whose Makefile includes the cocotb makefiles (a/sim,
+sim_dataover, sim_two_dataover, ...) and runs `make` in each of them from a
+process pool. Every flow gets its own SIM_BUILD and COCOTB_RESULTS_FILE under
+the output directory, so flows never share build products, and the JUnit
+results are merged into one report:
+
+    python3 sim/run_regression.py                    # all flows, each flow's default SIM
+    python3 sim/run_regression.py --sim icarus -j 8
+    python3 sim/run_regression.py sim_dataover sim_two_dataover
+    python3 sim/run_regression.py --list
+    python3 sim/run_regression.py --shards 4 sim_axis_master_file
+    python3 sim/run_regression.py --sim-from perf_matrix/perf_matrix.json
+
+Output (default: regression/ at the repository root):
+
+    regression/<flow>/sim_build/     isolated build directory
+    regression/<flow>/results.xml    cocotb results of the flow
+    regression/<flow>/make.log       full make output
+    regression/results.xml           merged report, one <testsuite> per flow
+
+--shards N additionally splits the tests of each flow's MODULE across up to N
+simulator processes (TESTCASE=a,b,... per shard, found with ast). cocotb runs
+every test named in TESTCASE even if it has skip=..., so tests with a skip=
+argument are left out of the shards; they run only in unsharded runs, where
+their condition applies. Shards are balanced on the test times of the previous merged report when there is one,
+run concurrently in regression/<flow>/shard<i>/, and merged back into the
+flow's single <testsuite> under the original test names.
+
+--sim-from takes the JSON written by perf_matrix.py and runs each flow on
+its fastest passing simulator (flows it does not cover fall back to --sim).
+
+The exit status is non-zero if any flow fails to build or any test fails.
+"""
+
+import argparse
+import ast
+import concurrent.futures
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKIP_DIRS = {".git", "sim_build", "__pycache__", "regression", "vivado"}
+
+
+def discover_flows(root=REPO_ROOT):
+    """Return the repo-relative directories whose Makefile includes cocotb (sorted)"""
+    flows = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+        if "Makefile" not in filenames:
+            continue
+        with open(os.path.join(dirpath, "Makefile"), errors="replace") as f:
+            if "cocotb-config" in f.read():
+                flows.append(os.path.relpath(dirpath, root))
+    return sorted(flows)
+
+
+def flow_tag(flow):
+    """Flow directory -> file-system friendly name (a/sim -> a_sim)"""
+    return flow.replace(os.sep, "_").replace("/", "_")
+
+
+def flow_modules(flow):
+    """Python test modules named by MODULE in the flow's Makefile"""
+    with open(os.path.join(REPO_ROOT, flow, "Makefile"), errors="replace") as f:
+        for line in f:
+            m = re.match(r"\s*MODULE\s*[:?]?=\s*(\S+)", line)
+            if m:
+                return [mod for mod in m.group(1).split(",") if mod]
+    return []
+
+
+def _is_cocotb_test(decorator):
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr == "test" and isinstance(decorator.value, ast.Name) and decorator.value.id == "cocotb"
+    return isinstance(decorator, ast.Name) and decorator.id == "test"
+
+
+def _has_skip(decorator):
+    """skip=<anything but a literal False> in a @cocotb.test(...) call"""
+    if not isinstance(decorator, ast.Call):
+        return False
+    return any(kw.arg == "skip" and not (isinstance(kw.value, ast.Constant) and kw.value.value is False)
+               for kw in decorator.keywords)
+
+
+def discover_tests(flow):
+    """@cocotb.test() function names of the flow, in file order
+
+    Returns [] when the tests cannot be listed statically (missing module,
+    TestFactory-generated tests); such flows are run unsharded. Tests with a
+    skip= argument are not listed: naming them in TESTCASE would force them
+    to run.
+    """
+    names = []
+    for module in flow_modules(flow):
+        path = os.path.join(REPO_ROOT, flow, module.replace(".", os.sep) + ".py")
+        try:
+            with open(path) as f:
+                source = f.read()
+        except OSError:
+            return []
+        if "TestFactory" in source:
+            return []
+        for node in ast.parse(source, path).body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            decorators = [d for d in node.decorator_list if _is_cocotb_test(d)]
+            if decorators and not any(_has_skip(d) for d in decorators):
+                names.append(node.name)
+    return names
+
+
+def split_tests(tests, n, weights=None):
+    """Split tests into at most n shards, longest first onto the least loaded shard"""
+    weights = weights or {}
+    default = sum(weights.values()) / len(weights) if weights else 1.0
+    order = {t: i for i, t in enumerate(tests)}
+    shards = [[] for _ in range(min(n, len(tests)))]
+    loads = [0.0] * len(shards)
+    for test in sorted(tests, key=lambda t: -weights.get(t, default)):
+        i = loads.index(min(loads))
+        shards[i].append(test)
+        loads[i] += weights.get(test, default)
+    return [sorted(shard, key=order.get) for shard in shards if shard]
+
+
+def previous_times(report):
+    """{flow: {test: seconds}} from an earlier merged report (empty if none)"""
+    times = {}
+    try:
+        root = ET.parse(report).getroot()
+    except (OSError, ET.ParseError):
+        return times
+    for suite in root.iter("testsuite"):
+        flow = suite.get("package") or suite.get("name")
+        for tc in suite.iter("testcase"):
+            try:
+                times.setdefault(flow, {})[tc.get("name")] = float(tc.get("time", "0"))
+            except ValueError:
+                pass
+    return times
+
+
+def load_sim_map(path):
+    """{flow: fastest passing simulator} from a perf_matrix.py report"""
+    from perf_matrix import fastest
+    with open(path) as f:
+        points = json.load(f)["points"]
+    return {flow: p["sim"] for flow, p in fastest(points).items()}
+
+
+def run_flow(job):
+    """Run one flow in its own build directory (executed in a worker process)
+
+    job: dict(flow, out_dir, sim, make_args, target, extra_env, name, private_modelsim_ini)
+    Returns a dict with the flow, the make return code, wall time and paths.
+    """
+    flow_dir = os.path.join(REPO_ROOT, job["flow"])
+    work = job["out_dir"]
+    os.makedirs(work, exist_ok=True)
+    results = os.path.join(work, "results.xml")
+    log_path = os.path.join(work, "make.log")
+    if os.path.exists(results):
+        os.remove(results)
+
+    cmd = ["make", job.get("target") or "sim",
+           f"SIM_BUILD={os.path.join(work, 'sim_build')}",
+           f"COCOTB_RESULTS_FILE={results}"]
+    if job.get("sim"):
+        cmd.append(f"SIM={job['sim']}")
+    cmd += job.get("make_args", [])
+
+    env = dict(os.environ)
+    # The Makefiles use $(PWD), which make takes from the environment
+    env["PWD"] = flow_dir
+    env.update(job.get("extra_env", {}))
+    if job.get("private_modelsim_ini"):
+        # shards of one flow share its directory; give Questa's vmap its own ini
+        ini = os.path.join(flow_dir, "modelsim.ini")
+        if os.path.exists(ini):
+            shutil.copyfile(ini, os.path.join(work, "modelsim.ini"))
+            env["MODELSIM"] = os.path.join(work, "modelsim.ini")
+
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        log.write("$ " + " ".join(cmd) + "\n")
+        log.flush()
+        rc = subprocess.call(cmd, cwd=flow_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    wall = time.perf_counter() - start
+
+    return {"flow": job["flow"], "name": job.get("name", job["flow"]), "rc": rc, "wall": wall,
+            "results": results, "log": log_path}
+
+
+def _log_tail(path, lines=40):
+    try:
+        with open(path, errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+def merge_results(runs, path):
+    """Merge the per-run results.xml files into one JUnit report
+
+    Runs of the same flow (shards) are merged into one <testsuite> whose time
+    is the slowest shard. Returns (flows, tests, failures), where flows is a
+    list of per-flow summary dicts. A run that produced no results file (build
+    error, crash) or failed without a failing testcase is reported as a failed
+    'make' testcase carrying the tail of its log.
+    """
+    root = ET.Element("testsuites", name="regression")
+    groups = {}
+    for run in runs:
+        groups.setdefault(run["flow"], []).append(run)
+
+    flows = []
+    for flow in sorted(groups):
+        shard_runs = sorted(groups[flow], key=lambda r: r["name"])
+        wall = max(r["wall"] for r in shard_runs)
+        suite = ET.SubElement(root, "testsuite", name=flow, package=flow)
+        props = ET.SubElement(suite, "properties")
+        ET.SubElement(props, "property", name="wall_time_s", value=f"{wall:.3f}")
+
+        testcases = []
+        for run in shard_runs:
+            prefix = "" if len(shard_runs) == 1 else run["name"][len(flow):] + " "
+            ET.SubElement(props, "property", name=f"{prefix}make_rc".strip(), value=str(run["rc"]))
+            if len(shard_runs) > 1:
+                ET.SubElement(props, "property", name=f"{prefix}wall_time_s".strip(), value=f"{run['wall']:.3f}")
+            found = []
+            if os.path.exists(run["results"]):
+                found = list(ET.parse(run["results"]).getroot().iter("testcase"))
+            if not found or (run["rc"] != 0 and not any(_failed(tc) for tc in found)):
+                name = "make" if len(shard_runs) == 1 else "make" + run["name"][len(flow):]
+                tc = ET.Element("testcase", name=name, classname=flow, time=f"{run['wall']:.3f}")
+                ET.SubElement(tc, "failure", message=f"make exited with {run['rc']}").text = _log_tail(run["log"])
+                found.append(tc)
+            testcases += found
+
+        failures = sum(_failed(tc) for tc in testcases)
+        for tc in testcases:
+            suite.append(tc)
+        suite.set("tests", str(len(testcases)))
+        suite.set("failures", str(failures))
+        suite.set("time", f"{wall:.3f}")
+        flows.append({"name": flow, "shards": len(shard_runs), "tests": len(testcases),
+                      "failures": failures, "wall": wall, "cpu": sum(r["wall"] for r in shard_runs)})
+
+    total_tests = sum(f["tests"] for f in flows)
+    total_failures = sum(f["failures"] for f in flows)
+    root.set("tests", str(total_tests))
+    root.set("failures", str(total_failures))
+    ET.indent(root)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+    return flows, total_tests, total_failures
+
+
+def _failed(testcase):
+    return testcase.find("failure") is not None or testcase.find("error") is not None
+
+
+def print_summary(flows, wall, out=sys.stdout):
+    width = max([len(f["name"]) for f in flows] + [4])
+    out.write(f"{'flow':<{width}}  {'shards':>6}  {'tests':>5}  {'fail':>4}  {'wall [s]':>8}\n")
+    for f in sorted(flows, key=lambda f: -f["wall"]):
+        out.write(f"{f['name']:<{width}}  {f['shards']:>6}  {f['tests']:>5}  {f['failures']:>4}  {f['wall']:>8.1f}\n")
+    serial = sum(f["cpu"] for f in flows)
+    out.write(f"total wall {wall:.1f} s (sum of runs {serial:.1f} s)\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run all cocotb flows in parallel and merge their results")
+    parser.add_argument("flows", nargs="*", help="flow directories to run (default: all discovered)")
+    parser.add_argument("--sim", help="SIM passed to every flow (default: each Makefile's own)")
+    parser.add_argument("--sim-from", metavar="JSON",
+                        help="per-flow SIM: fastest passing simulator in a perf_matrix.py report")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel flows (default: CPU count)")
+    parser.add_argument("-o", "--out", default=os.path.join(REPO_ROOT, "regression"), help="output directory")
+    parser.add_argument("--make-arg", action="append", default=[], metavar="VAR=VALUE",
+                        help="extra make argument for every flow (repeatable)")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="split each flow's tests across up to N simulator processes")
+    parser.add_argument("--list", action="store_true", help="list discovered flows (and their tests) and exit")
+    return parser
+
+
+def make_jobs(args, flows, times=None, sim_map=None):
+    times = times or {}
+    sim_map = sim_map or {}
+    jobs = []
+    for flow in flows:
+        out_dir = os.path.join(os.path.abspath(args.out), flow_tag(flow))
+        base = {"flow": flow, "sim": sim_map.get(flow, args.sim), "make_args": list(args.make_arg)}
+        tests = discover_tests(flow) if args.shards > 1 else []
+        if len(tests) < 2:
+            jobs.append(dict(base, out_dir=out_dir))
+            continue
+        shards = split_tests(tests, args.shards, times.get(flow))
+        for i, shard in enumerate(shards, 1):
+            jobs.append(dict(base, name=f"{flow}[{i}/{len(shards)}]",
+                             out_dir=os.path.join(out_dir, f"shard{i}"),
+                             make_args=base["make_args"] + ["TESTCASE=" + ",".join(shard)],
+                             private_modelsim_ini=True))
+    return jobs
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    flows = [os.path.normpath(f) for f in args.flows] or discover_flows()
+    if args.list:
+        for flow in flows:
+            print(flow)
+            for test in discover_tests(flow):
+                print(f"    {test}")
+        return 0
+
+    report = os.path.join(args.out, "results.xml")
+    sim_map = load_sim_map(args.sim_from) if args.sim_from else None
+    jobs = make_jobs(args, flows, previous_times(report), sim_map)
+    os.makedirs(args.out, exist_ok=True)
+    start = time.perf_counter()
+    runs = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for future in concurrent.futures.as_completed([pool.submit(run_flow, job) for job in jobs]):
+            run = future.result()
+            runs.append(run)
+            status = "ok" if run["rc"] == 0 else f"make rc={run['rc']}"
+            print(f"[{run['wall']:7.1f}s] {run['name']}: {status}", flush=True)
+    wall = time.perf_counter() - start
+
+    summary, _, failures = merge_results(runs, report)
+    print_summary(summary, wall)
+    print(f"merged report: {report}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
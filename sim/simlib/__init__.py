@@ -0,0 +1,7 @@
+"""
+Shared cocotb testbench helpers for the sim_* flows.
+
+Flows pick this package up through PYTHONPATH (see each flow's Makefile):
+
+    export PYTHONPATH := $(PWD)/../sim:$(PWD):$(PYTHONPATH)
+"""
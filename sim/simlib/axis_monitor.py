@@ -0,0 +1,154 @@
+"""
+Low-overhead AXI4-Stream handshake monitor
+
+The monitor samples the bus once per wakeup in ReadOnly and only wakes when
+something can happen:
+  - tvalid low            -> sleep until the next tvalid rising edge
+  - tvalid high, tready low -> sleep until the next tready rising edge
+  - tvalid & tready        -> record the beat, wait for the next clock edge
+
+Values are read through the GPI as raw integers (no BinaryValue/str round
+trip) and masked to the signal width, so they are always unsigned. X/Z bits
+read as 0, which matches how the RTL treats them in 2-state logic. wakeups/beats are published so the saving can be measured against the
+per-clock monitor.
+
+AxisProbe is that per-clock monitor kept as a measurement tool: it wakes on
+every edge and counts stall (tvalid & !tready) and starve (tready & !tvalid)
+cycles next to the beats, and stamps every beat with its clock cycle, which
+the throughput/latency reports need.
+"""
+
+from cocotb.triggers import ReadOnly, RisingEdge
+
+
+_XZ_TO_0 = str.maketrans("xXzZuUwW-", "000000000")
+
+
+def read_int(handle):
+    """Unsigned integer value of a signal (X/Z -> 0)
+
+    Up to 32 bits this is the GPI vpiIntVal, which is a signed 32-bit value,
+    masked to the signal width. Wider signals go through the binary string.
+    """
+    width = len(handle)
+    if width > 32:
+        return int(handle._handle.get_signal_val_binstr().translate(_XZ_TO_0), 2)
+    return handle._handle.get_signal_val_long() & ((1 << width) - 1)
+
+
+def to_signed(value, width=32):
+    """Two's-complement conversion of a width-bit raw value"""
+    value &= (1 << width) - 1
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+class AxisHandshakeMonitor:
+    """Report every accepted beat as (tdata, tlast) to a callback"""
+
+    def __init__(self, clock, tvalid, tready, tdata, tlast=None, callback=None, signed=False, width=32):
+        self.clock = clock
+        self.tvalid = tvalid
+        self.tready = tready
+        self.tdata = tdata
+        self.tlast = tlast
+        self.callback = callback
+        self.signed = signed
+        self.width = width
+        self.wakeups = 0
+        self.beats = 0
+
+    @property
+    def wakeups_per_beat(self):
+        return self.wakeups / self.beats if self.beats else float(self.wakeups)
+
+    def reset_counters(self):
+        self.wakeups = 0
+        self.beats = 0
+
+    async def run(self):
+        clock_edge = RisingEdge(self.clock)
+        valid_edge = RisingEdge(self.tvalid)
+        ready_edge = RisingEdge(self.tready)
+        read_only = ReadOnly()
+        mask = (1 << self.width) - 1
+
+        while True:
+            await read_only
+            self.wakeups += 1
+
+            if not read_int(self.tvalid):
+                await valid_edge
+                continue
+            if not read_int(self.tready):
+                await ready_edge
+                continue
+
+            # valid & ready are stable until the next edge -> the beat is accepted there
+            data = read_int(self.tdata) & mask
+            if self.signed:
+                data = to_signed(data, self.width)
+            tlast = read_int(self.tlast) & 1 if self.tlast is not None else 0
+            self.beats += 1
+            if self.callback is not None:
+                self.callback((data, tlast))
+            await clock_edge
+
+
+class AxisProbe:
+    """Per-clock AXI4-Stream sampler: cycle-stamped beats plus stall/starve counters
+
+    Cycle n is the n-th rising edge seen since run() started; the bus is read
+    in ReadOnly after it, i.e. the values the following edge will consume.
+    callback((cycle, tdata, tlast)) is called for every handshake.
+    """
+
+    def __init__(self, clock, tvalid, tready, tdata, tlast=None, callback=None, width=32):
+        self.clock = clock
+        self.tvalid = tvalid
+        self.tready = tready
+        self.tdata = tdata
+        self.tlast = tlast
+        self.callback = callback
+        self.width = width
+        self.cycle = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.cycles = 0
+        self.beats = 0
+        self.stalls = 0         # valid, not ready: the producer is held back
+        self.starves = 0        # ready, no valid: the consumer waits for data
+        self.first_beat = None  # cycle of the first / last handshake
+        self.last_beat = None
+
+    @property
+    def beats_per_cycle(self):
+        """Sustained rate between the first and the last handshake"""
+        if self.beats < 2:
+            return float(self.beats)
+        return self.beats / (self.last_beat - self.first_beat + 1)
+
+    async def run(self):
+        clock_edge = RisingEdge(self.clock)
+        read_only = ReadOnly()
+        mask = (1 << self.width) - 1
+
+        while True:
+            await clock_edge
+            await read_only
+            self.cycle += 1
+            self.cycles += 1
+            valid = read_int(self.tvalid) & 1
+            ready = read_int(self.tready) & 1
+            if valid and ready:
+                self.beats += 1
+                if self.first_beat is None:
+                    self.first_beat = self.cycle
+                self.last_beat = self.cycle
+                if self.callback is not None:
+                    tlast = read_int(self.tlast) & 1 if self.tlast is not None else 0
+                    self.callback((self.cycle, read_int(self.tdata) & mask, tlast))
+            elif valid:
+                self.stalls += 1
+            elif ready:
+                self.starves += 1
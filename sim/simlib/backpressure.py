@@ -0,0 +1,209 @@
+"""
+Precomputed tready backpressure patterns
+
+Patterns are built up front with NumPy as uint8 arrays, one entry per clock
+cycle (1 = ready, 0 = stall). `density` is always the stall fraction
+(tready low), so density 0 means no backpressure:
+
+    bernoulli(n, density, seed)             independent stall per cycle
+    markov(n, density, mean_stall, seed)    bursty two-state chain with geometric run lengths
+    duty(n, period, density, phase)         periodic: stall for the last density*period cycles
+                                            (must be a whole number, e.g. 0.5 with period 4)
+    lfsr(n, density, seed)                  bit-exact software model of the RTL LFSR (see below)
+
+pattern_from_spec("markov:0.3:mean_stall=16", n) builds the same patterns from
+a string ("always" for no backpressure), for profiles passed through make.
+
+BackpressureDriver run-length encodes a pattern and writes the signal only
+on cycles where it changes. A stretch of N equal cycles costs one
+ClockCycles(N) wait instead of N Python wakeups.
+
+LFSR: a 16-bit Fibonacci LFSR with taps 16,14,13,11 (x^16+x^14+x^13+x^11+1)
+that shifts left:
+
+    lfsr <= {lfsr[14:0], lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10]};
+    tready = (lfsr[7:0] >= STALL_THRESH);     // STALL_THRESH = round(density*256)
+
+Cycle 0 uses the seed, and every following cycle uses the next state. An
+RTL sink with the same seed and threshold therefore produces exactly this
+pattern.
+"""
+
+import numpy as np
+
+from cocotb.triggers import ClockCycles
+
+
+LFSR_SEED = 0xACE1
+LFSR_PERIOD = (1 << 16) - 1
+
+_lfsr_cache = {}
+
+
+def _rng(seed):
+    return np.random.default_rng(seed)
+
+
+def bernoulli(n, density, seed=0):
+    """Each cycle stalls independently with probability density"""
+    return (_rng(seed).random(n) >= density).astype(np.uint8)
+
+
+def markov(n, density, mean_stall=4.0, seed=0):
+    """Alternating ready/stall runs with geometric lengths
+
+    Stall runs average mean_stall cycles; ready runs are sized so the long-run
+    stall fraction is density. Starts with a ready run.
+    """
+    if density <= 0:
+        return np.ones(n, dtype=np.uint8)
+    if density >= 1:
+        return np.zeros(n, dtype=np.uint8)
+    mean_ready = mean_stall * (1 - density) / density
+    rng = _rng(seed)
+    out = []
+    total = 0
+    while total < n:
+        # enough runs for the remainder on average, plus margin
+        k = max(16, int((n - total) / (mean_ready + mean_stall) * 1.2) + 1)
+        ready = rng.geometric(1 / max(mean_ready, 1.0), k)
+        stall = rng.geometric(1 / max(mean_stall, 1.0), k)
+        lengths = np.empty(2 * k, dtype=np.int64)
+        lengths[0::2] = ready
+        lengths[1::2] = stall
+        values = np.tile(np.array([1, 0], dtype=np.uint8), k)
+        out.append(np.repeat(values, lengths))
+        total += int(lengths.sum())
+    return np.concatenate(out)[:n]
+
+
+def duty(n, period, density, phase=0):
+    """Periodic pattern: ready first, then density*period stall cycles
+
+    density*period must be a whole number of cycles (ValueError otherwise):
+    rounding would silently change the density, e.g. 0.5 of 3 -> 2 of 3.
+    """
+    stall = density * period
+    if abs(stall - round(stall)) > 1e-9:
+        raise ValueError(f"duty density {density:g} x period {period} = {stall:g} stall cycles, "
+                         f"not a whole number")
+    stall = int(round(stall))
+    one = np.ones(period, dtype=np.uint8)
+    if stall:
+        one[period - stall:] = 0
+    return np.roll(np.resize(one, n + period), -phase)[:n].copy()
+
+
+def lfsr_states(seed=LFSR_SEED):
+    """One full period of LFSR states, starting with the seed (cached)"""
+    states = _lfsr_cache.get(seed)
+    if states is None:
+        if not seed & 0xFFFF:
+            raise ValueError("LFSR seed must be non-zero")
+        states = np.empty(LFSR_PERIOD, dtype=np.uint16)
+        s = seed & 0xFFFF
+        for i in range(LFSR_PERIOD):
+            states[i] = s
+            fb = ((s >> 15) ^ (s >> 13) ^ (s >> 12) ^ (s >> 10)) & 1
+            s = ((s << 1) | fb) & 0xFFFF
+        _lfsr_cache[seed] = states
+    return states
+
+
+def lfsr_threshold(density):
+    """STALL_THRESH for the RTL (0..256)"""
+    return int(round(density * 256))
+
+
+def lfsr(n, density, seed=LFSR_SEED):
+    """tready of the RTL LFSR sink for n cycles"""
+    states = np.resize(lfsr_states(seed), n)
+    return ((states & 0xFF) >= lfsr_threshold(density)).astype(np.uint8)
+
+
+def make_pattern(kind, n, density, seed=0, **kwargs):
+    """Build a pattern by name ('bernoulli', 'markov', 'duty', 'lfsr')"""
+    if kind == "bernoulli":
+        return bernoulli(n, density, seed)
+    if kind == "markov":
+        return markov(n, density, kwargs.get("mean_stall", 4.0), seed)
+    if kind == "duty":
+        return duty(n, kwargs.get("period", 8), density, kwargs.get("phase", 0))
+    if kind == "lfsr":
+        return lfsr(n, density, seed or LFSR_SEED)
+    raise ValueError(f"Unknown backpressure pattern: {kind}")
+
+
+def pattern_from_spec(spec, n, seed=0):
+    """make_pattern() from "always" or "<kind>:<density>[:key=value...]"
+
+    Keys are period and phase (int) or mean_stall (float).
+    """
+    if spec in ("always", "none"):
+        return np.ones(n, dtype=np.uint8)
+    kind, *args = spec.split(":")
+    if not args:
+        raise ValueError(f"Backpressure spec {spec!r} needs a density: {kind}:<density>")
+    kwargs = {}
+    for arg in args[1:]:
+        key, _, value = arg.partition("=")
+        if key not in ("period", "phase", "mean_stall") or not value:
+            raise ValueError(f"Bad backpressure option {arg!r} in {spec!r}")
+        kwargs[key] = float(value) if key == "mean_stall" else int(value)
+    return make_pattern(kind, n, float(args[0]), seed, **kwargs)
+
+
+def run_lengths(pattern):
+    """(values, lengths) of the runs of equal values in pattern"""
+    pattern = np.asarray(pattern, dtype=np.uint8)
+    if len(pattern) == 0:
+        return pattern, np.empty(0, dtype=np.int64)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(pattern)) + 1))
+    lengths = np.diff(np.concatenate((starts, [len(pattern)])))
+    return pattern[starts], lengths
+
+
+class BackpressureDriver:
+    """Drive a ready pattern onto a signal, writing only when it changes
+
+    The first value is written when run() starts and every run of N equal
+    cycles is held for N rising edges of clock. With loop=True the pattern
+    repeats; otherwise the signal is left at `idle` when it runs out.
+    """
+
+    def __init__(self, clock, signal, pattern, loop=True, idle=1):
+        self.clock = clock
+        self.signal = signal
+        self.values, self.lengths = run_lengths(pattern)
+        self.cycles = int(self.lengths.sum())
+        self.stall_cycles = int(self.lengths[self.values == 0].sum())
+        self.loop = loop
+        self.idle = idle
+        self.writes = 0
+
+    @property
+    def density(self):
+        return self.stall_cycles / self.cycles if self.cycles else 0.0
+
+    async def run(self):
+        values = self.values.tolist()
+        lengths = self.lengths.tolist()
+        if not values:
+            return
+        if self.loop and len(values) == 1:
+            # constant pattern: one write, nothing left to do
+            self.signal.value = values[0]
+            self.writes += 1
+            return
+        last = None
+        while True:
+            for value, length in zip(values, lengths):
+                if value != last:
+                    # the first run of a loop iteration continues the last one if equal
+                    self.signal.value = value
+                    self.writes += 1
+                    last = value
+                await ClockCycles(self.clock, length)
+            if not self.loop:
+                break
+        self.signal.value = self.idle
@@ -0,0 +1,102 @@
+"""
+Benchmark results history and regression comparison
+
+A history file is a JSON list of runs, oldest first:
+
+    [{"time": "2026-01-01T12:00:00", "rev": "abc1234", "label": "...",
+      "sim": "icarus", "points": [{"name": "gap0_bp0.00_loop", ...metrics}]}]
+
+Metric direction is part of the name so the comparison needs no schema:
+METRICS maps each known metric to +1 (higher is better) or -1 (lower is better);
+other keys of a point are treated as configuration and ignored.
+"""
+
+import datetime
+import json
+import os
+import subprocess
+import tempfile
+
+
+METRICS = {
+    "words_per_clk": +1,
+    "cycles_per_s": +1,
+    "beats_per_s": +1,
+    "cpu_us_per_beat": -1,
+    "wall_s": -1,
+}
+
+
+def git_rev(path="."):
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=path,
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+        return out.stdout.decode().strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def load_history(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def append_history(path, points, label="", sim=None, extra=None):
+    """Append one run to the history file (written atomically) and return it"""
+    run = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "rev": git_rev(os.path.dirname(os.path.abspath(path))),
+        "label": label,
+        "sim": sim,
+        "points": points,
+    }
+    if extra:
+        run.update(extra)
+    history = load_history(path)
+    history.append(run)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(history, f, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+    return run
+
+
+def compare(baseline, current, threshold=0.05):
+    """Compare two runs point by point
+
+    Returns a list of (point, metric, old, new, change, regressed) rows, where
+    change is the relative change in the metric's "better" direction
+    (negative = worse) and regressed is change < -threshold.
+    """
+    base = {p["name"]: p for p in baseline["points"]}
+    rows = []
+    for point in current["points"]:
+        old_point = base.get(point["name"])
+        if old_point is None:
+            continue
+        for metric, direction in METRICS.items():
+            if metric not in point or metric not in old_point:
+                continue
+            old, new = old_point[metric], point[metric]
+            if old == 0:
+                # no scale to compare against: report +/-100% for any change
+                change = 0.0 if new == old else direction * (1.0 if new > old else -1.0)
+            else:
+                change = direction * (new - old) / abs(old)
+            rows.append((point["name"], metric, old, new, change, change < -threshold))
+    return rows
+
+
+def format_table(rows):
+    lines = []
+    width = max([len(r[0]) for r in rows] + [5])
+    lines.append(f"{'point':<{width}}  {'metric':<16} {'old':>12} {'new':>12} {'change':>8}")
+    for name, metric, old, new, change, regressed in rows:
+        flag = "  << REGRESSION" if regressed else ""
+        lines.append(f"{name:<{width}}  {metric:<16} {old:>12.4g} {new:>12.4g} {change * 100:>7.1f}%{flag}")
+    return "\n".join(lines)
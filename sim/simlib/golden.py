@@ -0,0 +1,62 @@
+"""
+Golden model of the threshold comparators (dataover family)
+
+Every function takes whole arrays (or scalars) and returns int8 flag arrays
+computed in one NumPy pass, so the expectations of a 10M-sample stream cost
+a few tens of milliseconds:
+
+    dataover(data_in, threshold)        data_over
+    two_dataover(data_in)               {data_over_100, data_over_200}
+    negative_threshold_dataover(data)   {data_over_neg100, data_over_neg50}
+    top_axis_dataover(words, threshold) data_over of every beat of the stream
+
+Inputs may be signed values (int32 from load_stimulus, Python ints) or raw
+unsigned 32-bit values as read from the DUT (int(handle.value), uint32
+arrays): to_int32() reinterprets both as two's complement, the way the RTL
+compares (`data_in > threshold` on signed [31:0]).
+"""
+
+import numpy as np
+
+
+TOP_AXIS_DATAOVER_THRESHOLD = 1000000
+
+# output name -> fixed threshold, as localparams in the RTL
+TWO_DATAOVER_THRESHOLDS = {"data_over_100": 100, "data_over_200": 200}
+NEGATIVE_THRESHOLDS = {"data_over_neg100": -100, "data_over_neg50": -50}
+
+
+def to_int32(values):
+    """Two's-complement int32 view of signed or raw unsigned 32-bit values"""
+    values = np.asarray(values)
+    if values.dtype == np.int32:
+        return values
+    if values.dtype == np.uint32:
+        return values.view(np.int32)
+    # Python ints / int64: keep the low 32 bits, then reinterpret
+    return (values.astype(np.int64) & 0xFFFFFFFF).astype(np.uint32).view(np.int32)
+
+
+def dataover(data_in, threshold):
+    """data_over = data_in > threshold, signed 32-bit"""
+    return (to_int32(data_in) > to_int32(threshold)).astype(np.int8)
+
+
+def _fixed(data_in, thresholds):
+    data_in = to_int32(data_in)
+    return {name: (data_in > t).astype(np.int8) for name, t in thresholds.items()}
+
+
+def two_dataover(data_in):
+    """{data_over_100, data_over_200} of two_dataover"""
+    return _fixed(data_in, TWO_DATAOVER_THRESHOLDS)
+
+
+def negative_threshold_dataover(data_in):
+    """{data_over_neg100, data_over_neg50} of negative_threshold_dataover"""
+    return _fixed(data_in, NEGATIVE_THRESHOLDS)
+
+
+def top_axis_dataover(words, threshold=TOP_AXIS_DATAOVER_THRESHOLD):
+    """data_over while each stream word is on m_axis_tdata (THRESHOLD parameter)"""
+    return dataover(words, threshold)
@@ -0,0 +1,218 @@
+"""
+Reference model of axis_master_file_v2 (sim_axis_master_file)
+
+Two levels, both pure Python (no simulator):
+
+    AxisMasterFileModel     the RTL sequencer register for register: step()
+                            advances one rising edge from the control inputs
+                            and tready seen at that edge. Any i_start /
+                            i_loop / i_restart / i_pause / i_gap_cycles /
+                            i_reload / i_stream sequence can be predicted,
+                            including the quirks of the RTL (e.g. i_restart
+                            in SEND does not drop tvalid, the case branch
+                            overrides it). run() steps a whole control script.
+    beat_schedule()         transaction level: with constant controls and
+                            tready held high the output is periodic, so the
+                            handshake cycles, data and tlast of millions of
+                            beats are computed with NumPy in one call.
+
+The model is the predictor of AxisMasterTester.model_checker(), which
+compares the DUT against it every clock, and can be used on its own to try
+control sequences before running the RTL:
+
+    model = AxisMasterFileModel(load_stimulus("data.csv"))
+    beats = model.run(200, start=[1] + [0] * 199, gap=3)
+
+Edge numbers count rising edges of aclk. Data values are whatever the word
+array holds (load_stimulus gives signed int32, the way the testers compare).
+"""
+
+import numpy as np
+
+
+IDLE, SEND, GAP = 0, 1, 2
+STATE_NAMES = ("IDLE", "SEND", "GAP")
+
+CONTROLS = ("start", "loop", "restart", "pause", "gap", "reload", "stream", "tready")
+
+_MASK32 = 0xFFFFFFFF
+
+
+class AxisMasterFileModel:
+    """Cycle model of the axis_master_file_v2 sequencer"""
+
+    def __init__(self, words):
+        self.load(words)
+        self.reset()
+
+    def load(self, words):
+        """Replace the word store (what i_reload re-reads from the file)"""
+        self.words = [int(w) for w in np.asarray(words).tolist()]
+
+    def reset(self):
+        """aresetn low: same register values as the RTL reset branch"""
+        self.state = IDLE
+        self.tdata = 0
+        self.tvalid = 0
+        self.tlast = 0
+        self.busy = 0
+        self.done_pulse = 0
+        self.sent_count = 0
+        self.idx = 0
+        self.gap_cnt = 0
+        self.edges = 0
+
+    def outputs(self):
+        """Registered outputs after the last edge, named like the DUT ports"""
+        return {
+            "m_axis_tvalid": self.tvalid,
+            "m_axis_tdata": self.tdata,
+            "m_axis_tlast": self.tlast,
+            "o_busy": self.busy,
+            "o_done_pulse": self.done_pulse,
+            "o_sent_count": self.sent_count,
+        }
+
+    def step(self, start=0, loop=0, restart=0, pause=0, gap=0, reload=0, stream=0, tready=1):
+        """One rising edge; returns the accepted beat (data, tlast) or None
+
+        Arguments are the input values sampled at this edge. Assignments are
+        applied in the RTL's source order to next-state copies, so a later
+        nonblocking assignment wins exactly as in the always_ff block.
+        """
+        q = self.words
+        n = len(q)
+        state, idx, gap_cnt = self.state, self.idx, self.gap_cnt
+        tvalid, tlast = self.tvalid, self.tlast
+
+        n_state, n_idx, n_gap = state, idx, gap_cnt
+        n_tdata, n_tvalid, n_tlast = self.tdata, tvalid, tlast
+        n_busy, n_sent = self.busy, self.sent_count
+        n_done = 0
+        beat = None
+
+        if restart or reload:
+            n_idx, n_state, n_tvalid, n_tlast, n_gap, n_busy = 0, IDLE, 0, 0, 0, 0
+
+        if state == IDLE:
+            n_tvalid, n_tlast, n_busy, n_gap = 0, 0, 0, 0
+            if start and n:
+                n_idx, n_state, n_busy = 0, SEND, 1
+            elif loop and n:
+                n_state, n_busy = SEND, 1
+
+        elif state == SEND:
+            n_busy = 1
+            if pause:
+                n_tvalid, n_tlast = 0, 0
+            else:
+                n_tdata = q[idx] if idx < n else 0
+                n_tvalid = 1
+                n_tlast = int(idx == n - 1)
+                if tvalid and tready:
+                    beat = (self.tdata, tlast)
+                    n_sent = (self.sent_count + 1) & _MASK32
+                    streaming = stream and gap == 0
+                    if idx == n - 1:
+                        if loop:
+                            n_idx = 0
+                            if streaming:
+                                n_tdata, n_tvalid, n_tlast = q[0], 1, int(n == 1)
+                            else:
+                                n_tvalid, n_tlast = 0, 0
+                            n_gap = gap - 1 if gap else 0
+                            n_state = GAP if gap else SEND
+                        else:
+                            n_tvalid, n_tlast, n_done, n_state = 0, 0, 1, IDLE
+                    else:
+                        n_idx = idx + 1
+                        if streaming:
+                            n_tdata, n_tvalid, n_tlast = q[idx + 1], 1, int(idx + 1 == n - 1)
+                        else:
+                            n_tvalid, n_tlast = 0, 0
+                        n_gap = gap - 1 if gap else 0
+                        n_state = GAP if gap else SEND
+
+        else:  # GAP
+            n_tvalid, n_tlast, n_busy = 0, 0, 1
+            if not pause:
+                if gap_cnt == 0:
+                    n_state = SEND
+                    if stream:
+                        n_tdata = q[idx] if idx < n else 0
+                        n_tvalid, n_tlast = 1, int(idx == n - 1)
+                else:
+                    n_gap = gap_cnt - 1
+
+        self.state, self.idx, self.gap_cnt = n_state, n_idx, n_gap
+        self.tdata, self.tvalid, self.tlast = n_tdata, n_tvalid, n_tlast
+        self.busy, self.sent_count, self.done_pulse = n_busy, n_sent, n_done
+        self.edges += 1
+        return beat
+
+    def run(self, cycles, **controls):
+        """Step `cycles` edges; returns [(edge, data, tlast)] of accepted beats
+
+        Each control (see CONTROLS) is a constant or a per-edge sequence;
+        a sequence shorter than `cycles` holds its last value.
+        """
+        unknown = set(controls) - set(CONTROLS)
+        if unknown:
+            raise ValueError(f"Unknown controls: {', '.join(sorted(unknown))}")
+        per_edge = {}
+        const = {}
+        for name, value in controls.items():
+            if np.ndim(value) == 0:
+                const[name] = int(value)
+            else:
+                per_edge[name] = [int(v) for v in value]
+
+        beats = []
+        step = self.step
+        for i in range(cycles):
+            inputs = dict(const)
+            for name, seq in per_edge.items():
+                if seq:
+                    inputs[name] = seq[i] if i < len(seq) else seq[-1]
+            beat = step(**inputs)
+            if beat is not None:
+                beats.append((self.edges - 1, beat[0], beat[1]))
+        return beats
+
+
+def beat_period(gap=0, stream=0):
+    """Edges between consecutive handshakes with tready held high"""
+    if stream:
+        return gap + 1
+    return gap + 2
+
+
+def beat_schedule(words, beats=None, gap=0, stream=0, loop=False):
+    """Handshake edges, data and tlast of a run started from IDLE, tready=1
+
+    Edge 0 is the edge that samples i_start (or i_loop) in IDLE: the first
+    word is presented at edge 1 and accepted at edge 2, the following ones
+    every beat_period(gap, stream) edges, across loop boundaries as well.
+    beats defaults to one pass over the file (one-shot); more than that
+    requires loop=True. Returns (edges, data, tlast) NumPy arrays.
+    """
+    words = np.asarray(words)
+    n = len(words)
+    if beats is None:
+        beats = n
+    if beats > n and not loop:
+        raise ValueError(f"{beats} beats from a {n}-word file needs loop=True")
+    if n == 0 or beats == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, words[:0], empty
+    k = np.arange(beats, dtype=np.int64)
+    index = k % n if beats > n else k
+    edges = 2 + k * beat_period(gap, stream)
+    return edges, words[index], (index == n - 1).astype(np.int64)
+
+
+def oneshot_edges(n_words, gap=0, stream=0):
+    """Edge at which o_done_pulse rises for a one-shot pass (tready=1)"""
+    if n_words == 0:
+        return None
+    return 2 + (n_words - 1) * beat_period(gap, stream)
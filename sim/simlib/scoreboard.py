@@ -0,0 +1,122 @@
+"""
+Streaming scoreboard
+
+Beats are handed over from a monitor through a cocotb Queue and compared
+against the expected stream as they arrive. Only counters and a bounded
+window of mismatches (first N / last N) are kept, so memory stays flat no
+matter how long the stimulus file is.
+"""
+
+from collections import deque
+
+from cocotb.queue import Queue
+from cocotb.triggers import Event
+
+
+_END = object()
+
+
+def mark_last(values):
+    """Yield (value, tlast) pairs, tlast=1 only for the final value (one-item lookahead)"""
+    it = iter(values)
+    prev = next(it, _END)
+    if prev is _END:
+        return
+    for value in it:
+        yield (prev, 0)
+        prev = value
+    yield (prev, 1)
+
+
+class StreamScoreboard:
+    """Compare each received beat against the next expected beat"""
+
+    def __init__(self, expected, name="scoreboard", keep=10, log=None, progress_every=None):
+        self.name = name
+        self.keep = keep
+        self.log = log
+        self.progress_every = progress_every
+
+        self.queue = Queue()
+        self.idle = Event()
+        self.idle.set()
+
+        self._expected = iter(expected)
+        self.compared = 0
+        self.matches = 0
+        self.mismatches = 0
+        self.unexpected = 0     # beats received after the expected stream ended
+        self.missing = 0        # expected beats never received (counted by finish())
+        self.first_mismatches = []
+        self.last_mismatches = deque(maxlen=keep)
+        self.on_mismatch = None  # optional callback(index, expected, actual)
+
+    def put(self, beat):
+        """Called by the monitor for every accepted beat"""
+        self.idle.clear()
+        self.queue.put_nowait(beat)
+
+    async def run(self):
+        """Checker coroutine: wakes only when the monitor queues a beat"""
+        while True:
+            beat = await self.queue.get()
+            self.check(beat)
+            if self.queue.empty():
+                self.idle.set()
+
+    def check(self, actual):
+        expected = next(self._expected, _END)
+        if expected is _END:
+            self.unexpected += 1
+            self._record(self.compared + self.unexpected - 1, None, actual)
+            return
+
+        index = self.compared
+        self.compared += 1
+        if actual == expected:
+            self.matches += 1
+        else:
+            self.mismatches += 1
+            self._record(index, expected, actual)
+            if self.on_mismatch is not None:
+                self.on_mismatch(index, expected, actual)
+
+        if self.progress_every and self.log and self.compared % self.progress_every == 0:
+            self.log.info(f"[{self.name}] ✓ compared {self.compared} beats ({self.mismatches} mismatches)")
+
+    def _record(self, index, expected, actual):
+        if len(self.first_mismatches) < self.keep:
+            self.first_mismatches.append((index, expected, actual))
+        else:
+            self.last_mismatches.append((index, expected, actual))
+
+    async def drain(self):
+        """Wait until every queued beat has been checked"""
+        if not self.queue.empty():
+            await self.idle.wait()
+
+    def finish(self):
+        """Count expected beats that were never received (consumes the rest of the stream)"""
+        for _ in self._expected:
+            self.missing += 1
+        return self.passed
+
+    @property
+    def passed(self):
+        return self.mismatches == 0 and self.unexpected == 0 and self.missing == 0
+
+    def report(self, log=None, fmt=repr):
+        """Log the summary and the bounded mismatch window"""
+        log = log or self.log
+        log.info(f"[{self.name}] compared={self.compared} matches={self.matches} "
+                 f"mismatches={self.mismatches} unexpected={self.unexpected} missing={self.missing}")
+        if not (self.first_mismatches or self.last_mismatches):
+            return
+        log.error(f"[{self.name}] Detected mismatches:")
+        for index, expected, actual in self.first_mismatches:
+            log.error(f"  index {index}: expected={fmt(expected)}, actual={fmt(actual)}")
+        hidden = self.mismatches + self.unexpected - len(self.first_mismatches) - len(self.last_mismatches)
+        if hidden > 0:
+            log.error(f"  ... {hidden} more ...")
+        for index, expected, actual in self.last_mismatches:
+            log.error(f"  index {index}: expected={fmt(expected)}, actual={fmt(actual)}")
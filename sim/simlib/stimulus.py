@@ -0,0 +1,164 @@
+"""
+Stimulus reader shared by all testers
+
+Reads the same three formats axis_master_file_v2 accepts (FILE_TYPE):
+
+    csv_dec  one decimal value per line (first CSV column)
+    csv_hex  one hex value per line, optional 0x prefix
+    bin      packed 32-bit words, LITTLE_ENDIAN selects the byte order
+
+Results are NumPy arrays: int32 when signed=True (default, the way the
+testers compare data), uint32 otherwise. The bin reader memory-maps the file,
+so a multi-million-word stimulus costs no parse time and no resident copy.
+
+Every load is cached for the life of the Python process (i.e. across all the
+tests of a cocotb module) and invalidated when the file's mtime or size
+changes.
+
+write_stimulus() is the inverse: it appends words to an open binary file in
+any of the three formats, so generators can stream large files in chunks.
+"""
+
+import os
+
+import numpy as np
+
+
+FILE_TYPES = ("csv_dec", "csv_hex", "bin")
+
+_cache = {}
+
+
+def load_stimulus(path, file_type="csv_dec", little_endian=True, signed=True):
+    """Load a stimulus file as an int32/uint32 array (cached, mtime-invalidated)"""
+    if file_type not in FILE_TYPES:
+        raise ValueError(f"Unknown FILE_TYPE: {file_type} (use csv_hex, csv_dec, or bin)")
+
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, file_type, bool(little_endian))
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        words = cached[2]
+    else:
+        if file_type == "bin":
+            words = _read_bin(path, st.st_size, little_endian)
+        elif file_type == "csv_hex":
+            words = _read_csv_hex(path)
+        else:
+            words = _read_csv_dec(path)
+        _cache[key] = (st.st_mtime_ns, st.st_size, words)
+
+    # keep the byte order of the source (big-endian bin stays a zero-copy map)
+    return words.view(np.dtype("i4" if signed else "u4").newbyteorder(words.dtype.byteorder))
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def write_stimulus(f, words, file_type="csv_dec", little_endian=True):
+    """Append words (any integer array, taken modulo 2**32) to binary file object f
+
+    csv_dec is written signed, csv_hex as 0x%08X two's complement, bin as packed
+    32-bit words. Big-endian bin (little_endian=False) is what the RTL's bulk
+    $fread consumes without a byte swap.
+    """
+    if file_type not in FILE_TYPES:
+        raise ValueError(f"Unknown FILE_TYPE: {file_type} (use csv_hex, csv_dec, or bin)")
+    words = np.asarray(words, dtype=np.int64) & 0xFFFFFFFF
+    if len(words) == 0:
+        return
+    if file_type == "bin":
+        f.write(words.astype("<u4" if little_endian else ">u4").tobytes())
+    elif file_type == "csv_hex":
+        f.write(_format_hex_fixed(words.astype(np.uint32)))
+    else:
+        signed = words.astype(np.uint32).view(np.int32)
+        f.write(("\n".join(map(str, signed.tolist())) + "\n").encode("ascii"))
+
+
+_HEX_DIGITS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+
+def _format_hex_fixed(words):
+    """Vectorized 0x%08X lines for a uint32 array"""
+    chars = np.empty((len(words), 11), dtype=np.uint8)
+    chars[:, 0] = ord("0")
+    chars[:, 1] = ord("x")
+    for col in range(8):
+        chars[:, 2 + col] = _HEX_DIGITS[(words >> (28 - 4 * col)) & 0xF]
+    chars[:, 10] = ord("\n")
+    return chars.tobytes()
+
+
+def _read_bin(path, size, little_endian):
+    n_words = size // 4
+    if n_words == 0:
+        return np.empty(0, dtype=np.uint32)
+    dtype = np.dtype("<u4" if little_endian else ">u4")
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n_words,))
+
+
+def _read_csv_dec(path):
+    try:
+        values = np.loadtxt(path, dtype=np.int64, delimiter=",", usecols=0, ndmin=1)
+    except ValueError:
+        # same rule as the RTL ($sscanf %d): lines that do not parse are skipped
+        values = np.fromiter(_tolerant(path, 10), dtype=np.int64)
+    return (values & 0xFFFFFFFF).astype(np.uint32)
+
+
+def _read_csv_hex(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    values = _parse_hex_fixed(data)
+    if values is None:
+        values = np.fromiter(_tolerant(path, 16), dtype=np.int64)
+    return (values & 0xFFFFFFFF).astype(np.uint32)
+
+
+_HEX_LUT = np.full(256, 255, dtype=np.uint8)
+for _i, _c in enumerate(b"0123456789abcdef"):
+    _HEX_LUT[_c] = _i
+    _HEX_LUT[ord(chr(_c).upper())] = _i
+
+
+def _parse_hex_fixed(data):
+    """Vectorized path for equal-width lines such as 0x0809850D; None if not applicable"""
+    if not data:
+        return np.empty(0, dtype=np.int64)
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    width = data.index(b"\n") + 1
+    if len(data) % width:
+        return None
+    chars = np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+    if not (chars[:, -1] == ord("\n")).all():
+        return None
+    body = chars[:, :-1]
+    if body.shape[1] and (body[:, -1] == ord("\r")).all():
+        body = body[:, :-1]
+    if body.shape[1] > 2 and (body[:, 0] == ord("0")).all() and (body[:, 1] | 0x20 == ord("x")).all():
+        body = body[:, 2:]
+    if body.shape[1] == 0 or body.shape[1] > 8:
+        return None
+    digits = _HEX_LUT[body]
+    if (digits == 255).any():
+        return None
+    values = np.zeros(len(digits), dtype=np.int64)
+    for col in range(digits.shape[1]):
+        values = (values << 4) | digits[:, col]
+    return values
+
+
+def _tolerant(path, base):
+    with open(path, "r") as f:
+        for line in f:
+            token = line.split(",", 1)[0].strip()
+            if not token:
+                continue
+            try:
+                yield int(token, base)
+            except ValueError:
+                continue
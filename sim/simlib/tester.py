@@ -0,0 +1,115 @@
+"""
+Shared tester base: clock start-up for the cocotb flows
+
+    tester = TesterBase(dut)            # clock signal: dut.aclk
+    tester.start_clock(10)              # 10 ns period
+
+start_clock() picks a clock implementation:
+
+    "hdl"     cocotb_hdl_clock root module (sim/clock.mk) toggles the clock
+              inside the simulator; Python is not woken per edge
+    "cocotb"  cocotb.clock.Clock (Python coroutine, one shared Timer)
+    "toggle"  the original per-tester loop: two signal writes and two new
+              Timer objects per period; kept only for benchmarking
+    "auto"    "hdl" when the module was compiled in, else "cocotb"
+
+All three drive the same net, so RisingEdge(dut.aclk) works unchanged.
+"""
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.handle import SimHandle
+from cocotb.triggers import Timer
+
+
+CLOCK_MODULE = "cocotb_hdl_clock"
+CLOCK_IMPLS = ("hdl", "cocotb", "toggle")
+
+
+class HdlClock:
+    """Enable/period registers of the cocotb_hdl_clock root module"""
+
+    def __init__(self, name=CLOCK_MODULE):
+        self._clk = None
+        if "COCOTB_HDL_CLOCK" not in cocotb.plusargs:
+            # not compiled in: do not probe (a failed root lookup logs GPI errors)
+            return
+        try:
+            handle = cocotb.simulator.get_root_handle(name)
+        except Exception:
+            handle = None
+        if handle:
+            self._clk = SimHandle(handle)
+
+    @property
+    def available(self):
+        return self._clk is not None
+
+    @property
+    def running(self):
+        return self._clk is not None and self._clk.enable.value == 1
+
+    def start(self, period_ns):
+        # 1 ps resolution; if already running, the new period applies from the next edge
+        half_ps = int(round(period_ns * 1000 / 2))
+        if half_ps < 1:
+            raise ValueError(f"Clock period too small: {period_ns} ns")
+        self._clk.half_period_ps.value = half_ps
+        self._clk.enable.value = 1
+
+    def stop(self):
+        self._clk.enable.value = 0
+
+
+class TesterBase:
+    """Common base of the flow testers: owns the DUT handle and its clock"""
+
+    def __init__(self, dut, clock_name="aclk"):
+        self.dut = dut
+        self.clock = getattr(dut, clock_name)
+        self.clock_impl = None
+        self._clock_task = None
+        self._hdl_clock = None
+
+    def start_clock(self, period_ns=10, impl="auto"):
+        """Start the clock (see module docstring for impl); returns the impl used"""
+        if impl not in CLOCK_IMPLS + ("auto",):
+            raise ValueError(f"Unknown clock implementation: {impl}")
+        if self._hdl_clock is None:
+            self._hdl_clock = HdlClock()
+        if impl == "auto":
+            impl = "hdl" if self._hdl_clock.available else "cocotb"
+        elif impl == "hdl" and not self._hdl_clock.available:
+            raise RuntimeError(f"{CLOCK_MODULE} not compiled in (include sim/clock.mk, HDL_CLOCK=1)")
+
+        if self._clock_task is not None:
+            self._clock_task.kill()
+            self._clock_task = None
+        if impl == "hdl":
+            # an already running module keeps going: only the period is updated
+            self._hdl_clock.start(period_ns)
+        else:
+            # the module stays enabled across tests; release the net first
+            if self._hdl_clock.running:
+                self._hdl_clock.stop()
+            if impl == "cocotb":
+                self._clock_task = cocotb.start_soon(Clock(self.clock, period_ns, units="ns").start())
+            else:
+                self._clock_task = cocotb.start_soon(self._toggle(period_ns / 2))
+        self.clock_impl = impl
+        return impl
+
+    def stop_clock(self):
+        if self._clock_task is not None:
+            self._clock_task.kill()
+            self._clock_task = None
+        if self._hdl_clock is not None and self._hdl_clock.running:
+            self._hdl_clock.stop()
+        self.clock_impl = None
+
+    async def _toggle(self, half_ns):
+        while True:
+            self.clock.value = 0
+            await Timer(half_ns, units="ns")
+            self.clock.value = 1
+            await Timer(half_ns, units="ns")
@@ -0,0 +1,45 @@
+"""
+Producer arrival profiles
+
+A profile is a uint8 array with one entry per clock cycle. 1 means the
+producer generates a beat in that cycle. The beat is offered on tvalid
+from then on and queues in the producer's backlog while the FIFO holds
+it back, so every cycle with a backlog and s_tready low is a producer
+stall. Profiles are given as short specs so they pass through make and
+the environment:
+
+    full                  a beat every cycle
+    burst:LEN:GAP         LEN back-to-back beats, then GAP idle cycles
+    rate:P                each cycle independently with probability P
+    frames:LEN:PERIOD     LEN beats at the start of every PERIOD cycles
+
+Consumer tready patterns use backpressure.pattern_from_spec().
+"""
+
+import numpy as np
+
+
+def burst(n, length, gap):
+    one = np.zeros(length + gap, dtype=np.uint8)
+    one[:length] = 1
+    return np.resize(one, n).copy()
+
+
+def arrivals(spec, n, seed=0):
+    """Arrival pattern of n cycles from a profile spec (see module docstring)"""
+    kind, *args = spec.split(":")
+    try:
+        if kind == "full" and not args:
+            return np.ones(n, dtype=np.uint8)
+        if kind == "burst" and len(args) == 2:
+            return burst(n, int(args[0]), int(args[1]))
+        if kind == "frames" and len(args) == 2:
+            length, period = int(args[0]), int(args[1])
+            if length > period:
+                raise ValueError(f"frame length {length} exceeds its period {period}")
+            return burst(n, length, period - length)
+        if kind == "rate" and len(args) == 1:
+            return (np.random.default_rng(seed).random(n) < float(args[0])).astype(np.uint8)
+    except ValueError as e:
+        raise ValueError(f"Bad producer profile {spec!r}: {e}") from None
+    raise ValueError(f"Unknown producer profile {spec!r} (full, burst:LEN:GAP, rate:P, frames:LEN:PERIOD)")
@@ -0,0 +1,174 @@
+"""
+Batched vector engine: drive a combinational DUT from NumPy tables
+
+The flow's vec_<top> wrapper (sim/vectors.mk) puts sim/vec_player.sv in front
+of the DUT. VectorPlayer packs the input fields into one word per vector,
+hands a whole batch to the player through a $readmemh file, lets the
+simulator apply one vector per clock and reads the captured outputs back
+from a $writememh file:
+
+    player = VectorPlayer(dut, inputs=[("data_in", 32), ("threshold", 32)],
+                          outputs=[("data_over", 1)])
+    player.start_clock()
+    out = await player.run({"data_in": a, "threshold": b})
+    mismatches = np.flatnonzero(out["data_over"] != (a > b))
+
+Fields are packed MSB first in the order given, which must match the
+wrapper's concatenation (vec_in = {data_in, threshold}). Inputs may be
+signed; they are taken modulo 2**width. Outputs come back unsigned (or
+signed for fields declared with signed=True). Packed widths up to 64 bits.
+A vector whose captured outputs contain X/Z fails run() whatever the
+expected value, since no field value can be trusted for it.
+
+Per batch the Python cost is one vectorized hex format, three control
+pulses, one wait on `done` and one parse, so a million vectors are a few
+seconds of simulator time instead of a million GPI round trips.
+"""
+
+import os
+import string
+
+import cocotb
+import numpy as np
+from cocotb.triggers import FallingEdge, RisingEdge
+
+from .tester import TesterBase
+
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def _field(spec):
+    name, width = spec[0], spec[1]
+    signed = spec[2] if len(spec) > 2 else False
+    return name, int(width), bool(signed)
+
+
+def pack_fields(fields, values):
+    """Pack {name: array} into uint64 words, first field in the MSBs"""
+    words = None
+    shift = sum(w for _, w, _ in fields)
+    if shift > 64:
+        raise ValueError(f"Packed vector is {shift} bits, at most 64 are supported")
+    for name, width, _ in fields:
+        shift -= width
+        column = np.asarray(values[name]).astype(np.int64).view(np.uint64)
+        column = (column & np.uint64((1 << width) - 1)) << np.uint64(shift)
+        words = column if words is None else words | column
+    return words
+
+
+def unpack_fields(fields, words):
+    """Inverse of pack_fields: {name: int64 array}"""
+    words = np.asarray(words, dtype=np.uint64)
+    out = {}
+    shift = sum(w for _, w, _ in fields)
+    for name, width, signed in fields:
+        shift -= width
+        column = ((words >> np.uint64(shift)) & np.uint64((1 << width) - 1)).astype(np.int64)
+        if signed:
+            column = np.where(column >> (width - 1), column - (1 << width), column)
+        out[name] = column
+    return out
+
+
+def format_hex(words, width):
+    """One fixed-width hex line per word (vectorized, for $readmemh)"""
+    digits = max(1, (width + 3) // 4)
+    words = np.asarray(words, dtype=np.uint64)
+    chars = np.empty((len(words), digits + 1), dtype=np.uint8)
+    for col in range(digits):
+        shift = np.uint64(4 * (digits - 1 - col))
+        chars[:, col] = _HEX_DIGITS[((words >> shift) & np.uint64(0xF)).astype(np.intp)]
+    chars[:, digits] = ord("\n")
+    return chars.tobytes()
+
+
+def parse_memh(path):
+    """Words of a $writememh file (comments, blank lines and @addresses skipped)
+
+    Returns (words, unknown): unknown is True for words with an X/Z digit.
+    Their value is set to 0 and means nothing, because any constant value
+    still matches some expected value once it is masked to a field.
+    """
+    with open(path) as f:
+        tokens = [t for line in f for t in line.split("//", 1)[0].split() if not t.startswith("@")]
+    unknown = np.array([not t or any(c not in string.hexdigits for c in t) for t in tokens], dtype=bool)
+    words = np.array([0 if u else int(t, 16) for t, u in zip(tokens, unknown)], dtype=np.uint64)
+    return words, unknown
+
+
+class VectorPlayer(TesterBase):
+    """Python side of sim/vec_player.sv"""
+
+    def __init__(self, dut, inputs, outputs, clock_name="aclk"):
+        super().__init__(dut, clock_name)
+        self.inputs = [_field(f) for f in inputs]
+        self.outputs = [_field(f) for f in outputs]
+        self.in_width = sum(w for _, w, _ in self.inputs)
+        self.out_width = sum(w for _, w, _ in self.outputs)
+        self.depth = int(dut.DEPTH.value)
+        self.in_file = cocotb.plusargs.get("VEC_IN", "vec_in.hex")
+        self.out_file = cocotb.plusargs.get("VEC_OUT", "vec_out.hex")
+        self.vectors = 0
+        self.batches = 0
+
+    async def _pulse(self, signal):
+        """One-clock pulse; returns after the edge's always block has run"""
+        signal.value = 1
+        await RisingEdge(self.clock)
+        signal.value = 0
+        await FallingEdge(self.clock)
+
+    async def run_batch(self, words):
+        """Play up to DEPTH packed words, return the packed results and their X/Z flags"""
+        n = len(words)
+        if n > self.depth:
+            raise ValueError(f"Batch of {n} vectors exceeds the player depth {self.depth}")
+        if n == 0:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=bool)
+        directory = os.path.dirname(self.in_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.in_file, "wb") as f:
+            f.write(format_hex(words, self.in_width))
+
+        dut = self.dut
+        dut.count.value = n
+        await self._pulse(dut.load)
+        await self._pulse(dut.start)
+        if not dut.done.value:
+            await RisingEdge(dut.done)
+        await FallingEdge(self.clock)
+        await self._pulse(dut.dump)
+
+        results, unknown = parse_memh(self.out_file)
+        if len(results) != n:
+            raise RuntimeError(f"{self.out_file}: {len(results)} results for {n} vectors")
+        self.vectors += n
+        self.batches += 1
+        return results, unknown
+
+    async def run(self, values):
+        """Apply {input name: array} (all the same length) in DEPTH-sized batches
+
+        Returns {output name: array}, one entry per vector. Raises
+        AssertionError if any vector captured an X/Z output.
+        """
+        words = pack_fields(self.inputs, values)
+        dut = self.dut
+        dut.load.value = 0
+        dut.start.value = 0
+        dut.dump.value = 0
+        results = []
+        unknown = []
+        for lo in range(0, len(words), self.depth):
+            batch, batch_unknown = await self.run_batch(words[lo:lo + self.depth])
+            results.append(batch)
+            unknown.append(batch_unknown)
+        packed = np.concatenate(results) if results else np.empty(0, dtype=np.uint64)
+        bad = np.flatnonzero(np.concatenate(unknown)) if unknown else np.empty(0, dtype=np.intp)
+        if len(bad):
+            raise AssertionError(f"{len(bad)} of {len(words)} vectors have X/Z outputs "
+                                 f"(vectors {bad[:10].tolist()}{' ...' if len(bad) > 10 else ''})")
+        return unpack_fields(self.outputs, packed)
@@ -0,0 +1,185 @@
+"""
+Windowed waveform capture driven from Python
+
+sim/waves.mk compiles a tiny root module, cocotb_wave_ctl, next to the design.
+It registers WAVE_SCOPE for dumping and leaves dumping off; writing its
+`enable` register toggles $dumpon/$dumpoff. This module wraps it:
+
+    waves = WaveControl()
+    waves.on(); ...; waves.off()
+    await waves.window(dut.aclk, 200)          # dump the next 200 cycles
+
+    capture = WaveCapture(dut.aclk, pre=64, post=64,
+                          signals=[dut.m_axis_tdata, dut.m_axis_tvalid])
+    capture.start()
+    capture.attach(scoreboard)                  # dump around every mismatch
+    cocotb.start_soon(capture.watch(dut.o_done_pulse, "done"))
+
+The VCD cannot be written retroactively, so the `pre` cycles before a trigger
+come from a Python ring buffer of `signals`. The buffer is sampled once per
+clock in ReadOnly, so it costs a few GPI reads every cycle: it only runs when
+pre > 0 is asked for (leave pre=0 unless a dump is wanted). On a trigger it is
+written to <wave file>_pre<n>.vcd, and the simulator dump covers the `post`
+cycles after it. With pre=0 nothing runs per cycle; triggers only start a
+ClockCycles wait.
+
+Without the control module (WAVE_WINDOW=0, WAVES=1, other simulators),
+every call is a no-op (triggers are only logged) and no sampler runs, so
+tests do not need to care.
+"""
+
+import collections
+import os
+
+import cocotb
+from cocotb.handle import SimHandle
+from cocotb.triggers import ClockCycles, NextTimeStep, ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
+
+
+CTL_MODULE = "cocotb_wave_ctl"
+
+
+class WaveControl:
+    """$dumpon/$dumpoff switch of the cocotb_wave_ctl root module"""
+
+    def __init__(self, name=CTL_MODULE):
+        self._ctl = None
+        self.enabled = False
+        self.windows = 0
+        if "WAVE_FILE" not in cocotb.plusargs:
+            # waves.mk passes +WAVE_FILE only with the module: do not probe
+            # (a failed root lookup logs GPI errors)
+            return
+        try:
+            handle = cocotb.simulator.get_root_handle(name)
+        except Exception:
+            handle = None
+        if handle:
+            self._ctl = SimHandle(handle)
+
+    @property
+    def available(self):
+        return self._ctl is not None
+
+    @property
+    def wave_file(self):
+        return cocotb.plusargs.get("WAVE_FILE", "window.vcd")
+
+    def on(self):
+        if self._ctl is not None and not self.enabled:
+            self._ctl.enable.value = 1
+            self.enabled = True
+            self.windows += 1
+
+    def off(self):
+        if self._ctl is not None and self.enabled:
+            self._ctl.enable.value = 0
+            self.enabled = False
+
+    async def window(self, clock, cycles):
+        """Dump the next `cycles` clock cycles"""
+        self.on()
+        await ClockCycles(clock, cycles)
+        self.off()
+
+
+class WaveCapture:
+    """Dump `pre` cycles before and `post` cycles after each trigger"""
+
+    def __init__(self, clock, pre=0, post=100, signals=(), control=None, max_triggers=10, log=None):
+        self.clock = clock
+        self.pre = pre
+        self.post = post
+        self.signals = list(signals)
+        self.control = control if control is not None else WaveControl()
+        self.max_triggers = max_triggers
+        self.log = log
+        self.triggers = []          # (sim time ns, reason)
+        self._buffer = collections.deque(maxlen=max(pre, 1))
+        self._post_again = False
+        self._post_task = None
+
+    def start(self):
+        """Start the pre-trigger sampler (only with pre > 0, signals and the control module)"""
+        if self.control.available and self.pre > 0 and self.signals:
+            cocotb.start_soon(self._sample())
+        return self
+
+    async def _sample(self):
+        while True:
+            await RisingEdge(self.clock)
+            await ReadOnly()
+            self._buffer.append((get_sim_time("ps"), [s.value.binstr for s in self.signals]))
+
+    def trigger(self, reason=""):
+        """Capture around now (safe to call from any callback)"""
+        if len(self.triggers) >= self.max_triggers:
+            return
+        self.triggers.append((get_sim_time("ns"), reason))
+        if self.log is not None:
+            self.log.info(f"wave trigger #{len(self.triggers)} at {self.triggers[-1][0]} ns: {reason}")
+        if not self.control.available:
+            return
+        if self.pre > 0 and self.signals and self._buffer:
+            self._write_pre(len(self.triggers))
+        self._post_again = True
+        if self._post_task is None:
+            self._post_task = cocotb.start_soon(self._post())
+
+    async def _post(self):
+        # trigger() may be called in ReadOnly (monitor/scoreboard callbacks),
+        # where signals cannot be written: switch on in the next time step
+        await NextTimeStep()
+        self.control.on()
+        # a trigger inside the window extends it by another `post` cycles
+        while self._post_again:
+            self._post_again = False
+            await ClockCycles(self.clock, self.post)
+        self.control.off()
+        self._post_task = None
+
+    def attach(self, scoreboard):
+        """Trigger on every scoreboard mismatch (StreamScoreboard.on_mismatch)"""
+        previous = scoreboard.on_mismatch
+
+        def on_mismatch(index, expected, actual):
+            if previous is not None:
+                previous(index, expected, actual)
+            self.trigger(f"{scoreboard.name} mismatch at beat {index}: expected {expected}, got {actual}")
+
+        scoreboard.on_mismatch = on_mismatch
+
+    async def watch(self, signal, reason=None):
+        """Trigger on every rising edge of `signal` (e.g. o_done_pulse)"""
+        name = reason or signal._name
+        while True:
+            await RisingEdge(signal)
+            self.trigger(name)
+
+    def _write_pre(self, n):
+        base = os.path.splitext(self.control.wave_file)[0]
+        path = f"{base}_pre{n}.vcd"
+        ids = [_vcd_id(i) for i in range(len(self.signals))]
+        with open(path, "w") as f:
+            f.write("$timescale 1ps $end\n$scope module pre_trigger $end\n")
+            for sig, ident in zip(self.signals, ids):
+                f.write(f"$var wire {len(sig)} {ident} {sig._name} $end\n")
+            f.write("$upscope $end\n$enddefinitions $end\n")
+            last = [None] * len(ids)
+            for t, values in self._buffer:
+                f.write(f"#{t}\n")
+                for i, v in enumerate(values):
+                    if v != last[i]:
+                        f.write(f"b{v} {ids[i]}\n" if len(v) > 1 else f"{v}{ids[i]}\n")
+                        last[i] = v
+        self._buffer.clear()
+
+
+def _vcd_id(i):
+    chars = []
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 94)
+        chars.append(chr(33 + r))
+    return "".join(chars)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Convert a stimulus file between the formats axis_master_file_v2 reads
+
+The default output is packed big-endian 32-bit words (FILE_TYPE=bin,
+LITTLE_ENDIAN=0), which the RTL loads with one $fread and no byte swap:
+
+    python3 ../sim/stim_convert.py data.csv data.bin
+    make STIM_FILE=data.bin STIM_TYPE=bin STIM_LE=0
+
+--words N tiles (or truncates) the input to exactly N words, e.g. to build
+large reload benchmarks from data.csv.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simlib.stimulus import FILE_TYPES, load_stimulus, write_stimulus  # noqa: E402
+
+
+CHUNK_WORDS = 1 << 20
+
+
+def _guess_type(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".bin":
+        return "bin"
+    if "hex" in os.path.basename(path).lower():
+        return "csv_hex"
+    return "csv_dec"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--in-type", choices=FILE_TYPES, help="default: from the file name")
+    parser.add_argument("--in-le", type=int, choices=(0, 1), default=1,
+                        help="byte order of a bin input (1=little-endian)")
+    parser.add_argument("--out-type", choices=FILE_TYPES, default="bin")
+    parser.add_argument("--out-le", type=int, choices=(0, 1), default=0,
+                        help="byte order of a bin output (default 0: big-endian, no swap in RTL)")
+    parser.add_argument("--words", type=int, help="tile/truncate to exactly this many words")
+    args = parser.parse_args(argv)
+
+    words = load_stimulus(args.input, args.in_type or _guess_type(args.input), bool(args.in_le))
+    if len(words) == 0:
+        parser.error(f"{args.input}: no words")
+    total = len(words) if args.words is None else args.words
+
+    with open(args.output, "wb") as f:
+        for start in range(0, total, CHUNK_WORDS):
+            idx = np.arange(start, min(start + CHUNK_WORDS, total)) % len(words)
+            write_stimulus(f, words[idx], args.out_type, bool(args.out_le))
+
+    print(f"{args.output}: {total} words ({args.out_type}"
+          f"{', ' + ('little' if args.out_le else 'big') + '-endian' if args.out_type == 'bin' else ''})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Checks of run_regression.py's shard planning (no simulator needed)
+
+    python3 sim/test_run_regression.py
+    python3 -m pytest sim/test_run_regression.py
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_regression  # noqa: E402
+
+
+def shard_tests(flow, shards):
+    """Tests named in each shard's TESTCASE by make_jobs(--shards N)"""
+    args = run_regression.build_parser().parse_args(["--shards", str(shards), flow])
+    named = []
+    for job in run_regression.make_jobs(args, [flow]):
+        for arg in job["make_args"]:
+            if arg.startswith("TESTCASE="):
+                named.append(arg[len("TESTCASE="):].split(","))
+    return named
+
+
+class MakeJobsTest(unittest.TestCase):
+
+    def test_skip_gated_test_is_never_named(self):
+        # cocotb un-skips every test named in TESTCASE, so a shard must not name
+        # the clock benchmark (skip=not CLOCK_BENCHMARK)
+        for n in (2, 3, 8):
+            named = shard_tests("sim_axis_dataover_test", n)
+            self.assertGreater(len(named), 1)
+            for shard in named:
+                self.assertNotIn("test_axis_dataover_clock_benchmark", shard)
+
+    def test_other_tests_are_sharded_once(self):
+        named = shard_tests("sim_axis_dataover_test", 2)
+        flat = [t for shard in named for t in shard]
+        self.assertEqual(sorted(flat), sorted(run_regression.discover_tests("sim_axis_dataover_test")))
+        self.assertEqual(len(flat), len(set(flat)))
+        self.assertIn("test_axis_dataover_pipeline", flat)
+
+    def test_model_gated_test_is_sharded(self):
+        # test_fifo_equivalence checks FIFO_MODEL inside the test, so it stays
+        # in the shards and still runs there with FIFO_MODEL=xpm
+        flat = [t for shard in shard_tests("sim_axis_fifo", 2) for t in shard]
+        self.assertIn("test_fifo_equivalence", flat)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+// vec_player.sv
+// Batched vector engine for combinational DUTs (see sim/vectors.mk, simlib/vectors.py).
+//
+// Python writes a table of packed input vectors to a hex file, pulses `load`
+// ($readmemh into in_mem), pulses `start` and waits for `done`. The player
+// applies one vector per clock on vec_in and captures vec_out one clock
+// later into out_mem; a `dump` pulse writes out_mem with $writememh for
+// Python to read back in bulk. No Python code runs per vector.
+//
+// File names come from +VEC_IN= / +VEC_OUT= (defaults vec_in.hex / vec_out.hex).
+`timescale 1ns/1ps
+
+module vec_player #(
+    parameter integer IN_W  = 32,
+    parameter integer OUT_W = 1,
+    parameter integer DEPTH = 65536
+)(
+    input  wire              aclk,
+    input  wire              load,      // pulse: read `count` vectors from VEC_IN
+    input  wire              start,     // pulse: play vectors 0..count-1
+    input  wire              dump,      // pulse: write `count` results to VEC_OUT
+    input  wire [31:0]       count,
+    output reg               busy,
+    output reg               done,      // set when the last result is captured, cleared by start
+
+    output reg  [IN_W-1:0]   vec_in,    // -> DUT inputs
+    input  wire [OUT_W-1:0]  vec_out    // <- DUT outputs
+);
+
+  reg [IN_W-1:0]  in_mem  [0:DEPTH-1];
+  reg [OUT_W-1:0] out_mem [0:DEPTH-1];
+
+  reg [31:0] idx;       // next vector to apply
+  reg [31:0] cap_idx;   // vector currently on vec_in
+  reg        cap;       // vec_in holds a vector whose result is captured at this edge
+
+  string in_file;
+  string out_file;
+
+  initial begin
+    busy    = 1'b0;
+    done    = 1'b0;
+    cap     = 1'b0;
+    idx     = 0;
+    cap_idx = 0;
+    vec_in  = '0;
+    in_file  = "vec_in.hex";
+    out_file = "vec_out.hex";
+    void'($value$plusargs("VEC_IN=%s", in_file));
+    void'($value$plusargs("VEC_OUT=%s", out_file));
+  end
+
+  always @(posedge aclk) begin
+    if (load && count > 0)
+      $readmemh(in_file, in_mem, 0, count - 1);
+    if (dump && count > 0)
+      $writememh(out_file, out_mem, 0, count - 1);
+
+    if (start) begin
+      idx  <= 0;
+      cap  <= 1'b0;
+      busy <= 1'b1;
+      done <= 1'b0;
+    end else if (busy) begin
+      if (cap)
+        out_mem[cap_idx] <= vec_out;
+      if (idx < count) begin
+        vec_in  <= in_mem[idx];
+        cap_idx <= idx;
+        cap     <= 1'b1;
+        idx     <= idx + 1;
+      end else begin
+        // the last result (if any) is captured at this edge
+        cap  <= 1'b0;
+        busy <= 1'b0;
+        done <= 1'b1;
+      end
+    end
+  end
+
+endmodule
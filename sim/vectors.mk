@@ -0,0 +1,46 @@
+# Batched vector engine for the combinational dataover flows
+#
+# Include BEFORE $(shell cocotb-config --makefiles)/Makefile.sim, after
+# TOPLEVEL and MODULE are set:
+#     include $(PWD)/../sim/vectors.mk
+#
+# With VECTORS=1 (the flow's `make vectors` target) the build switches to
+#     TOPLEVEL  vec_$(TOPLEVEL)      wrapper in the flow directory: DUT + sim/vec_player.sv
+#     MODULE    $(MODULE)_vectors    test module driving simlib.vectors.VectorPlayer
+# in its own build directory, VEC_SIM_BUILD (default sim_build_vectors; cocotb
+# exports SIM_BUILD, so the parent make's value is deliberately not inherited).
+# VEC_DEPTH is the player memory depth, i.e. vectors per batch. The clock
+# comes from sim/clock.mk.
+
+VECTORS ?= 0
+VEC_DEPTH ?= 65536
+VEC_SIM_BUILD ?= sim_build_vectors
+
+ifeq ($(VECTORS),1)
+
+VEC_SIM_DIR := $(abspath $(dir $(lastword $(MAKEFILE_LIST))))
+
+# VERILOG_SOURCES is recursively expanded: resolve the wrapper name first
+VEC_TOPLEVEL := vec_$(TOPLEVEL)
+VERILOG_SOURCES += $(VEC_SIM_DIR)/vec_player.sv $(PWD)/$(VEC_TOPLEVEL).sv
+TOPLEVEL := $(VEC_TOPLEVEL)
+MODULE := $(MODULE)_vectors
+ifneq ($(origin SIM_BUILD),command line)
+SIM_BUILD := $(VEC_SIM_BUILD)
+endif
+
+# vector/result files live in the build directory
+VEC_DIR := $(abspath $(SIM_BUILD))
+PLUSARGS += +VEC_IN=$(VEC_DIR)/vec_in.hex +VEC_OUT=$(VEC_DIR)/vec_out.hex
+
+ifeq ($(SIM),icarus)
+    COMPILE_ARGS += -P$(TOPLEVEL).DEPTH=$(VEC_DEPTH)
+else ifeq ($(SIM),verilator)
+    COMPILE_ARGS += -GDEPTH=$(VEC_DEPTH)
+else ifeq ($(SIM),questa)
+    SIM_ARGS += -gDEPTH=$(VEC_DEPTH)
+endif
+
+include $(VEC_SIM_DIR)/clock.mk
+
+endif
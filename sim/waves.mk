@@ -0,0 +1,63 @@
+# Windowed waveform capture for the cocotb flows (see sim/simlib/waves.py)
+#
+# Include BEFORE $(shell cocotb-config --makefiles)/Makefile.sim:
+#     include $(PWD)/../sim/waves.mk
+#
+# WAVES=1 keeps cocotb's full-run dump. Otherwise (the default) a small root
+# module, cocotb_wave_ctl, is compiled next to the design: it opens the dump
+# file, registers WAVE_SCOPE down to WAVE_DEPTH levels (0 = all) and
+# immediately switches dumping off. Python turns it on and off around the
+# events a test cares about (simlib.waves.WaveControl / WaveCapture), so a
+# normal run writes only the VCD header.
+#
+#     make WAVE_SCOPE=top_axis_dataover.u_dataover WAVE_DEPTH=1
+#     make WAVE_WINDOW=0            # no wave control module at all
+#
+# Supported on icarus and questa; other simulators run without it.
+
+WAVES       ?= 0
+WAVE_WINDOW ?= 1
+WAVE_DEPTH  ?= 0
+SIM_BUILD   ?= sim_build
+# resolved now: cocotb's questa makefile later rewrites TOPLEVEL as "lib.top"
+WAVE_SCOPE  := $(or $(WAVE_SCOPE),$(TOPLEVEL))
+
+ifneq ($(WAVES),1)
+ifeq ($(WAVE_WINDOW),1)
+ifneq ($(filter icarus questa,$(SIM)),)
+
+WAVE_CTL_V := $(SIM_BUILD)/cocotb_wave_ctl.v
+VERILOG_SOURCES += $(WAVE_CTL_V)
+PLUSARGS += +WAVE_FILE=$(abspath $(SIM_BUILD))/$(lastword $(subst ., ,$(WAVE_SCOPE)))_window.vcd
+
+ifeq ($(SIM),icarus)
+    COMPILE_ARGS += -s cocotb_wave_ctl
+else
+    SIM_ARGS += $(TOPLEVEL_LIBRARY).cocotb_wave_ctl
+endif
+
+# this file comes before Makefile.sim: keep its "all" as the default goal
+.DEFAULT_GOAL := all
+
+# rewritten only when the scope/depth change, so the design is not recompiled
+.PHONY: _wave_ctl_force
+$(WAVE_CTL_V): _wave_ctl_force | $(SIM_BUILD)
+	@printf '%s\n' \
+	  '// generated by sim/waves.mk' \
+	  'module cocotb_wave_ctl;' \
+	  '  reg enable;' \
+	  '  reg [8*512-1:0] wave_file;' \
+	  '  initial begin' \
+	  '    enable = 1'"'"'b0;' \
+	  '    if (!$$value$$plusargs("WAVE_FILE=%s", wave_file)) wave_file = "window.vcd";' \
+	  '    $$dumpfile(wave_file);' \
+	  '    $$dumpvars($(WAVE_DEPTH), $(WAVE_SCOPE));' \
+	  '    $$dumpoff;' \
+	  '  end' \
+	  '  always @(enable) if (enable) $$dumpon; else $$dumpoff;' \
+	  'endmodule' > $@.tmp
+	@cmp -s $@.tmp $@ && rm -f $@.tmp || mv -f $@.tmp $@
+
+endif
+endif
+endif
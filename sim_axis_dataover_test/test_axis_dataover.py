@@ -3,22 +3,44 @@
 Axis Dataover cocotb testbench
 Tests the axis_master_file_v2 + dataover integration
 Verifies that numbers > 1,000,000 are correctly detected
+
+The master also feeds axis_dataover (PIPE_STAGES registered stages, over
+flag in tuser) whose output is the o_axis_* / i_axis_tready port of the top.
+test_axis_dataover_pipeline drives i_axis_tready with every
+DATAOVER_BACKPRESSURE pattern (simlib.backpressure specs) and checks order,
+tuser, latency and that the stage never loses a cycle: once the first beat
+is out, every cycle the sink is ready delivers a beat.
 """
 
 import cocotb
-from cocotb.triggers import Timer, RisingEdge, FallingEdge
+import numpy as np
+from cocotb.triggers import Timer, RisingEdge, FallingEdge, First
 from cocotb.result import TestFailure
-import csv
+from cocotb.utils import get_sim_time
 import os
+import time
 
-# Test configuration
-THRESHOLD = 1000000
+from simlib import golden
+from simlib.axis_monitor import AxisProbe, read_int, to_signed
+from simlib.backpressure import BackpressureDriver, pattern_from_spec
+from simlib.stimulus import load_stimulus
+from simlib.tester import HdlClock, TesterBase
 
-class AxisDataoverTester:
+# Test configuration
+THRESHOLD = golden.TOP_AXIS_DATAOVER_THRESHOLD   # top_axis_dataover THRESHOLD default
+CLK_NS = 10
+BACKPRESSURE = os.environ.get("DATAOVER_BACKPRESSURE",
+                              "always,bernoulli:0.5,markov:0.3:mean_stall=8,duty:0.5:period=4")
+BACKPRESSURE_SEED = int(os.environ.get("DATAOVER_SEED", "1"))
+# the clock benchmark streams test_data.csv once per clock implementation:
+# only when named with TESTCASE or DATAOVER_CLOCK_BENCHMARK=1
+CLOCK_BENCHMARK = os.environ.get("DATAOVER_CLOCK_BENCHMARK", "0") == "1"
+
+class AxisDataoverTester(TesterBase):
     """Helper class for testing axis_dataover functionality"""
 
     def __init__(self, dut):
-        self.dut = dut
+        super().__init__(dut)
         self.test_data = []
         self.expected_results = []
 
@@ -27,24 +49,19 @@ class AxisDataoverTester:
         if not os.path.exists(filename):
             raise FileNotFoundError(f"Test data file {filename} not found")
 
-        self.test_data = []
-        with open(filename, 'r') as csvfile:
-            reader = csv.reader(csvfile)
-            for row in reader:
-                if row:  # Skip empty rows
-                    value = int(row[0])
-                    self.test_data.append(value)
+        # Cached per module: every test shares one parse of the file
+        self.test_data = load_stimulus(filename, "csv_dec")
 
-        # Calculate expected results
-        self.expected_results = [1 if x > THRESHOLD else 0 for x in self.test_data]
+        # Calculate expected results (vectorized golden model)
+        self.expected_results = golden.top_axis_dataover(self.test_data, THRESHOLD)
 
         self.dut._log.info(f"Loaded {len(self.test_data)} test values from {filename}")
-        self.dut._log.info(f"Values > {THRESHOLD}: {sum(self.expected_results)}")
-        self.dut._log.info(f"Values <= {THRESHOLD}: {len(self.expected_results) - sum(self.expected_results)}")
+        over = int(self.expected_results.sum())
+        self.dut._log.info(f"Values > {THRESHOLD}: {over}")
+        self.dut._log.info(f"Values <= {THRESHOLD}: {len(self.expected_results) - over}")
 
     async def reset_dut(self):
-        """Reset the DUT"""
-        self.dut.aclk.value = 0
+        """Reset the DUT (the clock must already be running)"""
         self.dut.aresetn.value = 0
 
         # Set default control inputs
@@ -54,6 +71,8 @@ class AxisDataoverTester:
         self.dut.i_pause.value = 0
         self.dut.i_gap_cycles.value = 0
         self.dut.i_reload.value = 0
+        self.dut.i_stream.value = 0
+        self.dut.i_axis_tready.value = 1
 
         # Wait a few cycles
         for _ in range(10):
@@ -69,17 +88,59 @@ class AxisDataoverTester:
         await RisingEdge(self.dut.aclk)
         self.dut.i_start.value = 0
 
-    def clock_gen(self):
-        """Clock generator"""
-        return cocotb.start_soon(self._clock_gen())
-
-    async def _clock_gen(self):
-        """Internal clock generator"""
-        while True:
-            self.dut.aclk.value = 0
-            await Timer(5, units="ns")
-            self.dut.aclk.value = 1
-            await Timer(5, units="ns")
+    def clock_gen(self, impl="auto"):
+        """Start the clock: simulator-side when sim/clock.mk is included"""
+        return self.start_clock(CLK_NS, impl)
+
+    async def run_pipeline(self, ready_spec, seed=0):
+        """Stream test_data through axis_dataover under a sink tready pattern
+
+        Probes sit on the master -> stage link and on the o_axis_* output;
+        returns the output beats (data, tuser, tlast) and the cycle counts.
+        """
+        dut = self.dut
+        n = len(self.test_data)
+        pattern = pattern_from_spec(ready_spec, 8 * n, seed)
+        out = []
+        out_starves = []    # output probe starve count at every output beat
+
+        def on_out(beat):
+            cycle, data, tlast = beat
+            out.append((cycle, to_signed(data), read_int(dut.o_axis_tuser) & 1, tlast))
+            out_starves.append(out_probe.starves)
+
+        in_probe = AxisProbe(self.clock, dut.m_axis_tvalid, dut.m_axis_tready, dut.m_axis_tdata, dut.m_axis_tlast)
+        in_cycles = []
+        in_probe.callback = lambda beat: in_cycles.append(beat[0])
+        out_probe = AxisProbe(self.clock, dut.o_axis_tvalid, dut.i_axis_tready, dut.o_axis_tdata, dut.o_axis_tlast,
+                              callback=on_out)
+
+        await self.reset_dut()
+        dut.i_stream.value = 1          # back-to-back words, no gap
+        tasks = [cocotb.start_soon(BackpressureDriver(self.clock, dut.i_axis_tready, pattern).run()),
+                 cocotb.start_soon(in_probe.run()), cocotb.start_soon(out_probe.run())]
+        await self.start_data_transmission()
+        for _ in range(len(pattern)):
+            if len(out) >= n:
+                break
+            await RisingEdge(self.clock)
+        for task in tasks:
+            task.kill()
+        dut.i_axis_tready.value = 1
+        dut.i_stream.value = 0
+
+        beats = len(out)
+        return {
+            "ready": ready_spec,
+            "out": out,
+            "latency": np.asarray([o[0] for o in out]) - np.asarray(in_cycles[:beats]),
+            # sink ready with nothing to take between the first and the last output beat
+            "gaps": out_starves[-1] - out_starves[0] if out else 0,
+            "in_beats_per_cycle": in_probe.beats_per_cycle,
+            "out_beats_per_cycle": out_probe.beats_per_cycle,
+            "ready_fraction": float(pattern.mean()),
+            "in_stalls": in_probe.stalls,
+        }
 
 
 @cocotb.test()
@@ -118,7 +179,7 @@ async def test_axis_dataover_basic(dut):
             await RisingEdge(dut.aclk)
 
         # Get actual values
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
         actual_over = int(dut.data_over.value)
 
         # Verify data integrity
@@ -167,7 +228,7 @@ async def test_axis_dataover_threshold_boundary(dut):
     ]
 
     tester.test_data = boundary_data
-    tester.expected_results = [1 if x > THRESHOLD else 0 for x in boundary_data]
+    tester.expected_results = golden.top_axis_dataover(boundary_data, THRESHOLD)
 
     # Start clock
     tester.clock_gen()
@@ -186,7 +247,7 @@ async def test_axis_dataover_threshold_boundary(dut):
         while not dut.m_axis_tvalid.value:
             await RisingEdge(dut.aclk)
 
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
         actual_over = int(dut.data_over.value)
 
         # Verify
@@ -221,7 +282,7 @@ async def test_axis_dataover_large_numbers(dut):
     ]
 
     tester.test_data = large_data
-    tester.expected_results = [1] * len(large_data)  # All should be above threshold
+    tester.expected_results = golden.top_axis_dataover(large_data, THRESHOLD)  # all above
 
     # Start clock
     tester.clock_gen()
@@ -239,7 +300,7 @@ async def test_axis_dataover_large_numbers(dut):
         while not dut.m_axis_tvalid.value:
             await RisingEdge(dut.aclk)
 
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
         actual_over = int(dut.data_over.value)
 
         assert actual_data == expected_data
@@ -271,7 +332,7 @@ async def test_axis_dataover_negative_numbers(dut):
     ]
 
     tester.test_data = negative_data
-    tester.expected_results = [0] * len(negative_data)  # All should be below threshold
+    tester.expected_results = golden.top_axis_dataover(negative_data, THRESHOLD)  # all below
 
     # Start clock
     tester.clock_gen()
@@ -289,7 +350,7 @@ async def test_axis_dataover_negative_numbers(dut):
         while not dut.m_axis_tvalid.value:
             await RisingEdge(dut.aclk)
 
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
         actual_over = int(dut.data_over.value)
 
         assert actual_data == expected_data
@@ -315,7 +376,7 @@ async def test_axis_dataover_control_signals(dut):
     # Simple test data
     test_data = [500000, 1500000, 2000000]  # Below, above, above
     tester.test_data = test_data
-    tester.expected_results = [0, 1, 1]
+    tester.expected_results = golden.top_axis_dataover(test_data, THRESHOLD)
 
     # Start clock
     tester.clock_gen()
@@ -350,7 +411,7 @@ async def test_axis_dataover_control_signals(dut):
         while not dut.m_axis_tvalid.value:
             await RisingEdge(dut.aclk)
 
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
         actual_over = int(dut.data_over.value)
         expected_over = tester.expected_results[i]
 
@@ -374,27 +435,19 @@ async def test_axis_dataover_csv_direct_comparison(dut):
 
     # Load CSV file data directly for comparison
     csv_filename = "test_data.csv"
-    csv_data = []
 
     if not os.path.exists(csv_filename):
         raise TestFailure(f"CSV file {csv_filename} not found")
 
-    with open(csv_filename, 'r') as csvfile:
-        reader = csv.reader(csvfile)
-        for row in reader:
-            if row:  # Skip empty rows
-                try:
-                    value = int(row[0])
-                    csv_data.append(value)
-                except ValueError as e:
-                    dut._log.warning(f"Skipping invalid data in CSV: {row[0]} ({e})")
-
-    if not csv_data:
+    # Invalid lines are skipped, same as the RTL loader
+    csv_data = load_stimulus(csv_filename, "csv_dec")
+
+    if len(csv_data) == 0:
         raise TestFailure("No valid data found in CSV file")
 
     dut._log.info(f"Loaded {len(csv_data)} reference values from {csv_filename}")
-    dut._log.info(f"First 5 values: {csv_data[:5]}")
-    dut._log.info(f"Last 5 values: {csv_data[-5:]}")
+    dut._log.info(f"First 5 values: {csv_data[:5].tolist()}")
+    dut._log.info(f"Last 5 values: {csv_data[-5:].tolist()}")
 
     # Start clock
     tester.clock_gen()
@@ -421,7 +474,7 @@ async def test_axis_dataover_csv_direct_comparison(dut):
             await RisingEdge(dut.aclk)
 
         # Get actual data from DUT
-        actual_data = int(dut.m_axis_tdata.value)
+        actual_data = to_signed(int(dut.m_axis_tdata.value))
 
         # Compare with CSV data
         if actual_data != expected_data:
@@ -454,6 +507,78 @@ async def test_axis_dataover_csv_direct_comparison(dut):
     dut._log.info("All DUT output values match the input CSV file contents exactly")
 
 
+@cocotb.test()
+async def test_axis_dataover_pipeline(dut):
+    """axis_dataover under sink backpressure: order, tuser, latency, one beat per ready cycle"""
+
+    tester = AxisDataoverTester(dut)
+    tester.load_test_data()
+    stages = max(int(dut.PIPE_STAGES.value), 1)
+    expected = list(zip(tester.test_data.tolist(), tester.expected_results.tolist()))
+    n = len(expected)
+    tester.clock_gen()
+
+    for i, spec in enumerate(s for s in BACKPRESSURE.split(",") if s):
+        r = await tester.run_pipeline(spec, BACKPRESSURE_SEED + i)
+        out = r["out"]
+        dut._log.info(f"PIPE_STAGES={stages}, sink {spec} (ready {r['ready_fraction']:.2f}): {len(out)}/{n} beats, "
+                      f"out {r['out_beats_per_cycle']:.3f} / in {r['in_beats_per_cycle']:.3f} beats/cycle, "
+                      f"master stalled {r['in_stalls']} cycles, latency {int(r['latency'].min())}.."
+                      f"{int(r['latency'].max())} cycles, {r['gaps']} lost ready cycles")
+
+        assert len(out) == n, f"{spec}: {len(out)}/{n} beats came out"
+        for j, ((_, data, over, tlast), (exp_data, exp_over)) in enumerate(zip(out, expected)):
+            assert data == exp_data, f"{spec}: beat {j} is {data}, expected {exp_data} (order/loss)"
+            assert over == exp_over, f"{spec}: beat {j} data={data} tuser={over}, expected {exp_over}"
+            assert tlast == (j == n - 1), f"{spec}: tlast={tlast} on beat {j}"
+        assert r["latency"].min() >= stages, f"{spec}: a beat took {int(r['latency'].min())} < {stages} cycles"
+        if spec == "always":
+            assert (r["latency"] == stages).all(), f"{spec}: latency {int(r['latency'].max())} != {stages} cycles"
+            assert r["out_beats_per_cycle"] == 1.0, f"{spec}: {r['out_beats_per_cycle']} beats/cycle"
+        # the master streams back to back, so once full the stage must deliver on every ready cycle
+        assert r["gaps"] == 0, f"{spec}: sink was ready without data {r['gaps']} cycles mid-stream"
+
+
+@cocotb.test(skip=not CLOCK_BENCHMARK)
+async def test_axis_dataover_clock_benchmark(dut):
+    """Wall time of the full test_data.csv transmission per clock implementation"""
+
+    tester = AxisDataoverTester(dut)
+    tester.load_test_data()
+    n_words = len(tester.test_data)
+
+    # Python toggle loop (the old clock_gen), cocotb Clock, then the HDL clock if compiled in
+    impls = ["toggle", "cocotb"]
+    if HdlClock().available:
+        impls.append("hdl")
+
+    results = {}
+    for impl in impls:
+        tester.clock_gen(impl)
+        await tester.reset_dut()
+
+        t_sim0 = get_sim_time("ns")
+        wall0 = time.perf_counter()
+        await tester.start_data_transmission()
+        timeout = Timer((n_words + 100) * CLK_NS * 4, units="ns")
+        done = await First(RisingEdge(dut.o_done_pulse), timeout)
+        wall = time.perf_counter() - wall0
+        cycles = (get_sim_time("ns") - t_sim0) / CLK_NS
+
+        assert done is not timeout, f"{impl}: transmission did not finish"
+        results[impl] = (cycles, wall)
+
+    dut._log.info(f"Full test_data.csv ({n_words} words) per clock implementation:")
+    dut._log.info(f"{'clock':<8} {'cycles':>8} {'wall [s]':>9} {'cycles/s':>10} {'speedup':>8}")
+    base_wall = results["toggle"][1]
+    for impl, (cycles, wall) in results.items():
+        dut._log.info(f"{impl:<8} {cycles:>8.0f} {wall:>9.3f} {cycles / wall if wall else 0:>10.0f} "
+                      f"{base_wall / wall if wall else 0:>7.2f}x")
+
+    # leave the default clock running for any test sharded after this one
+    tester.clock_gen()
+
+
 if __name__ == "__main__":
     print("Axis Dataover cocotb testbench")
     print("Run with: make cocotb")
@@ -5,7 +5,8 @@ module top_axis_dataover #(
     parameter string FILE_TYPE = "csv_dec",
     parameter bit LITTLE_ENDIAN = 1'b1,
     parameter int DATA_BYTES = 4,
-    parameter signed [31:0] THRESHOLD = 32'd1000000
+    parameter signed [31:0] THRESHOLD = 32'd1000000,
+    parameter int PIPE_STAGES = 2        // axis_dataover pipeline depth
 )(
     input  logic        aclk,
     input  logic        aresetn,
@@ -17,14 +18,23 @@ module top_axis_dataover #(
     input  logic        i_pause,
     input  logic [31:0] i_gap_cycles,
     input  logic        i_reload,
+    input  logic        i_stream,
 
     // Status outputs from axis_master_file_v2
     output logic        o_busy,
     output logic        o_done_pulse,
     output logic [31:0] o_sent_count,
 
-    // Dataover output
-    output logic        data_over
+    // Dataover output (combinational, next to m_axis_tdata)
+    output logic        data_over,
+
+    // Registered AXI4-Stream output of axis_dataover, tuser = data_over
+    output logic [31:0] o_axis_tdata,
+    output logic        o_axis_tvalid,
+    input  logic        i_axis_tready,
+    output logic [3:0]  o_axis_tkeep,
+    output logic        o_axis_tlast,
+    output logic        o_axis_tuser
 );
 
 // Internal signals for AXI4-Stream connection
@@ -58,6 +68,7 @@ axis_master_file_v2 #(
     .i_pause      (i_pause),
     .i_gap_cycles (i_gap_cycles),
     .i_reload     (i_reload),
+    .i_stream     (i_stream),
 
     .o_busy       (o_busy),
     .o_done_pulse (o_done_pulse),
@@ -77,7 +88,27 @@ dataover dataover_inst (
     .data_over (data_over)
 );
 
-// Always ready to receive data
-assign m_axis_tready = 1'b1;
+// Pipelined dataover stage: the master is throttled only by i_axis_tready
+axis_dataover #(
+    .DATA_W      (32),
+    .PIPE_STAGES (PIPE_STAGES)
+) u_axis_dataover (
+    .aclk          (aclk),
+    .aresetn       (aresetn),
+    .threshold     (threshold),
+
+    .s_axis_tvalid (m_axis_tvalid),
+    .s_axis_tready (m_axis_tready),
+    .s_axis_tdata  (m_axis_tdata),
+    .s_axis_tkeep  (m_axis_tkeep),
+    .s_axis_tlast  (m_axis_tlast),
+
+    .m_axis_tvalid (o_axis_tvalid),
+    .m_axis_tready (i_axis_tready),
+    .m_axis_tdata  (o_axis_tdata),
+    .m_axis_tkeep  (o_axis_tkeep),
+    .m_axis_tlast  (o_axis_tlast),
+    .m_axis_tuser  (o_axis_tuser)
+);
 
 endmodule
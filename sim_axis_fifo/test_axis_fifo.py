@@ -0,0 +1,267 @@
+"""
+AXIS FIFO model cocotb testbench
+
+top_axis_fifo_equiv drives axis_fifo_xpm (u_ref) and axis_fifo_beh (u_beh)
+from the same inputs. With FIFO_MODEL=xpm, u_ref is xpm_fifo_axis and
+test_fifo_equivalence compares both output sets every cycle under random
+valid/ready. The other tests check the documented timing of u_ref (latency,
+capacity, prog flags, reset busy) and run with either model.
+
+Inputs are driven and outputs sampled on the falling edge, so every value
+read is settled and no simulator-specific edge ordering is involved.
+"""
+
+import os
+import random
+
+import cocotb
+from cocotb.triggers import FallingEdge
+
+from simlib.tester import TesterBase
+
+
+CLK_NS = 10
+FIFO_MODEL = os.environ.get("FIFO_MODEL", "beh")
+
+# axis_fifo_beh timing (matches xpm_fifo_axis, common_clock, PACKET_FIFO="false")
+WRITE_TO_VALID_EDGES = 2    # m_axis_tvalid after the 2nd rising edge past the write handshake
+PIPELINE_WORDS = 2          # FWFT output stages hold words beyond DEPTH
+RST_BUSY_CYCLES = 4
+
+OUTPUTS = ("s_axis_tready", "m_axis_tvalid", "m_axis_tdata", "m_axis_tkeep",
+           "m_axis_tlast", "m_axis_tuser", "prog_full", "prog_empty")
+
+
+class AxisFifoTester(TesterBase):
+    """Drives the shared inputs, reads the u_ref / u_beh output sets"""
+
+    def __init__(self, dut):
+        super().__init__(dut)
+        self.depth = int(dut.DEPTH.value)
+        self.prog_full_thresh = int(dut.PROG_FULL_THRESH.value)
+        self.prog_empty_thresh = int(dut.PROG_EMPTY_THRESH.value)
+        self.data_mask = (1 << len(dut.s_axis_tdata)) - 1
+
+    def outputs(self, side="ref"):
+        """{name: int} of one output set; X/Z read as -1 so they never compare equal to data"""
+        values = {}
+        for name in OUTPUTS:
+            v = getattr(self.dut, f"{side}_{name}").value
+            values[name] = int(v) if v.is_resolvable else -1
+        return values
+
+    def drive(self, tvalid=0, tdata=0, tlast=0, tuser=0, tready=0):
+        self.dut.s_axis_tvalid.value = tvalid
+        self.dut.s_axis_tdata.value = tdata & self.data_mask
+        self.dut.s_axis_tkeep.value = (1 << len(self.dut.s_axis_tkeep)) - 1
+        self.dut.s_axis_tlast.value = tlast
+        self.dut.s_axis_tuser.value = tuser
+        self.dut.m_axis_tready.value = tready
+
+    async def reset(self, cycles=5, wait_ready=True):
+        """Hold aresetn low, release it on a falling edge and wait out rst_busy"""
+        self.drive()
+        self.dut.aresetn.value = 0
+        for _ in range(cycles):
+            await FallingEdge(self.clock)
+        self.dut.aresetn.value = 1
+        if wait_ready:
+            for _ in range(RST_BUSY_CYCLES + 10):
+                await FallingEdge(self.clock)
+                if self.dut.ref_s_axis_tready.value == 1:
+                    break
+
+    async def setup(self):
+        self.start_clock(CLK_NS)
+        await self.reset()
+
+
+@cocotb.test()
+async def test_fifo_equivalence(dut):
+    """u_ref (xpm_fifo_axis) and u_beh agree on every output, every cycle"""
+    # Checked here rather than with skip=: a test named in TESTCASE (regression
+    # shards) runs regardless of skip=, and with FIFO_MODEL=beh u_ref is the
+    # behavioral model too, so the comparison would be against itself
+    if FIFO_MODEL != "xpm":
+        dut._log.info(f"FIFO_MODEL={FIFO_MODEL}: u_ref is axis_fifo_beh, nothing to compare (needs FIFO_MODEL=xpm)")
+        return
+    tester = AxisFifoTester(dut)
+    tester.start_clock(CLK_NS)
+    cycles = int(os.environ.get("EQUIV_CYCLES", "20000"))
+    rng = random.Random(int(os.environ.get("EQUIV_SEED", "1")))
+
+    # phases of (p_valid, p_ready) so the FIFO runs empty, full and in between
+    phases = [(1.0, 1.0), (0.9, 0.2), (0.2, 0.9), (0.5, 0.5), (1.0, 0.0), (0.0, 1.0), (0.7, 0.7)]
+    mismatches = 0
+    data = 0
+    tester.dut.aresetn.value = 0
+    tester.drive()
+
+    for cycle in range(cycles):
+        await FallingEdge(tester.clock)
+        ref, beh = tester.outputs("ref"), tester.outputs("beh")
+        if ref != beh:
+            mismatches += 1
+            if mismatches <= 10:
+                diff = {k: (ref[k], beh[k]) for k in OUTPUTS if ref[k] != beh[k]}
+                dut._log.error(f"cycle {cycle}: (xpm, beh) differ: {diff}")
+
+        # reset at the start and once more mid-run (reset/rst_busy behaviour)
+        dut.aresetn.value = 0 if cycle < 5 or cycles // 2 <= cycle < cycles // 2 + 3 else 1
+        p_valid, p_ready = phases[(cycle // 500) % len(phases)]
+        valid = rng.random() < p_valid
+        tester.drive(tvalid=int(valid), tdata=data, tlast=int(rng.random() < 0.125),
+                     tuser=rng.getrandbits(1), tready=int(rng.random() < p_ready))
+        if valid and ref["s_axis_tready"] == 1:
+            data += 1
+
+    dut._log.info(f"{cycles} cycles compared, {mismatches} mismatching")
+    assert mismatches == 0, f"axis_fifo_beh differs from xpm_fifo_axis in {mismatches} cycles"
+
+
+@cocotb.test()
+async def test_fifo_reset_busy(dut):
+    """s_axis_tready stays low for RST_BUSY_CYCLES clocks after aresetn rises"""
+    tester = AxisFifoTester(dut)
+    tester.start_clock(CLK_NS)
+    await tester.reset(wait_ready=False)
+
+    edges = 0
+    while dut.ref_s_axis_tready.value != 1:
+        await FallingEdge(dut.aclk)
+        edges += 1
+        assert edges <= RST_BUSY_CYCLES + 10, "s_axis_tready never asserted after reset"
+        if dut.ref_s_axis_tready.value != 1:
+            assert dut.ref_m_axis_tvalid.value == 0
+            assert dut.ref_prog_empty.value == 1
+    assert edges == RST_BUSY_CYCLES, f"rst_busy lasted {edges} clocks, expected {RST_BUSY_CYCLES}"
+
+
+@cocotb.test()
+async def test_fifo_write_to_valid_latency(dut):
+    """A word written into the empty FIFO shows up WRITE_TO_VALID_EDGES clocks later"""
+    tester = AxisFifoTester(dut)
+    await tester.setup()
+
+    tester.drive(tvalid=1, tdata=0x1234_5678, tlast=1, tuser=1)
+    await FallingEdge(dut.aclk)           # handshake edge
+    tester.drive()
+    edges = 0
+    while dut.ref_m_axis_tvalid.value != 1:
+        await FallingEdge(dut.aclk)
+        edges += 1
+        assert edges <= 10, "word never appeared on m_axis"
+    assert edges == WRITE_TO_VALID_EDGES, f"write->valid took {edges} clocks, expected {WRITE_TO_VALID_EDGES}"
+
+    out = tester.outputs()
+    assert (out["m_axis_tdata"], out["m_axis_tlast"], out["m_axis_tuser"]) == (0x1234_5678, 1, 1), out
+    # held until accepted
+    for _ in range(3):
+        await FallingEdge(dut.aclk)
+        assert tester.outputs() == out
+    dut.m_axis_tready.value = 1
+    await FallingEdge(dut.aclk)
+    assert dut.ref_m_axis_tvalid.value == 0
+
+
+@cocotb.test()
+async def test_fifo_full_rate(dut):
+    """With valid and ready held high the FIFO passes one word per clock, in order"""
+    tester = AxisFifoTester(dut)
+    await tester.setup()
+
+    words = 500
+    sent = received = 0
+    cycles = 0
+    first_out = None
+    while received < words:
+        # outputs seen now and inputs driven now meet at the next rising edge
+        out = tester.outputs()
+        if out["m_axis_tvalid"] == 1:
+            assert out["m_axis_tdata"] == received, f"word {received}: got {out['m_axis_tdata']}"
+            if first_out is None:
+                first_out = cycles
+            received += 1
+        valid = int(sent < words)
+        if valid:
+            assert out["s_axis_tready"] == 1, f"s_axis_tready dropped at word {sent} with m_axis_tready=1"
+        tester.drive(tvalid=valid, tdata=sent, tready=1)
+        sent += valid
+        await FallingEdge(dut.aclk)
+        cycles += 1
+
+    steady = cycles - first_out
+    dut._log.info(f"{words} words in {cycles} clocks (first word after {first_out})")
+    assert steady == words, f"{words} words took {steady} clocks after the first, expected {words}"
+
+
+@cocotb.test()
+async def test_fifo_capacity_and_prog_flags(dut):
+    """Fill with m_axis_tready low, then drain: capacity, prog_full/prog_empty, order"""
+    tester = AxisFifoTester(dut)
+    await tester.setup()
+    out = tester.outputs()
+    assert (out["prog_full"], out["prog_empty"]) == (0, 1), f"empty FIFO flags: {out}"
+
+    # words accepted when each flag first changed (flags are registered: one clock late)
+    accepted = 0
+    full_at = empty_cleared_at = None
+    while tester.outputs()["s_axis_tready"] == 1:
+        tester.drive(tvalid=1, tdata=accepted)
+        await FallingEdge(dut.aclk)
+        accepted += 1
+        assert accepted <= 2 * tester.depth, "s_axis_tready never dropped"
+        if full_at is None and dut.ref_prog_full.value == 1:
+            full_at = accepted
+        if empty_cleared_at is None and dut.ref_prog_empty.value == 0:
+            empty_cleared_at = accepted
+    tester.drive()
+    await FallingEdge(dut.aclk)
+
+    capacity = tester.depth + PIPELINE_WORDS
+    assert accepted == capacity, f"accepted {accepted} words, expected {capacity}"
+    out = tester.outputs()
+    assert (out["prog_full"], out["prog_empty"]) == (1, 0), f"full FIFO flags: {out}"
+    dut._log.info(f"prog_empty cleared after {empty_cleared_at} words, prog_full set after {full_at}")
+    # prog_empty counts every stored word, prog_full only the RAM (not the output stages)
+    assert tester.prog_empty_thresh < empty_cleared_at <= tester.prog_empty_thresh + 2
+    assert tester.prog_full_thresh + PIPELINE_WORDS < full_at <= tester.prog_full_thresh + PIPELINE_WORDS + 2
+
+    drained = 0
+    dut.m_axis_tready.value = 1
+    while drained < accepted:
+        out = tester.outputs()
+        if out["m_axis_tvalid"] == 1:
+            assert out["m_axis_tdata"] == drained, f"word {drained}: got {out['m_axis_tdata']}"
+            drained += 1
+        await FallingEdge(dut.aclk)
+
+    await FallingEdge(dut.aclk)
+    out = tester.outputs()
+    assert out["m_axis_tvalid"] == 0
+    assert (out["prog_full"], out["prog_empty"]) == (0, 1), f"drained FIFO flags: {out}"
+
+
+@cocotb.test()
+async def test_fifo_random_traffic(dut):
+    """Random valid/ready: every word comes out once, in order"""
+    tester = AxisFifoTester(dut)
+    await tester.setup()
+    rng = random.Random(7)
+
+    sent = received = 0
+    for cycle in range(5000):
+        out = tester.outputs()
+        valid = int(rng.random() < 0.6)
+        ready = int(rng.random() < 0.5)
+        if out["m_axis_tvalid"] == 1 and ready:
+            assert out["m_axis_tdata"] == received, f"cycle {cycle}: expected {received}, got {out['m_axis_tdata']}"
+            received += 1
+        tester.drive(tvalid=valid, tdata=sent, tready=ready)
+        if valid and out["s_axis_tready"] == 1:
+            sent += 1
+        await FallingEdge(dut.aclk)
+
+    dut._log.info(f"random traffic: {sent} sent, {received} received")
+    assert received > 1000
+    assert sent - received <= tester.depth + PIPELINE_WORDS
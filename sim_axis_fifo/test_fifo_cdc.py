@@ -0,0 +1,267 @@
+"""
+Independent-clock AXIS FIFO (make cdc)
+
+top_axis_fifo_cdc holds one axis_fifo_xpm with CLOCKING_MODE="independent_clock":
+s_axis on aclk, m_axis on m_aclk. For every write/read clock ratio in
+CDC_RATIOS (MHz, e.g. "250/100,100/156.25") the tests measure:
+
+    CDC latency      write handshake -> read handshake of a lone beat in an
+                     empty FIFO (ns and read clocks), always-ready reader
+    throughput       sustained beats/us of a CDC_BURST-beat full-rate burst,
+                     against min(write, read) clock
+    overflow-free    peak occupancy of that burst, i.e. the words the FIFO must
+    depth            hold so the writer is never stalled, and the smallest
+                     power-of-two DEPTH that covers it
+
+plus data order under random valid/ready and the wr/rd_data_count outputs.
+Each side is driven and sampled on the falling edge of its own clock, so
+every value read is settled in its domain. FIFO_REPORT=<file.json> writes
+the per-ratio results.
+"""
+
+import json
+import math
+import os
+import random
+
+import cocotb
+import numpy as np
+from cocotb.clock import Clock
+from cocotb.triggers import FallingEdge, Timer
+from cocotb.utils import get_sim_time
+
+from simlib.axis_monitor import read_int
+from simlib.tester import TesterBase
+
+
+FIFO_MODEL = os.environ.get("FIFO_MODEL", "beh")
+FIFO_REPORT = os.environ.get("FIFO_REPORT")
+RATIOS = os.environ.get("CDC_RATIOS", "250/100,100/156.25,156.25/100,100/100")
+BURST_BEATS = int(os.environ.get("CDC_BURST", "512"))
+LATENCY_BEATS = int(os.environ.get("CDC_LATENCY_BEATS", "32"))
+RANDOM_BEATS = int(os.environ.get("CDC_RANDOM_BEATS", "3000"))
+SEED = int(os.environ.get("CDC_SEED", "1"))
+
+PIPELINE_WORDS = 2          # FWFT output stages hold words beyond the RAM
+MIN_DEPTH = 16              # smallest xpm_fifo_axis FIFO_DEPTH
+
+
+def parse_ratios(text):
+    """[(write MHz, read MHz)] from "250/100,100/156.25" """
+    ratios = []
+    for item in text.split(","):
+        if item.strip():
+            write, _, read = item.partition("/")
+            ratios.append((float(write), float(read)))
+    return ratios
+
+
+def min_depth(peak):
+    """Smallest power-of-two DEPTH whose RAM holds peak words (output stages aside)"""
+    words = max(peak - PIPELINE_WORDS, 1)
+    return max(MIN_DEPTH, 1 << math.ceil(math.log2(words)))
+
+
+def _stats(values):
+    values = np.asarray(values, dtype=np.float64)
+    return {"min": round(float(values.min()), 3), "mean": round(float(values.mean()), 3),
+            "max": round(float(values.max()), 3)}
+
+
+class CdcFifoTester(TesterBase):
+    """Write side on aclk, read side on m_aclk, one ratio at a time"""
+
+    def __init__(self, dut):
+        super().__init__(dut)
+        self.m_clock = dut.m_aclk
+        self.depth = int(dut.DEPTH.value)
+        self.data_mask = (1 << len(dut.s_axis_tdata)) - 1
+        self._m_clock_task = None
+        self.write_ns = self.read_ns = None
+
+    async def start(self, write_mhz, read_mhz):
+        """(Re)start both clocks at the given rates and reset the FIFO"""
+        self.write_ns = 1000.0 / write_mhz
+        self.read_ns = 1000.0 / read_mhz
+        self.start_clock(self.write_ns)
+        if self._m_clock_task is not None:
+            self._m_clock_task.kill()
+        period_ps = int(round(self.read_ns * 1000 / 2)) * 2
+        self._m_clock_task = cocotb.start_soon(Clock(self.m_clock, period_ps, units="ps").start())
+        await self.reset()
+
+    async def reset(self):
+        dut = self.dut
+        dut.s_axis_tvalid.value = 0
+        dut.s_axis_tdata.value = 0
+        dut.s_axis_tkeep.value = (1 << len(dut.s_axis_tkeep)) - 1
+        dut.s_axis_tlast.value = 0
+        dut.s_axis_tuser.value = 0
+        dut.m_axis_tready.value = 0
+        dut.aresetn.value = 0
+        # held for 10 cycles of the slower clock (synchronized into both domains)
+        await Timer(int(10 * max(self.write_ns, self.read_ns) * 1000), units="ps")
+        await FallingEdge(self.clock)
+        dut.aresetn.value = 1
+        while not read_int(dut.s_axis_tready) & 1:
+            await FallingEdge(self.clock)
+        self.written = self.read = 0
+        self.peak = 0
+        self.write_times = []
+        self.read_times = []
+        self.order_errors = 0
+        self.stalls = 0
+
+    async def writer(self, beats, valid_prob=1.0, rng=None):
+        """Offer `beats` sequence-numbered beats, each cycle with valid_prob"""
+        dut = self.dut
+        clock = FallingEdge(self.clock)
+        offered = False
+        end = self.written + beats
+        while self.written < end:
+            await clock
+            if not offered:
+                offered = rng is None or rng.random() < valid_prob
+            if not offered:
+                dut.s_axis_tvalid.value = 0
+                continue
+            dut.s_axis_tvalid.value = 1
+            dut.s_axis_tdata.value = self.written & self.data_mask
+            if read_int(dut.s_axis_tready) & 1:
+                # handshake on the coming rising edge
+                self.write_times.append(get_sim_time("ps") / 1000 + self.write_ns / 2)
+                self.written += 1
+                self.peak = max(self.peak, self.written - self.read)
+                offered = False
+            else:
+                self.stalls += 1
+        await clock
+        dut.s_axis_tvalid.value = 0
+
+    async def reader(self, beats, ready_prob=1.0, rng=None):
+        """Take `beats` beats, ready each cycle with ready_prob; checks the order"""
+        dut = self.dut
+        clock = FallingEdge(self.m_clock)
+        end = self.read + beats
+        while self.read < end:
+            await clock
+            ready = rng is None or rng.random() < ready_prob
+            dut.m_axis_tready.value = int(ready)
+            if ready and read_int(dut.m_axis_tvalid) & 1:
+                if (read_int(dut.m_axis_tdata) & self.data_mask) != (self.read & self.data_mask):
+                    self.order_errors += 1
+                self.read_times.append(get_sim_time("ps") / 1000 + self.read_ns / 2)
+                self.read += 1
+        await clock
+        dut.m_axis_tready.value = 0
+
+    async def lone_beat_latency(self, beats):
+        """Latency of isolated beats through the empty FIFO, in ns"""
+        latency = []
+        for _ in range(beats):
+            reader = cocotb.start_soon(self.reader(1))
+            await self.writer(1)
+            await reader
+            latency.append(self.read_times[-1] - self.write_times[-1])
+            # let both pointers settle across the synchronizers
+            for _ in range(8):
+                await FallingEdge(self.m_clock)
+        return latency
+
+    async def burst(self, beats):
+        """Full-rate burst into an always-ready reader: (beats/us, peak words, writer stalls)"""
+        first = len(self.read_times)
+        self.peak = self.written - self.read
+        stalls = self.stalls
+        reader = cocotb.start_soon(self.reader(beats))
+        await self.writer(beats)
+        await reader
+        times = self.read_times[first:]
+        rate = (len(times) - 1) / (times[-1] - times[0]) * 1000 if len(times) > 1 else 0.0
+        return rate, self.peak, self.stalls - stalls
+
+
+@cocotb.test()
+async def test_fifo_cdc_ratios(dut):
+    """CDC latency, sustained throughput and overflow-free depth per clock ratio"""
+    tester = CdcFifoTester(dut)
+    results = []
+    for write_mhz, read_mhz in parse_ratios(RATIOS):
+        await tester.start(write_mhz, read_mhz)
+        latency = await tester.lone_beat_latency(LATENCY_BEATS)
+        rate, peak, stalls = await tester.burst(BURST_BEATS)
+        expected = min(write_mhz, read_mhz)
+        result = {
+            "write_mhz": write_mhz,
+            "read_mhz": read_mhz,
+            "latency_ns": _stats(latency),
+            "latency_read_clocks": _stats(np.asarray(latency) / tester.read_ns),
+            "burst_beats": BURST_BEATS,
+            "beats_per_us": round(rate, 2),
+            "expected_beats_per_us": expected,
+            "efficiency": round(rate / expected, 4),
+            "peak_occupancy": peak,
+            "min_depth": min_depth(peak),
+            "writer_stall_cycles": stalls,
+            "order_errors": tester.order_errors,
+        }
+        results.append(result)
+        dut._log.info(f"{write_mhz:g} -> {read_mhz:g} MHz: latency {result['latency_ns']['mean']} ns "
+                      f"({result['latency_read_clocks']['mean']} read clocks), "
+                      f"{result['beats_per_us']} beats/us of {expected:g} ({result['efficiency']:.1%}), "
+                      f"{BURST_BEATS}-beat burst peaks at {peak} words -> DEPTH >= {result['min_depth']}, "
+                      f"{stalls} writer stalls")
+
+    if FIFO_REPORT:
+        with open(FIFO_REPORT, "w") as f:
+            json.dump({"fifo_model": FIFO_MODEL, "depth": tester.depth, "ratios": results}, f, indent=1)
+            f.write("\n")
+
+    for r in results:
+        ratio = f"{r['write_mhz']:g}/{r['read_mhz']:g}"
+        assert r["order_errors"] == 0, f"{ratio}: {r['order_errors']} beats out of order"
+        assert r["efficiency"] >= 0.97, f"{ratio}: {r['beats_per_us']} beats/us, expected {r['expected_beats_per_us']}"
+        if r["peak_occupancy"] < tester.depth:
+            assert r["writer_stall_cycles"] == 0, f"{ratio}: writer stalled with room in the FIFO"
+
+
+@cocotb.test()
+async def test_fifo_cdc_data_counts(dut):
+    """Data counts settle in both domains: RAM words on the write side, all words on the read side"""
+    tester = CdcFifoTester(dut)
+    write_mhz, read_mhz = parse_ratios(RATIOS)[0]
+    await tester.start(write_mhz, read_mhz)
+
+    words = min(100, tester.depth // 2)
+    await tester.writer(words)
+    for _ in range(10):
+        await FallingEdge(tester.clock)
+        await FallingEdge(tester.m_clock)
+    wr_count, rd_count = read_int(dut.wr_data_count), read_int(dut.rd_data_count)
+    dut._log.info(f"{words} words stored: wr_data_count {wr_count}, rd_data_count {rd_count}")
+    # the FWFT output stages already hold PIPELINE_WORDS of them, outside the RAM
+    assert wr_count == words - PIPELINE_WORDS, f"wr_data_count {wr_count}"
+    assert rd_count == words, f"rd_data_count {rd_count}"
+
+    await tester.reader(words)
+    for _ in range(10):
+        await FallingEdge(tester.clock)
+        await FallingEdge(tester.m_clock)
+    assert read_int(dut.wr_data_count) == 0 and read_int(dut.rd_data_count) == 0
+    assert tester.order_errors == 0
+
+
+@cocotb.test()
+async def test_fifo_cdc_random_traffic(dut):
+    """No loss, duplication or reordering under random valid/ready at every ratio"""
+    tester = CdcFifoTester(dut)
+    for i, (write_mhz, read_mhz) in enumerate(parse_ratios(RATIOS)):
+        await tester.start(write_mhz, read_mhz)
+        wr_rng, rd_rng = random.Random(SEED + 2 * i), random.Random(SEED + 2 * i + 1)
+        reader = cocotb.start_soon(tester.reader(RANDOM_BEATS, ready_prob=0.6, rng=rd_rng))
+        await tester.writer(RANDOM_BEATS, valid_prob=0.7, rng=wr_rng)
+        await reader
+        dut._log.info(f"{write_mhz:g} -> {read_mhz:g} MHz: {tester.read} beats, "
+                      f"{tester.stalls} writer stalls, peak {tester.peak} words")
+        assert tester.read == RANDOM_BEATS and tester.order_errors == 0, \
+            f"{write_mhz:g}/{read_mhz:g}: {tester.order_errors} beats out of order"
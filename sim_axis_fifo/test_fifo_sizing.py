@@ -0,0 +1,165 @@
+"""
+FIFO sizing point (make sizing, driven by sim/fifo_sizing.py)
+
+top_axis_fifo_sizing holds one axis_fifo_xpm with the DEPTH,
+PROG_FULL_THRESH and FIFO_MEMORY_TYPE of the point. The producer offers
+beats per SIZING_PRODUCER (simlib.traffic) and keeps a backlog while
+s_axis_tready is low. The consumer drives m_axis_tready per SIZING_CONSUMER
+(simlib.backpressure.pattern_from_spec). Per point it records:
+
+    latency          write handshake -> read handshake of every beat (cycles)
+    peak occupancy   beats inside the FIFO (written, not yet read)
+    prog_full        first cycle it is seen high, cycles high
+    producer stalls  cycles with a beat to offer and s_axis_tready low
+
+and writes them to FIFO_REPORT (JSON). Beats carry a sequence number, so
+order and loss are checked as well. Driven and sampled on the falling edge
+like test_axis_fifo.py.
+"""
+
+import json
+import os
+
+import cocotb
+import numpy as np
+from cocotb.triggers import FallingEdge
+
+from simlib.axis_monitor import read_int
+from simlib.backpressure import pattern_from_spec
+from simlib.tester import TesterBase
+from simlib.traffic import arrivals
+
+
+CLK_NS = 10
+PRODUCER = os.environ.get("SIZING_PRODUCER", "burst:256:256")
+CONSUMER = os.environ.get("SIZING_CONSUMER", "duty:0.5:period=4")
+CYCLES = int(os.environ.get("SIZING_CYCLES", "20000"))
+SEED = int(os.environ.get("SIZING_SEED", "1"))
+MEMORY_TYPE = os.environ.get("SIZING_MEMORY_TYPE", "auto")
+FIFO_MODEL = os.environ.get("FIFO_MODEL", "beh")
+FIFO_REPORT = os.environ.get("FIFO_REPORT")
+
+
+class FifoSizingTester(TesterBase):
+    def __init__(self, dut):
+        super().__init__(dut)
+        self.depth = int(dut.DEPTH.value)
+        self.prog_full_thresh = int(dut.PROG_FULL_THRESH.value)
+        self.data_mask = (1 << len(dut.s_axis_tdata)) - 1
+
+    async def reset(self, cycles=5):
+        dut = self.dut
+        dut.s_axis_tvalid.value = 0
+        dut.s_axis_tdata.value = 0
+        dut.s_axis_tkeep.value = (1 << len(dut.s_axis_tkeep)) - 1
+        dut.s_axis_tlast.value = 0
+        dut.s_axis_tuser.value = 0
+        dut.m_axis_tready.value = 0
+        dut.aresetn.value = 0
+        for _ in range(cycles):
+            await FallingEdge(self.clock)
+        dut.aresetn.value = 1
+        # the profiles start once the FIFO leaves reset (rst_busy), so the
+        # reset-busy cycles do not count as producer stalls
+        while not read_int(dut.s_axis_tready) & 1:
+            await FallingEdge(self.clock)
+
+    async def measure(self, arrive, ready):
+        """Run len(arrive) cycles; returns the point's measurements"""
+        dut = self.dut
+        n = len(arrive)
+        arrive = arrive.tolist()
+        ready = ready.tolist()
+        write_cycle = np.zeros(n + 1, dtype=np.int64)
+        latency = np.zeros(n + 1, dtype=np.int64)
+        s_tready, m_tvalid, m_tdata, prog_full = (dut.s_axis_tready, dut.m_axis_tvalid,
+                                                  dut.m_axis_tdata, dut.prog_full)
+
+        written = read = backlog = 0
+        stalls = stalled_beats_max = peak = 0
+        prog_full_first = None
+        prog_full_cycles = 0
+        order_errors = 0
+
+        for cycle in range(n):
+            await FallingEdge(self.clock)
+            # outputs seen now and inputs driven now meet at the next rising edge
+            backlog += arrive[cycle]
+            rdy = ready[cycle]
+            if read_int(prog_full) & 1:
+                prog_full_cycles += 1
+                if prog_full_first is None:
+                    prog_full_first = cycle
+            if rdy and read_int(m_tvalid) & 1:
+                if (read_int(m_tdata) & self.data_mask) != (read & self.data_mask):
+                    order_errors += 1
+                latency[read] = cycle - write_cycle[read]
+                read += 1
+            if backlog:
+                dut.s_axis_tdata.value = written & self.data_mask
+                dut.s_axis_tvalid.value = 1
+                if read_int(s_tready) & 1:
+                    write_cycle[written] = cycle
+                    written += 1
+                    backlog -= 1
+                else:
+                    stalls += 1
+                    stalled_beats_max = max(stalled_beats_max, backlog)
+            else:
+                dut.s_axis_tvalid.value = 0
+            dut.m_axis_tready.value = rdy
+            peak = max(peak, written - read)
+
+        lat = latency[:read]
+        return {
+            "cycles": n,
+            "offered": int(sum(arrive)),
+            "written": written,
+            "read": read,
+            "order_errors": order_errors,
+            "producer_stall_cycles": stalls,
+            "producer_backlog_max": stalled_beats_max,
+            "peak_occupancy": peak,
+            "prog_full_first_cycle": prog_full_first,
+            "prog_full_cycles": prog_full_cycles,
+            "latency_min": int(lat.min()) if read else None,
+            "latency_mean": round(float(lat.mean()), 2) if read else None,
+            "latency_max": int(lat.max()) if read else None,
+        }
+
+
+@cocotb.test()
+async def test_fifo_sizing_point(dut):
+    """One (DEPTH, FIFO_MEMORY_TYPE) point under the producer/consumer profiles"""
+    tester = FifoSizingTester(dut)
+    tester.start_clock(CLK_NS)
+    await tester.reset()
+
+    arrive = arrivals(PRODUCER, CYCLES, SEED)
+    ready = pattern_from_spec(CONSUMER, CYCLES, SEED)
+    result = await tester.measure(arrive, ready)
+    result.update({
+        "depth": tester.depth,
+        "prog_full_thresh": tester.prog_full_thresh,
+        "memory_type": MEMORY_TYPE,
+        "fifo_model": FIFO_MODEL,
+        "producer": PRODUCER,
+        "consumer": CONSUMER,
+        "seed": SEED,
+    })
+
+    dut._log.info(f"DEPTH={tester.depth} ({MEMORY_TYPE}, {FIFO_MODEL}) producer={PRODUCER} consumer={CONSUMER}")
+    dut._log.info(f"  {result['written']}/{result['offered']} beats written, {result['read']} read, "
+                  f"producer stalled {result['producer_stall_cycles']} cycles "
+                  f"(backlog up to {result['producer_backlog_max']})")
+    dut._log.info(f"  latency min/mean/max {result['latency_min']}/{result['latency_mean']}/"
+                  f"{result['latency_max']} cycles, peak occupancy {result['peak_occupancy']}")
+    dut._log.info(f"  prog_full (>= {tester.prog_full_thresh}) first at cycle {result['prog_full_first_cycle']}, "
+                  f"high {result['prog_full_cycles']} cycles")
+    if FIFO_REPORT:
+        with open(FIFO_REPORT, "w") as f:
+            json.dump(result, f, indent=1)
+            f.write("\n")
+
+    assert result["order_errors"] == 0, f"{result['order_errors']} beats out of order or corrupted"
+    assert result["peak_occupancy"] <= tester.depth + 2, "FIFO held more than DEPTH + 2 beats"
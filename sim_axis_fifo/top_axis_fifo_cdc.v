@@ -0,0 +1,72 @@
+`timescale 1ns/1ps
+
+// 독립 클럭(CDC) 측정용 탑: CLOCKING_MODE="independent_clock" axis_fifo_xpm 하나
+// aclk = 쓰기(s_axis) 클럭, m_aclk = 읽기(m_axis) 클럭, 두 클럭 주기는 cocotb 테스트가 비율마다 지정
+module top_axis_fifo_cdc #(
+    parameter integer DATA_W = 32,
+    parameter integer KEEP_W = (DATA_W/8),
+    parameter integer USER_W = 1,
+    parameter integer DEPTH  = 1024,
+    parameter integer PROG_FULL_THRESH  = 768,
+    parameter integer PROG_EMPTY_THRESH = 5,
+    parameter integer CDC_SYNC_STAGES   = 2,
+    parameter integer COUNT_W = $clog2(DEPTH) + 1
+)(
+    input  wire                 aclk,
+    input  wire                 m_aclk,
+    input  wire                 aresetn,
+
+    input  wire                 s_axis_tvalid,
+    output wire                 s_axis_tready,
+    input  wire [DATA_W-1:0]    s_axis_tdata,
+    input  wire [KEEP_W-1:0]    s_axis_tkeep,
+    input  wire                 s_axis_tlast,
+    input  wire [USER_W-1:0]    s_axis_tuser,
+
+    output wire                 m_axis_tvalid,
+    input  wire                 m_axis_tready,
+    output wire [DATA_W-1:0]    m_axis_tdata,
+    output wire [KEEP_W-1:0]    m_axis_tkeep,
+    output wire                 m_axis_tlast,
+    output wire [USER_W-1:0]    m_axis_tuser,
+
+    output wire                 prog_full,
+    output wire                 prog_empty,
+    output wire [COUNT_W-1:0]   wr_data_count,
+    output wire [COUNT_W-1:0]   rd_data_count
+);
+
+    axis_fifo_xpm #(
+        .DATA_W              (DATA_W),
+        .KEEP_W              (KEEP_W),
+        .USER_W              (USER_W),
+        .DEPTH               (DEPTH),
+        .PROG_FULL_THRESH    (PROG_FULL_THRESH),
+        .PROG_EMPTY_THRESH   (PROG_EMPTY_THRESH),
+        .CLOCKING_MODE       ("independent_clock"),
+        .CDC_SYNC_STAGES     (CDC_SYNC_STAGES),
+        .WR_DATA_COUNT_WIDTH (COUNT_W),
+        .RD_DATA_COUNT_WIDTH (COUNT_W)
+    ) u_fifo (
+        .aclk          (aclk),
+        .m_aclk        (m_aclk),
+        .aresetn       (aresetn),
+        .s_axis_tvalid (s_axis_tvalid),
+        .s_axis_tready (s_axis_tready),
+        .s_axis_tdata  (s_axis_tdata),
+        .s_axis_tkeep  (s_axis_tkeep),
+        .s_axis_tlast  (s_axis_tlast),
+        .s_axis_tuser  (s_axis_tuser),
+        .m_axis_tvalid (m_axis_tvalid),
+        .m_axis_tready (m_axis_tready),
+        .m_axis_tdata  (m_axis_tdata),
+        .m_axis_tkeep  (m_axis_tkeep),
+        .m_axis_tlast  (m_axis_tlast),
+        .m_axis_tuser  (m_axis_tuser),
+        .prog_full     (prog_full),
+        .prog_empty    (prog_empty),
+        .wr_data_count (wr_data_count),
+        .rd_data_count (rd_data_count)
+    );
+
+endmodule
@@ -0,0 +1,99 @@
+`timescale 1ns/1ps
+
+// axis_fifo_xpm(u_ref)과 axis_fifo_beh(u_beh)를 같은 입력으로 나란히 구동
+// FIFO_MODEL=xpm 이면 u_ref는 xpm_fifo_axis → 두 출력 묶음을 사이클마다 비교해 동치성 확인
+// FIFO_MODEL=beh 이면 두 인스턴스 모두 행동 모델 (타이밍/기능 테스트용)
+module top_axis_fifo_equiv #(
+    parameter integer DATA_W = 32,
+    parameter integer KEEP_W = (DATA_W/8),
+    parameter integer USER_W = 1,
+    parameter integer DEPTH  = 32,
+    parameter integer PROG_FULL_THRESH  = 20,
+    parameter integer PROG_EMPTY_THRESH = 6
+)(
+    input  wire                 aclk,
+    input  wire                 aresetn,
+
+    // s_axis (공통 입력)
+    input  wire                 s_axis_tvalid,
+    input  wire [DATA_W-1:0]    s_axis_tdata,
+    input  wire [KEEP_W-1:0]    s_axis_tkeep,
+    input  wire                 s_axis_tlast,
+    input  wire [USER_W-1:0]    s_axis_tuser,
+    input  wire                 m_axis_tready,
+
+    // u_ref 출력
+    output wire                 ref_s_axis_tready,
+    output wire                 ref_m_axis_tvalid,
+    output wire [DATA_W-1:0]    ref_m_axis_tdata,
+    output wire [KEEP_W-1:0]    ref_m_axis_tkeep,
+    output wire                 ref_m_axis_tlast,
+    output wire [USER_W-1:0]    ref_m_axis_tuser,
+    output wire                 ref_prog_full,
+    output wire                 ref_prog_empty,
+
+    // u_beh 출력
+    output wire                 beh_s_axis_tready,
+    output wire                 beh_m_axis_tvalid,
+    output wire [DATA_W-1:0]    beh_m_axis_tdata,
+    output wire [KEEP_W-1:0]    beh_m_axis_tkeep,
+    output wire                 beh_m_axis_tlast,
+    output wire [USER_W-1:0]    beh_m_axis_tuser,
+    output wire                 beh_prog_full,
+    output wire                 beh_prog_empty
+);
+
+    axis_fifo_xpm #(
+        .DATA_W            (DATA_W),
+        .KEEP_W            (KEEP_W),
+        .USER_W            (USER_W),
+        .DEPTH             (DEPTH),
+        .PROG_FULL_THRESH  (PROG_FULL_THRESH),
+        .PROG_EMPTY_THRESH (PROG_EMPTY_THRESH)
+    ) u_ref (
+        .aclk           (aclk),
+        .m_aclk         (aclk),     // common_clock: 읽기 클럭도 aclk
+        .aresetn        (aresetn),
+        .s_axis_tvalid  (s_axis_tvalid),
+        .s_axis_tready  (ref_s_axis_tready),
+        .s_axis_tdata   (s_axis_tdata),
+        .s_axis_tkeep   (s_axis_tkeep),
+        .s_axis_tlast   (s_axis_tlast),
+        .s_axis_tuser   (s_axis_tuser),
+        .m_axis_tvalid  (ref_m_axis_tvalid),
+        .m_axis_tready  (m_axis_tready),
+        .m_axis_tdata   (ref_m_axis_tdata),
+        .m_axis_tkeep   (ref_m_axis_tkeep),
+        .m_axis_tlast   (ref_m_axis_tlast),
+        .m_axis_tuser   (ref_m_axis_tuser),
+        .prog_full      (ref_prog_full),
+        .prog_empty     (ref_prog_empty)
+    );
+
+    axis_fifo_beh #(
+        .DATA_W            (DATA_W),
+        .KEEP_W            (KEEP_W),
+        .USER_W            (USER_W),
+        .DEPTH             (DEPTH),
+        .PROG_FULL_THRESH  (PROG_FULL_THRESH),
+        .PROG_EMPTY_THRESH (PROG_EMPTY_THRESH)
+    ) u_beh (
+        .aclk           (aclk),
+        .aresetn        (aresetn),
+        .s_axis_tvalid  (s_axis_tvalid),
+        .s_axis_tready  (beh_s_axis_tready),
+        .s_axis_tdata   (s_axis_tdata),
+        .s_axis_tkeep   (s_axis_tkeep),
+        .s_axis_tlast   (s_axis_tlast),
+        .s_axis_tuser   (s_axis_tuser),
+        .m_axis_tvalid  (beh_m_axis_tvalid),
+        .m_axis_tready  (m_axis_tready),
+        .m_axis_tdata   (beh_m_axis_tdata),
+        .m_axis_tkeep   (beh_m_axis_tkeep),
+        .m_axis_tlast   (beh_m_axis_tlast),
+        .m_axis_tuser   (beh_m_axis_tuser),
+        .prog_full      (beh_prog_full),
+        .prog_empty     (beh_prog_empty)
+    );
+
+endmodule
@@ -0,0 +1,63 @@
+`timescale 1ns/1ps
+
+// FIFO 크기 산정(sizing) 스윕용 탑: axis_fifo_xpm 하나를 포트에 그대로 연결
+// DEPTH / PROG_FULL_THRESH / FIFO_MEMORY_TYPE는 sim/fifo_sizing.py가 점마다 파라미터로 지정
+module top_axis_fifo_sizing #(
+    parameter integer DATA_W = 32,
+    parameter integer KEEP_W = (DATA_W/8),
+    parameter integer USER_W = 1,
+    parameter integer DEPTH  = 64,
+    parameter integer PROG_FULL_THRESH  = 48,
+    parameter integer PROG_EMPTY_THRESH = 5,
+    parameter         FIFO_MEMORY_TYPE  = "auto"
+)(
+    input  wire                 aclk,
+    input  wire                 aresetn,
+
+    input  wire                 s_axis_tvalid,
+    output wire                 s_axis_tready,
+    input  wire [DATA_W-1:0]    s_axis_tdata,
+    input  wire [KEEP_W-1:0]    s_axis_tkeep,
+    input  wire                 s_axis_tlast,
+    input  wire [USER_W-1:0]    s_axis_tuser,
+
+    output wire                 m_axis_tvalid,
+    input  wire                 m_axis_tready,
+    output wire [DATA_W-1:0]    m_axis_tdata,
+    output wire [KEEP_W-1:0]    m_axis_tkeep,
+    output wire                 m_axis_tlast,
+    output wire [USER_W-1:0]    m_axis_tuser,
+
+    output wire                 prog_full,
+    output wire                 prog_empty
+);
+
+    axis_fifo_xpm #(
+        .DATA_W            (DATA_W),
+        .KEEP_W            (KEEP_W),
+        .USER_W            (USER_W),
+        .DEPTH             (DEPTH),
+        .PROG_FULL_THRESH  (PROG_FULL_THRESH),
+        .PROG_EMPTY_THRESH (PROG_EMPTY_THRESH),
+        .FIFO_MEMORY_TYPE  (FIFO_MEMORY_TYPE)
+    ) u_fifo (
+        .aclk          (aclk),
+        .m_aclk        (aclk),      // common_clock: 읽기 클럭도 aclk
+        .aresetn       (aresetn),
+        .s_axis_tvalid (s_axis_tvalid),
+        .s_axis_tready (s_axis_tready),
+        .s_axis_tdata  (s_axis_tdata),
+        .s_axis_tkeep  (s_axis_tkeep),
+        .s_axis_tlast  (s_axis_tlast),
+        .s_axis_tuser  (s_axis_tuser),
+        .m_axis_tvalid (m_axis_tvalid),
+        .m_axis_tready (m_axis_tready),
+        .m_axis_tdata  (m_axis_tdata),
+        .m_axis_tkeep  (m_axis_tkeep),
+        .m_axis_tlast  (m_axis_tlast),
+        .m_axis_tuser  (m_axis_tuser),
+        .prog_full     (prog_full),
+        .prog_empty    (prog_empty)
+    );
+
+endmodule
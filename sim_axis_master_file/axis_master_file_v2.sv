@@ -16,7 +16,8 @@ module axis_master_file_v2 #(
   input  logic        i_restart,      // 전송 중/대기 중 관계없이 인덱스 0으로 리와인드
   input  logic        i_pause,        // 1=일시정지(핸드셰이크 중단), 0=재개
   input  logic [31:0] i_gap_cycles,   // 워드 간 삽입 갭 사이클(런타임 반영)
-  input  logic        i_reload,       // 파일 재로드(현재 FILE_PATH에서 다시 읽기)
+  input  logic        i_reload,       // 파일 재로드(현재 FILE_PATH/plusarg에서 다시 읽기)
+  input  logic        i_stream,       // 1=스트리밍 모드(핸드셰이크 후 tvalid 유지, 갭 0이면 매 클럭 1워드)
 
   // ---- 상태 모니터링 출력 ----
   output logic        o_busy,         // 전송 중(핸드셰이크 진행 포함)
@@ -31,78 +32,86 @@ module axis_master_file_v2 #(
   output logic        m_axis_tlast
 );
   typedef bit [31:0] word_t;
-  word_t q[$];            // 파일에서 읽은 워드 큐
+  // 파일에서 읽은 워드 저장소(큐): Icarus/Verilator 모두 동적 배열로의 $fread를 지원하지 않으므로
+  // 고정 크기 메모리로 청크 단위 $fread 후 큐에 적재 (시뮬레이터 공통 경로)
+  word_t q[$];
   int unsigned idx;       // 현재 전송 인덱스
   int unsigned gap_cnt;   // 갭 카운터
 
   // -------- 파일 로더 --------
-  function void load_csv_hex(string path);
-    int fd; string line; word_t w;
-    q.delete();
+  // CSV: $fscanf로 토큰 단위 파싱(줄 단위 $fgets+$sscanf 문자열 생성 없음).
+  //      파싱할 수 없는 줄은 건너뜀(기존 동작과 동일, 첫 컬럼만 사용).
+  //      automatic: 정적 함수면 tmp 큐가 호출 간에 남아 i_reload마다 워드가 누적됨.
+  function automatic void load_csv(string path, bit is_hex);
+    int fd; int r; string line; word_t w;
+    word_t tmp[$];
     fd = $fopen(path, "r");
-    if (!fd) $fatal(1, "[axis_v2] CSV hex open fail: %s", path);
-    while (!$feof(fd)) begin
-      line = "";
-      void'($fgets(line, fd));
-      if ($sscanf(line, "%h", w) == 1) q.push_back(w);
+    if (!fd) $fatal(1, "[axis_v2] CSV %s open fail: %s", is_hex ? "hex" : "dec", path);
+    forever begin
+      r = is_hex ? $fscanf(fd, "%h", w) : $fscanf(fd, "%d", w);
+      if (r == 1) tmp.push_back(w);
+      else begin
+        if ($feof(fd)) break;
+        void'($fgets(line, fd));   // 나머지 컬럼/잘못된 줄 소모
+      end
     end
     $fclose(fd);
-    $display("[axis_v2] CSV hex loaded: %0d words", q.size());
+    q = tmp;
+    $display("[axis_v2] CSV %s loaded: %0d words", is_hex ? "hex" : "dec", q.size());
   endfunction
 
-  function void load_csv_dec(string path);
-    int fd; string line; word_t w;
-    q.delete();
-    fd = $fopen(path, "r");
-    if (!fd) $fatal(1, "[axis_v2] CSV dec open fail: %s", path);
-    while (!$feof(fd)) begin
-      line = "";
-      void'($fgets(line, fd));
-      if ($sscanf(line, "%d", w) == 1) q.push_back(w);
-    end
-    $fclose(fd);
-    $display("[axis_v2] CSV dec loaded: %0d words", q.size());
-  endfunction
+  // BIN: BIN_CHUNK_WORDS 워드 고정 메모리에 $fread(호출당 최대 16 KB)로 읽어 큐에 바로 적재.
+  //      $fread는 워드를 빅엔디언(파일 바이트 순서 그대로)으로 채우므로
+  //      빅엔디언 파일(sim/stim_convert.py 기본 출력)은 그대로, 리틀엔디언 파일만 워드별 바이트 스왑.
+  localparam int BIN_CHUNK_WORDS = 4096;
+  logic [31:0] bin_chunk [0:BIN_CHUNK_WORDS-1];
 
   function void load_bin(string path, bit little_endian);
     int fd;
     int r;
-    byte buffer[$];
-    byte tmp[4096];
-    int words;
-    int i;
-    int base;
-    word_t w;
+    int n_bytes;
+    logic [31:0] w;
 
-    q.delete();
+    if (DATA_BYTES != 4)  $fatal(1, "DATA_BYTES must be 4 for 32b.");
     fd = $fopen(path, "rb");
     if (!fd) $fatal(1, "[axis_v2] BIN open fail: %s", path);
+    q.delete();
+    n_bytes = 0;
     do begin
-      r = $fread(tmp, fd);
-      for (i=0; i<r; i++) buffer.push_back(tmp[i]);
-    end while (r == $size(tmp));
+      r = $fread(bin_chunk, fd);
+      if (r < 0) r = 0;
+      for (int i = 0; i < r/DATA_BYTES; i++) begin
+        w = bin_chunk[i];
+        if (little_endian) w = {w[7:0], w[15:8], w[23:16], w[31:24]};
+        q.push_back(w);
+      end
+      n_bytes += r;
+    end while (r == BIN_CHUNK_WORDS*DATA_BYTES);
     $fclose(fd);
-    if (DATA_BYTES != 4)  $fatal(1, "DATA_BYTES must be 4 for 32b.");
-    words = buffer.size()/DATA_BYTES;
-    for (i=0; i<words; i++) begin
-      base = i*4;
-      if (little_endian) w = {buffer[base+3],buffer[base+2],buffer[base+1],buffer[base+0]};
-      else               w = {buffer[base+0],buffer[base+1],buffer[base+2],buffer[base+3]};
-      q.push_back(w);
-    end
-    if ((buffer.size()%4)!=0)
-      $display("[axis_v2] WARN trailing %0d byte(s) ignored", buffer.size()%4);
+    if ((n_bytes%4)!=0)
+      $display("[axis_v2] WARN trailing %0d byte(s) ignored", n_bytes%4);
     $display("[axis_v2] BIN loaded: %0d words", q.size());
   endfunction
 
-  task automatic reload_file();
-    if (FILE_TYPE == "csv_hex")      load_csv_hex(FILE_PATH);
-    else if (FILE_TYPE == "csv_dec") load_csv_dec(FILE_PATH);
-    else if (FILE_TYPE == "bin")      load_bin(FILE_PATH, LITTLE_ENDIAN);
-    else $fatal(1, "Unknown FILE_TYPE: %s (use csv_hex, csv_dec, or bin)", FILE_TYPE);
-  endtask
+  // 파라미터가 기본값, 런타임 plusarg(+FILE_PATH= +FILE_TYPE= +LITTLE_ENDIAN=)가 있으면 우선
+  function void reload_file();
+    string path;
+    string ftype;
+    int    le;
+    path  = FILE_PATH;
+    ftype = FILE_TYPE;
+    le    = LITTLE_ENDIAN;
+    void'($value$plusargs("FILE_PATH=%s", path));
+    void'($value$plusargs("FILE_TYPE=%s", ftype));
+    void'($value$plusargs("LITTLE_ENDIAN=%d", le));
+    if (ftype == "csv_hex")      load_csv(path, 1'b1);
+    else if (ftype == "csv_dec") load_csv(path, 1'b0);
+    else if (ftype == "bin")     load_bin(path, le != 0);
+    else $fatal(1, "Unknown FILE_TYPE: %s (use csv_hex, csv_dec, or bin)", ftype);
+  endfunction
 
   // -------- 초기화/리로드 트리거는 메인 always_ff 블록에서 처리 --------
+  // (리로드 시 파일 재적재는 아래 별도 always 블록: q는 initial에서도 쓰므로 always_ff 밖에 둠)
 
   // -------- 메인 시퀀서(FSM-less, 명시적 가드) --------
   typedef enum logic [1:0] {IDLE, SEND, GAP} state_t;
@@ -184,8 +193,15 @@ module axis_master_file_v2 #(
                 // 모드에 따라 분기
                 if (i_loop) begin
                   idx           <= 0;
-                  m_axis_tvalid <= 1'b0;
-                  m_axis_tlast  <= 1'b0;
+                  if (i_stream && i_gap_cycles==0) begin
+                    // 스트리밍: 루프 경계에서도 tvalid 유지, 0번 워드 바로 제시
+                    m_axis_tdata  <= q[0];
+                    m_axis_tvalid <= 1'b1;
+                    m_axis_tlast  <= (q.size()==1);
+                  end else begin
+                    m_axis_tvalid <= 1'b0;
+                    m_axis_tlast  <= 1'b0;
+                  end
                   // 갭 적용
                   gap_cnt       <= (i_gap_cycles==0)?0:i_gap_cycles-1;
                   state         <= (i_gap_cycles==0) ? SEND : GAP;
@@ -200,8 +216,15 @@ module axis_master_file_v2 #(
               else begin
                 // 다음 워드로 진행
                 idx           <= idx + 1;
-                m_axis_tvalid <= 1'b0;    // 다음 사이클에 재어설트
-                m_axis_tlast  <= 1'b0;
+                if (i_stream && i_gap_cycles==0) begin
+                  // 스트리밍: tvalid 유지, 다음 워드 바로 제시(매 클럭 1워드)
+                  m_axis_tdata  <= q[idx+1];
+                  m_axis_tvalid <= 1'b1;
+                  m_axis_tlast  <= (idx+1 == q.size()-1);
+                end else begin
+                  m_axis_tvalid <= 1'b0;    // 다음 사이클에 재어설트
+                  m_axis_tlast  <= 1'b0;
+                end
                 // 갭 적용
                 gap_cnt       <= (i_gap_cycles==0)?0:i_gap_cycles-1;
                 state         <= (i_gap_cycles==0) ? SEND : GAP;
@@ -211,22 +234,33 @@ module axis_master_file_v2 #(
         end
 
         GAP: begin
+          m_axis_tvalid <= 1'b0;
+          m_axis_tlast  <= 1'b0;
+          o_busy        <= 1'b1;
           // 갭 카운트 소모 (i_pause가 걸리면 그냥 정지된 상태 유지)
           if (!i_pause) begin
             if (gap_cnt == 0) begin
               state <= SEND;
+              // 스트리밍: 갭 종료와 동시에 워드 제시 → 워드 간 정확히 i_gap_cycles 유휴
+              if (i_stream) begin
+                m_axis_tdata  <= q[idx];
+                m_axis_tvalid <= 1'b1;
+                m_axis_tlast  <= (idx == q.size()-1);
+              end
             end else begin
               gap_cnt <= gap_cnt - 1;
             end
           end
-          m_axis_tvalid <= 1'b0;
-          m_axis_tlast  <= 1'b0;
-          o_busy        <= 1'b1;
         end
       endcase
     end
   end
 
+  // i_reload: 인덱스 리셋(위 always_ff)과 함께 파일을 실제로 다시 읽음
+  always @(posedge aclk) begin
+    if (aresetn && i_reload) reload_file();
+  end
+
   // 초기 파일 자동 로드(옵션)
   initial begin
     // 시뮬레이터에 따라 reset 이전 파일 접근이 싫다면 주석 처리하세요.
@@ -0,0 +1,124 @@
+"""
+axis_master_file_v2 성능 벤치마크 (make bench)
+
+고정 매트릭스(i_gap_cycles × 백프레셔 밀도 × 루프/원샷)를 돌며 측정점마다 기록:
+  words_per_clk    수신 워드 / 시뮬레이션 클럭 (RTL 처리율)
+  cycles_per_s     시뮬레이션 클럭 / 벽시계 초 (시뮬레이터 + 테스트벤치 속도)
+  cpu_us_per_beat  프로세스 CPU 시간 / 수신 워드 [us] (시뮬레이터 커널 포함)
+
+결과는 JSON 히스토리(BENCH_HISTORY, 기본 bench_history.json)에 한 실행씩 추가되고,
+make bench-compare(= sim/bench_compare.py)로 직전 실행과 비교해 회귀를 표시합니다.
+
+환경 변수: BENCH_BEATS(측정점당 워드 수, 기본 5000), BENCH_STREAM(i_stream, 기본 1),
+BENCH_SEED(백프레셔 시드), BENCH_PATTERN(markov|bernoulli|duty|lfsr), BENCH_LABEL(히스토리에 남길 설명)
+"""
+
+import os
+import time
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import Event, First, RisingEdge
+from cocotb.utils import get_sim_time
+
+from simlib.axis_monitor import AxisHandshakeMonitor
+from simlib.backpressure import BackpressureDriver, make_pattern
+from simlib.bench import append_history
+from test_master_file import AxisMasterTester
+
+
+CLK_NS = 10
+
+# 고정 매트릭스 (히스토리 간 비교를 위해 바꾸지 말 것; 바꾸면 측정점 이름이 달라짐)
+GAPS = (0, 1, 4)
+BACKPRESSURE = (0.0, 0.25, 0.5)     # tready=0 비율
+MODES = ("loop", "oneshot")
+BENCH_PATTERN = os.environ.get("BENCH_PATTERN", "markov")   # simlib.backpressure 패턴 종류
+
+
+async def run_point(dut, tester, gap, density, mode, beats, stream, seed):
+    await tester.reset_dut()
+    dut.i_stream.value = stream
+    dut.i_gap_cycles.value = gap
+    dut.i_loop.value = 1 if mode == "loop" else 0
+
+    count = 0
+    reached = Event()
+
+    def on_beat(beat):
+        nonlocal count
+        count += 1
+        if count == beats:
+            reached.set()
+
+    monitor = AxisHandshakeMonitor(dut.aclk, dut.m_axis_tvalid, dut.m_axis_tready,
+                                   dut.m_axis_tdata, dut.m_axis_tlast, callback=on_beat)
+    monitor_task = cocotb.start_soon(monitor.run())
+    bp_task = None
+    if density > 0:
+        # 측정 전에 패턴을 미리 생성(시드 고정) → 측정 구간에는 tready 변경 사이클만 깨어남
+        pattern = make_pattern(BENCH_PATTERN, 1 << 16, density, seed, mean_stall=4.0)
+        bp_task = cocotb.start_soon(BackpressureDriver(dut.aclk, dut.m_axis_tready, pattern).run())
+
+    t_sim0 = get_sim_time("ns")
+    wall0 = time.perf_counter()
+    cpu0 = time.process_time()
+
+    dut.i_start.value = 1
+    await RisingEdge(dut.aclk)
+    dut.i_start.value = 0
+    if mode == "loop":
+        await reached.wait()
+    else:
+        await First(RisingEdge(dut.o_done_pulse), reached.wait())
+
+    cycles = (get_sim_time("ns") - t_sim0) / CLK_NS
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+
+    monitor_task.kill()
+    if bp_task is not None:
+        bp_task.kill()
+    dut.i_loop.value = 0
+    dut.m_axis_tready.value = 1
+
+    return {
+        "name": f"gap{gap}_bp{density:.2f}_{mode}",
+        "gap": gap, "backpressure": density, "pattern": BENCH_PATTERN, "mode": mode, "stream": stream,
+        "beats": count, "cycles": cycles,
+        "words_per_clk": count / cycles if cycles else 0.0,
+        "cycles_per_s": cycles / wall if wall else 0.0,
+        "cpu_us_per_beat": cpu / count * 1e6 if count else 0.0,
+        "wall_s": wall,
+    }
+
+
+@cocotb.test()
+async def bench_matrix(dut):
+    """gap × 백프레셔 × 루프/원샷 매트릭스 성능 측정 후 히스토리에 기록"""
+    tester = AxisMasterTester(dut)
+    cocotb.start_soon(Clock(dut.aclk, CLK_NS, units="ns").start())
+
+    beats = int(os.environ.get("BENCH_BEATS", "5000"))
+    stream = int(os.environ.get("BENCH_STREAM", "1"))
+    seed = int(os.environ.get("BENCH_SEED", "1"))
+    history = os.environ.get("BENCH_HISTORY", "bench_history.json")
+
+    # 원샷은 파일 한 바퀴가 끝이므로 측정 워드 수를 파일 길이로 제한
+    tester.load_expected_data()
+    oneshot_beats = min(beats, len(tester.expected_data))
+
+    points = []
+    dut._log.info(f"{'point':<22} {'words/clk':>9} {'cycles/s':>10} {'cpu us/beat':>11}")
+    for mode in MODES:
+        for gap in GAPS:
+            for density in BACKPRESSURE:
+                n = beats if mode == "loop" else oneshot_beats
+                p = await run_point(dut, tester, gap, density, mode, n, stream, seed)
+                points.append(p)
+                dut._log.info(f"{p['name']:<22} {p['words_per_clk']:>9.3f} "
+                              f"{p['cycles_per_s']:>10.0f} {p['cpu_us_per_beat']:>11.1f}")
+
+    run = append_history(history, points, label=os.environ.get("BENCH_LABEL", ""),
+                         sim=cocotb.SIM_NAME, extra={"beats": beats})
+    dut._log.info(f"benchmark run recorded in {history} ({run['time']}, rev {run['rev']})")
@@ -1,52 +1,115 @@
-import pandas as pd
+#!/usr/bin/env python3
+"""
+axis_master_file_v2용 사인파 자극 파일 생성기
+
+기본값(인자 없이 실행)은 기존 data.csv와 동일한 데이터를 만듭니다:
+  5kHz 샘플링, 1초(+1 샘플), 50Hz 톤, Q1.31 (sin * (2**31 - 1), 소수점 이하 버림)
+
+예)
+  python generate_data.py                                   # data.csv (csv_dec)
+  python generate_data.py --format csv_hex -o data_hex.csv  # 2의 보수 hex
+  python generate_data.py --format bin -o soak.bin --duration 3600 --tone 50 --tone 440:0.25
+  python generate_data.py --plot                            # PNG도 생성(matplotlib 필요)
+
+고정 크기 청크 단위로 계산/포맷/기록하므로 메모리 사용량이 길이에 무관하고,
+pandas를 쓰지 않으며 matplotlib은 --plot일 때만 import 합니다.
+"""
+
+import argparse
+import os
+import sys
+
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sim"))
+
+from simlib.stimulus import FILE_TYPES, write_stimulus  # noqa: E402
+
+
+DEFAULT_OUTPUT = {"csv_dec": "data.csv", "csv_hex": "data_hex.csv", "bin": "data.bin"}
+
+
+def parse_tone(text):
+    """'FREQ' 또는 'FREQ:AMP' -> (freq, amp)"""
+    freq, _, amp = text.partition(":")
+    return float(freq), float(amp) if amp else 1.0
+
 
-# sin 256개 데이터 생성(Q32 Fixed)
-# sampling 5khz
-# 500hz 1초 데이터
-sample_rate = 5000
-sample_time_sec = 1
-sample_data = sample_time_sec * sample_rate + 1
+def sample_chunks(n_samples, sample_rate, tones, amplitude, frac_bits, chunk):
+    """청크 단위로 고정소수점 샘플(int64) 생성"""
+    scale = 2**frac_bits - 1
+    lo, hi = -(2**31), 2**31 - 1
+    for start in range(0, n_samples, chunk):
+        x = np.arange(start, min(start + chunk, n_samples))
+        sig = np.zeros(len(x))
+        for freq, amp in tones:
+            # 기존 스크립트와 같은 연산 순서(비트 단위로 같은 결과)
+            sig += amp * np.sin(x * 2 * np.pi * freq / sample_rate)
+        if amplitude != 1.0:
+            sig *= amplitude
+        # 소수점 이하 버림(astype(int)와 동일), 32비트 범위로 포화
+        yield x, np.clip(np.trunc(sig * scale), lo, hi).astype(np.int64)
 
-# 500hz 1초 데이터
-freq_1 = 50  # 이 값을 변경하면 다른 주파수의 1주기를 볼 수 있습니다
 
-x = np.arange(0, sample_data)
-sin_data = np.sin(x * 2 * np.pi * freq_1 / sample_rate)
-sin_data = (sin_data * (2**31 - 1)).astype(int)
+def plot(t, data, sample_rate, freq):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
+    plt.plot(t, data)
+    plt.grid(True)
+    plt.savefig('sin_data.png')
 
-# sin_data = x * 10
+    # freq 1 사이클 데이터 확인 (1주기 = sample_rate / freq)
+    # 정확한 1주기를 위해 +1을 추가 (시작점과 끝점 모두 포함)
+    length = int(sample_rate / freq) + 1
 
+    plt.figure(figsize=(10, 5))
+    plt.plot(t[:length], data[:length])
+    plt.title(f'One Cycle of {freq:g}Hz Signal (Period: {1/freq:.3f}s)')
+    plt.xlabel('Time (seconds)')
+    plt.ylabel('Amplitude (Q32 Fixed)')
+    plt.grid(True)
+    plt.savefig('sin_data_length.png')
 
-data = pd.DataFrame({
-    'data': sin_data
-})
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="axis_master_file_v2용 사인파 자극 파일 생성")
+    parser.add_argument("--fs", type=float, default=5000, help="샘플링 주파수 [Hz] (기본 5000)")
+    parser.add_argument("--duration", type=float, default=1.0, help="길이 [s] (기본 1, 샘플 수 = fs*duration + 1)")
+    parser.add_argument("--samples", type=int, help="샘플 수 직접 지정 (--duration 대신)")
+    parser.add_argument("--tone", action="append", type=parse_tone, metavar="FREQ[:AMP]",
+                        help="톤 추가 (반복 가능, 기본 50Hz 1개)")
+    parser.add_argument("--amplitude", type=float, default=1.0, help="전체 진폭 배율 (기본 1.0 = 풀스케일)")
+    parser.add_argument("--frac-bits", type=int, default=31, help="Q 포맷 소수부 비트 수 (기본 31 = Q1.31)")
+    parser.add_argument("--format", choices=FILE_TYPES, default="csv_dec", help="출력 형식 (기본 csv_dec)")
+    parser.add_argument("--little-endian", type=int, choices=(0, 1), default=1,
+                        help="bin 바이트 순서 (기본 1, RTL LITTLE_ENDIAN과 맞출 것)")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본: 형식별 data.csv / data_hex.csv / data.bin)")
+    parser.add_argument("--chunk", type=int, default=1 << 20, help="청크 크기 [샘플] (기본 1M)")
+    parser.add_argument("--plot", action="store_true", help="sin_data.png / sin_data_length.png 생성")
+    args = parser.parse_args(argv)
 
-data.to_csv('data.csv', index=False, header=False)
+    if not 0 < args.frac_bits <= 31:
+        parser.error("--frac-bits must be in 1..31")
+    tones = args.tone or [(50.0, 1.0)]
+    n_samples = args.samples if args.samples is not None else int(args.duration * args.fs) + 1
+    output = args.output or DEFAULT_OUTPUT[args.format]
 
-# Hex format CSV 생성
-data_hex = data.copy()
-data_hex['data'] = data_hex['data'].apply(lambda x: f"0x{x:08X}")
-data_hex.to_csv('data_hex.csv', index=False, header=False)
+    first = None
+    with open(output, "wb") as f:
+        for x, data in sample_chunks(n_samples, args.fs, tones, args.amplitude, args.frac_bits, args.chunk):
+            write_stimulus(f, data, args.format, bool(args.little_endian))
+            if first is None:
+                first = (x / args.fs, data)
 
+    print(f"{output}: {n_samples} samples ({args.format})")
 
-t = x / sample_rate
-import matplotlib.pyplot as plt
-plt.plot(t, sin_data)
-plt.grid(True)
-plt.savefig('sin_data.png')
+    if args.plot and first is not None:
+        # 첫 청크만 그림 (긴 스트림도 부담 없이)
+        plot(first[0], first[1], args.fs, tones[0][0])
+    return 0
 
-# freq_1 1 사이클 데이터 확인 (1주기 = sample_rate / freq_1)
-# 정확한 1주기를 위해 +1을 추가 (시작점과 끝점 모두 포함)
-length = int(sample_rate / freq_1) + 1
 
-plt.figure(figsize=(10, 5))
-plt.plot(t[:length], sin_data[:length])
-plt.title(f'One Cycle of {freq_1}Hz Signal (Period: {1/freq_1:.3f}s)')
-plt.xlabel('Time (seconds)')
-plt.ylabel('Amplitude (Q32 Fixed)')
-plt.grid(True)
-plt.savefig('sin_data_length.png')
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,8 @@ from cocotb.triggers import Timer
 from cocotb.result import TestFailure
 import random
 
+from simlib import golden
+
 
 @cocotb.test()
 async def test_dataover_basic(dut):
@@ -112,7 +114,7 @@ async def test_dataover_random(dut):
         dut.threshold.value = threshold
         await Timer(10, units="ns")
 
-        expected = 1 if data_in > threshold else 0
+        expected = int(golden.dataover(data_in, threshold))
         actual = int(dut.data_over.value)
 
         assert actual == expected, \
@@ -267,7 +269,7 @@ async def test_dataover_boundary_conditions(dut):
                 dut.threshold.value = threshold
                 await Timer(10, units="ns")
 
-                expected = 1 if data_in > threshold else 0
+                expected = int(golden.dataover(data_in, threshold))
                 actual = int(dut.data_over.value)
 
                 assert actual == expected, \
@@ -0,0 +1,43 @@
+// vec_dataover.sv
+// Vector-engine wrapper for `make vectors` (sim/vectors.mk): sim/vec_player.sv
+// feeds dataover one {data_in, threshold} vector per clock.
+`timescale 1ns/1ps
+
+module vec_dataover #(
+    parameter integer DEPTH = 65536
+)(
+    input  wire        aclk,
+    input  wire        load,
+    input  wire        start,
+    input  wire        dump,
+    input  wire [31:0] count,
+    output wire        busy,
+    output wire        done
+);
+
+  wire [63:0] vec_in;
+  wire        data_over;
+
+  vec_player #(
+    .IN_W  (64),
+    .OUT_W (1),
+    .DEPTH (DEPTH)
+  ) u_player (
+    .aclk    (aclk),
+    .load    (load),
+    .start   (start),
+    .dump    (dump),
+    .count   (count),
+    .busy    (busy),
+    .done    (done),
+    .vec_in  (vec_in),
+    .vec_out (data_over)
+  );
+
+  dataover u_dataover (
+    .data_in   (vec_in[63:32]),
+    .threshold (vec_in[31:0]),
+    .data_over (data_over)
+  );
+
+endmodule
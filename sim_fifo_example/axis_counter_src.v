@@ -4,7 +4,10 @@ module axis_counter_src #(
     parameter integer DATA_W = 32,
     parameter integer KEEP_W = (DATA_W/8),
     parameter integer USER_W = 1,
-    parameter integer FRAME_BEATS = 8
+    parameter integer FRAME_BEATS = 8,
+    // 비트마다 핸드셰이크 후 쉬는 사이클 수 (0: 매 클럭 전송, 1: 절반 속도 ...)
+    // 시뮬레이션에서는 +SRC_BEAT_GAP=N 으로 덮어쓸 수 있음
+    parameter integer BEAT_GAP    = 0
 )(
     input  wire                 aclk,
     input  wire                 aresetn,
@@ -22,6 +25,14 @@ module axis_counter_src #(
     reg [31:0] frame_id;
     reg [4:0]  wait_cnt;  // 16 clock wait counter (5 bits for 0-15)
     reg        waiting;   // wait state flag
+    reg [31:0] gap_cnt;   // BEAT_GAP 남은 사이클
+
+    reg [31:0] beat_gap = BEAT_GAP;
+    // synthesis translate_off
+    initial begin
+        if ($value$plusargs("SRC_BEAT_GAP=%d", beat_gap)) ;
+    end
+    // synthesis translate_on
 
     assign wait_done = (~waiting);
 
@@ -36,6 +47,7 @@ module axis_counter_src #(
             frame_id      <= 32'd0;
             wait_cnt      <= 5'd0;
             waiting       <= 1'b0;
+            gap_cnt       <= 32'd0;
         end else begin
             if (waiting) begin
                 // Wait state: no transmission, just count
@@ -49,8 +61,18 @@ module axis_counter_src #(
                 end else begin
                     wait_cnt <= wait_cnt + 1;
                 end
-            end else begin
+            end else if (gap_cnt != 32'd0) begin
+                // 비트 사이 쉬는 구간 (tvalid=0)
+                gap_cnt <= gap_cnt - 1;
+            end else if (m_axis_tvalid && m_axis_tready && beat_gap != 32'd0) begin
+                // 이번 에지에서 소비된 비트 뒤에 BEAT_GAP 사이클 쉼
+                m_axis_tvalid <= 1'b0;
+                m_axis_tlast  <= 1'b0;
+                gap_cnt       <= beat_gap - 1;
+            end else if (!m_axis_tvalid || m_axis_tready) begin
                 // Normal transmission mode
+                // 출력 레지스터가 비어 있거나 이번 에지에서 소비될 때만 다음 비트를 적재
+                // (백프레셔 중에는 tdata/tlast 유지, 핸드셰이크마다 카운터 1 증가)
                 m_axis_tvalid <= 1'b1;
 
                 // 데이터 패턴: {frame_id, beat_cnt}의 하위에 매핑(폭이 다르면 자동 절단)
@@ -60,16 +82,14 @@ module axis_counter_src #(
                 // 프레임 끝(TLAST) 지정
                 m_axis_tlast  <= (beat_cnt == (FRAME_BEATS-1));
 
-                if (m_axis_tvalid && m_axis_tready) begin
-                    if (beat_cnt == (FRAME_BEATS-1)) begin
-                        // Frame complete - start wait period
-                        beat_cnt <= 32'd0;
-                        frame_id <= frame_id + 1;
-                        // waiting  <= 1'b1;
-                        wait_cnt <= 5'd0;
-                    end else begin
-                        beat_cnt <= beat_cnt + 1;
-                    end
+                if (beat_cnt == (FRAME_BEATS-1)) begin
+                    // Frame complete - start wait period
+                    beat_cnt <= 32'd0;
+                    frame_id <= frame_id + 1;
+                    // waiting  <= 1'b1;
+                    wait_cnt <= 5'd0;
+                end else begin
+                    beat_cnt <= beat_cnt + 1;
                 end
             end
         end
@@ -4,7 +4,18 @@ module axis_fifo_example_top #(
     parameter integer DATA_W  = 32,
     parameter integer KEEP_W  = (DATA_W/8),
     parameter integer USER_W  = 1,
-    parameter integer FRAME_BEATS = 8  // 한 프레임 당 비트(beat) 수
+    parameter integer FRAME_BEATS = 8, // 한 프레임 당 비트(beat) 수
+    parameter integer SRC_BEAT_GAP = 0, // 소스가 비트마다 쉬는 사이클 (+SRC_BEAT_GAP plusarg 우선)
+    // FIFO 모드: "false" cut-through, "true" 패킷(store-and-forward, FRAME_BEATS <= 1024)
+    parameter         PACKET_FIFO = "false",
+    // 싱크 tready 패턴 (axis_sink_checker 참고, 시뮬레이션에서는 +SINK_* plusarg 우선)
+    parameter integer SINK_READY_MODE   = 0,   // 0 항상, 1 듀티, 2 LFSR, 3 버스트-스톨
+    parameter integer SINK_DUTY_PERIOD  = 4,
+    parameter integer SINK_DUTY_STALL   = 2,
+    parameter [15:0]  SINK_LFSR_SEED    = 16'hACE1,
+    parameter integer SINK_STALL_THRESH = 128,
+    parameter integer SINK_BURST_BEATS  = 64,
+    parameter integer SINK_BURST_STALL  = 32
 )(
     input  wire                   aclk,
     input  wire                   aresetn
@@ -35,7 +46,8 @@ module axis_fifo_example_top #(
         .DATA_W(DATA_W),
         .KEEP_W(KEEP_W),
         .USER_W(USER_W),
-        .FRAME_BEATS(FRAME_BEATS)
+        .FRAME_BEATS(FRAME_BEATS),
+        .BEAT_GAP(SRC_BEAT_GAP)
     ) u_src (
         .aclk(aclk),
         .aresetn(aresetn),
@@ -53,9 +65,11 @@ module axis_fifo_example_top #(
         .DATA_W(DATA_W),
         .KEEP_W(KEEP_W),
         .USER_W(USER_W),
-        .DEPTH(1024)
+        .DEPTH(1024),
+        .PACKET_FIFO(PACKET_FIFO)
     ) u_fifo (
         .aclk           (aclk),
+        .m_aclk         (aclk),     // common_clock: 읽기 클럭도 aclk
         .aresetn        (aresetn),
 
         .s_axis_tvalid  (s_tvalid),
@@ -76,11 +90,18 @@ module axis_fifo_example_top #(
         .prog_empty     ()
     );
 
-    // 3) 소비자(싱크) — TREADY로 백프레셔 생성(토글)
+    // 3) 소비자(싱크) — TREADY로 백프레셔 생성 (SINK_READY_MODE)
     axis_sink_checker #(
         .DATA_W(DATA_W),
         .KEEP_W(KEEP_W),
-        .USER_W(USER_W)
+        .USER_W(USER_W),
+        .READY_MODE  (SINK_READY_MODE),
+        .DUTY_PERIOD (SINK_DUTY_PERIOD),
+        .DUTY_STALL  (SINK_DUTY_STALL),
+        .LFSR_SEED   (SINK_LFSR_SEED),
+        .STALL_THRESH(SINK_STALL_THRESH),
+        .BURST_BEATS (SINK_BURST_BEATS),
+        .BURST_STALL (SINK_BURST_STALL)
     ) u_sink (
         .aclk(aclk),
         .aresetn(aresetn),
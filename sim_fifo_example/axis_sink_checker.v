@@ -3,39 +3,134 @@
 module axis_sink_checker #(
     parameter integer DATA_W = 32,
     parameter integer KEEP_W = (DATA_W/8),
-    parameter integer USER_W = 1
+    parameter integer USER_W = 1,
+    // tready 패턴 (시뮬레이션에서는 +SINK_READY_MODE=N 등 plusarg로 덮어쓸 수 있음)
+    //   0: 항상 ready
+    //   1: 듀티 - DUTY_PERIOD 주기 중 앞부분 ready, 마지막 DUTY_STALL 사이클 stall
+    //   2: LFSR - lfsr[7:0] >= STALL_THRESH 일 때 ready (sim/simlib/backpressure.py lfsr()와 비트 단위 동일)
+    //   3: 버스트-스톨 - BURST_BEATS 비트를 받을 때마다 BURST_STALL 사이클 stall
+    parameter integer READY_MODE   = 0,
+    parameter integer DUTY_PERIOD  = 4,
+    parameter integer DUTY_STALL   = 2,
+    parameter [15:0]  LFSR_SEED    = 16'hACE1,
+    parameter integer STALL_THRESH = 128,   // 0..256, stall 비율 = STALL_THRESH/256
+    parameter integer BURST_BEATS  = 64,
+    parameter integer BURST_STALL  = 32
 )(
     input  wire                 aclk,
     input  wire                 aresetn,
 
     input  wire                 s_axis_tvalid,
-    output reg                  s_axis_tready,
+    output wire                 s_axis_tready,
     input  wire [DATA_W-1:0]    s_axis_tdata,
     input  wire [KEEP_W-1:0]    s_axis_tkeep,
     input  wire                 s_axis_tlast,
     input  wire [USER_W-1:0]    s_axis_tuser
 );
-    // 간단한 백프레셔: 몇 사이클마다 ready 토글
-    reg [3:0] rdy_div;
+    localparam integer MODE_ALWAYS = 0;
+    localparam integer MODE_DUTY   = 1;
+    localparam integer MODE_LFSR   = 2;
+    localparam integer MODE_BURST  = 3;
+
+    // 동작 설정: 파라미터 값으로 시작, 시뮬레이션에서는 plusarg가 우선
+    reg [31:0] ready_mode   = READY_MODE;
+    reg [31:0] duty_period  = DUTY_PERIOD;
+    reg [31:0] duty_stall   = DUTY_STALL;
+    reg [15:0] lfsr_seed    = LFSR_SEED;
+    reg [31:0] stall_thresh = STALL_THRESH;
+    reg [31:0] burst_beats  = BURST_BEATS;
+    reg [31:0] burst_stall  = BURST_STALL;
+
+    // synthesis translate_off
+    initial begin
+        if ($value$plusargs("SINK_READY_MODE=%d", ready_mode)) ;
+        if ($value$plusargs("SINK_DUTY_PERIOD=%d", duty_period)) ;
+        if ($value$plusargs("SINK_DUTY_STALL=%d", duty_stall)) ;
+        if ($value$plusargs("SINK_LFSR_SEED=%h", lfsr_seed)) ;
+        if ($value$plusargs("SINK_STALL_THRESH=%d", stall_thresh)) ;
+        if ($value$plusargs("SINK_BURST_BEATS=%d", burst_beats)) ;
+        if ($value$plusargs("SINK_BURST_STALL=%d", burst_stall)) ;
+    end
+    // synthesis translate_on
+
+    // 리셋 해제 다음 사이클부터 동작 (LFSR은 이 첫 사이클에 seed 값)
+    reg        active;
+    reg [31:0] duty_cnt;
+    reg [15:0] lfsr;
+    reg [31:0] burst_cnt;   // 현재 버스트에서 받은 비트 수
+    reg [31:0] stall_cnt;   // 남은 stall 사이클 수 (버스트-스톨)
+
+    reg ready_pat;
+    always @(*) begin
+        case (ready_mode)
+            MODE_DUTY:  ready_pat = (duty_cnt < duty_period - duty_stall);
+            MODE_LFSR:  ready_pat = ({24'd0, lfsr[7:0]} >= stall_thresh);
+            MODE_BURST: ready_pat = (stall_cnt == 32'd0);
+            default:    ready_pat = 1'b1;
+        endcase
+    end
+
+    assign s_axis_tready = active & ready_pat;
+
+    wire beat = s_axis_tvalid && s_axis_tready;
 
     // 수신 카운터/프레임 카운터
     reg [31:0] beat_rcv;
     reg [31:0] frame_rcv;
 
+    // 테스트 종료 시 한 번 읽는 누적 카운터 (사이클마다 샘플링할 필요 없음)
+    reg [31:0] beat_total;      // 받은 비트 수
+    reg [31:0] stall_cycles;    // tvalid=1 인데 tready=0 (싱크가 만든 백프레셔)
+    reg [31:0] starve_cycles;   // tready=1 인데 tvalid=0 (싱크가 데이터를 기다림)
+    reg [31:0] bubble_cycles;   // 그중 프레임 도중 (첫 비트 이후 tlast 전): 패킷이 끊겨 들어온 사이클
+    reg [31:0] active_cycles;   // 리셋 해제 후 경과 사이클
+
     always @(posedge aclk) begin
         if (!aresetn) begin
-            rdy_div      <= 4'd0;
-            s_axis_tready<= 1'b0;
-            beat_rcv     <= 32'd0;
-            frame_rcv    <= 32'd0;
+            active        <= 1'b0;
+            duty_cnt      <= 32'd0;
+            lfsr          <= lfsr_seed;
+            burst_cnt     <= 32'd0;
+            stall_cnt     <= 32'd0;
+            beat_rcv      <= 32'd0;
+            frame_rcv     <= 32'd0;
+            beat_total    <= 32'd0;
+            stall_cycles  <= 32'd0;
+            starve_cycles <= 32'd0;
+            bubble_cycles <= 32'd0;
+            active_cycles <= 32'd0;
         end else begin
-            rdy_div <= rdy_div + 1;
-            // 1/2 duty로 backpressure (테스트 목적)
-            // s_axis_tready <= rdy_div[0];
-            s_axis_tready <= 1;
+            active <= 1'b1;
+
+            if (active) begin
+                active_cycles <= active_cycles + 1;
+                duty_cnt      <= (duty_cnt + 1 >= duty_period) ? 32'd0 : duty_cnt + 1;
+                lfsr          <= {lfsr[14:0], lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10]};
+
+                // 버스트-스톨: BURST_BEATS번째 비트를 받은 다음 사이클부터 BURST_STALL 사이클 stall
+                if (stall_cnt != 32'd0) begin
+                    stall_cnt <= stall_cnt - 1;
+                end else if (beat) begin
+                    if (burst_cnt + 1 >= burst_beats) begin
+                        burst_cnt <= 32'd0;
+                        stall_cnt <= burst_stall;
+                    end else begin
+                        burst_cnt <= burst_cnt + 1;
+                    end
+                end
+
+                if (s_axis_tvalid && !s_axis_tready)
+                    stall_cycles <= stall_cycles + 1;
+                if (!s_axis_tvalid && s_axis_tready) begin
+                    starve_cycles <= starve_cycles + 1;
+                    if (beat_rcv != 32'd0)
+                        bubble_cycles <= bubble_cycles + 1;
+                end
+            end
 
-            if (s_axis_tvalid && s_axis_tready) begin
-                beat_rcv <= beat_rcv + 1;
+            if (beat) begin
+                beat_total <= beat_total + 1;
+                beat_rcv   <= beat_rcv + 1;
                 if (s_axis_tlast) begin
                     frame_rcv <= frame_rcv + 1;
                     // 시뮬에서 확인용: 프레임 종료 표시
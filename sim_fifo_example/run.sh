@@ -16,11 +16,20 @@
 #   xsim-gui - xsim GUI 모드로 시뮬레이션 실행
 #   xsim-vcd - xsim으로 VCD 파일 생성 후 시뮬레이션
 #
+# === Icarus 모드 (Vivado 불필요) ===
+#   icarus   - iverilog/vvp로 실행 (FIFO는 항상 행동 모델)
+#
+# FIFO 모델 (환경 변수 FIFO_MODEL):
+#   xpm (기본) - xpm_fifo_axis (questa: 컴파일된 XPM 라이브러리, xsim: XPM 소스 컴파일)
+#   beh        - axis_fifo_beh.v 행동 모델, XPM 컴파일 생략 (+define+AXIS_FIFO_BEHAVIORAL)
+#
 # 예시:
 #   ./run.sh              # QuestaSim 배치 모드
 #   ./run.sh gui          # QuestaSim GUI 모드
 #   ./run.sh xsim         # xsim 배치 모드 (Vivado 필요)
 #   ./run.sh xsim-vcd     # xsim VCD 생성 모드
+#   FIFO_MODEL=beh ./run.sh xsim   # XPM 컴파일 없이 xsim 실행
+#   ./run.sh icarus       # Icarus Verilog (행동 모델)
 
 # 옵션 파싱
 MODE="batch"
@@ -34,11 +43,24 @@ case $MODE in
     "xsim"|"xsim-gui"|"xsim-vcd")
         SIMULATOR="xsim"
         ;;
+    "icarus")
+        SIMULATOR="icarus"
+        ;;
     *)
         SIMULATOR="questa"
         ;;
 esac
 
+# FIFO 모델 결정 (Icarus는 XPM을 컴파일할 수 없으므로 항상 beh)
+FIFO_MODEL="${FIFO_MODEL:-xpm}"
+if [ "$SIMULATOR" = "icarus" ]; then
+    FIFO_MODEL="beh"
+fi
+if [ "$FIFO_MODEL" != "xpm" ] && [ "$FIFO_MODEL" != "beh" ]; then
+    echo "오류: FIFO_MODEL은 xpm 또는 beh 이어야 합니다 (현재: $FIFO_MODEL)"
+    exit 1
+fi
+
 # 시뮬레이터별 변수 설정
 if [ "$SIMULATOR" = "questa" ]; then
     VLOG="vlog"
@@ -62,10 +84,17 @@ elif [ "$SIMULATOR" = "xsim" ]; then
     XPM_CDC_PATH="/tools/Xilinx/2025.1/data/ip/xpm/xpm_cdc/hdl/xpm_cdc.sv"
     XPM_MEMORY_PATH="/tools/Xilinx/2025.1/data/ip/xpm/xpm_memory/hdl/xpm_memory.sv"
     GLBL_PATH="/tools/Xilinx/2025.1/data/verilog/src/glbl.v"
+elif [ "$SIMULATOR" = "icarus" ]; then
+    if ! command -v iverilog &> /dev/null || ! command -v vvp &> /dev/null; then
+        echo "오류: Icarus Verilog (iverilog, vvp)가 설치되어 있지 않습니다."
+        exit 1
+    fi
+    VLOG="iverilog"
+    VSIM="vvp"
 fi
 
 # 파일 경로 설정
-PROJECT_DIR="/home/wslee/repos/fpga_vsim_cli_test"
+PROJECT_DIR="${PROJECT_DIR:-/home/wslee/repos/fpga_vsim_cli_test}"
 DESIGN_DIR="$PROJECT_DIR"
 SIM_DIR="$PROJECT_DIR/sim_fifo_example"
 
@@ -76,6 +105,17 @@ DESIGN_FILES="\
     $SIM_DIR/axis_counter_src.v \
     $SIM_DIR/axis_sink_checker.v"
 
+# 행동 모델: axis_fifo_xpm이 axis_fifo_beh를 감싸도록 define 추가
+DEFINES=""
+if [ "$FIFO_MODEL" = "beh" ]; then
+    DESIGN_FILES="$DESIGN_FILES $DESIGN_DIR/axis_fifo_beh.v"
+    case $SIMULATOR in
+        "questa") DEFINES="+define+AXIS_FIFO_BEHAVIORAL" ;;
+        "xsim")   DEFINES="--define AXIS_FIFO_BEHAVIORAL" ;;
+        "icarus") DEFINES="-DAXIS_FIFO_BEHAVIORAL" ;;
+    esac
+fi
+
 # 테스트벤치 파일
 TB_FILE="$SIM_DIR/tb_axis_fifo_example.sv"
 
@@ -85,6 +125,7 @@ TOP_MODULE="tb_axis_fifo_example"
 echo "=== AXIS FIFO 예제 시뮬레이션 시작 ==="
 echo "모드: $MODE"
 echo "시뮬레이터: $SIMULATOR"
+echo "FIFO 모델: $FIFO_MODEL"
 echo "프로젝트 디렉토리: $PROJECT_DIR"
 echo "시뮬레이션 디렉토리: $SIM_DIR"
 echo ""
@@ -101,17 +142,19 @@ if [ "$SIMULATOR" = "questa" ]; then
         exit 1
     fi
 else
-    echo "xsim 시뮬레이터 준비..."
+    echo "$SIMULATOR 시뮬레이터 준비..."
 fi
 
 # 문법 체크 모드
 if [ "$MODE" = "check" ]; then
     echo "문법 체크만 수행합니다..."
-    if [ "$SIMULATOR" = "xsim" ]; then
+    if [ "$SIMULATOR" = "xsim" ] && [ "$FIFO_MODEL" = "xpm" ]; then
         # XPM 라이브러리 포함해서 체크
         $VLOG -sv -work xpm_lib --define SIMULATION $GLBL_PATH $XPM_CDC_PATH $XPM_MEMORY_PATH $XPM_FIFO_PATH $DESIGN_FILES $TB_FILE
+    elif [ "$SIMULATOR" = "icarus" ]; then
+        $VLOG -g2012 $DEFINES -s $TOP_MODULE -o /dev/null $DESIGN_FILES $TB_FILE
     else
-        $VLOG -sv $DESIGN_FILES $TB_FILE
+        $VLOG -sv $DEFINES $DESIGN_FILES $TB_FILE
     fi
     if [ $? -eq 0 ]; then
         echo "문법 체크 통과!"
@@ -124,19 +167,25 @@ fi
 
 echo "1. SystemVerilog/Verilog 파일 컴파일..."
 if [ "$SIMULATOR" = "questa" ]; then
-    $VLOG -sv $DESIGN_FILES $TB_FILE
+    $VLOG -sv $DEFINES $DESIGN_FILES $TB_FILE
 elif [ "$SIMULATOR" = "xsim" ]; then
-    # XPM 라이브러리 파일들 먼저 컴파일
-    echo "  - XPM 라이브러리 컴파일..."
-    $VLOG -sv -work xpm_lib --define SIMULATION --relax $GLBL_PATH $XPM_CDC_PATH $XPM_MEMORY_PATH $XPM_FIFO_PATH
-    if [ $? -ne 0 ]; then
-        echo "XPM 라이브러리 컴파일 실패!"
-        exit 1
+    if [ "$FIFO_MODEL" = "xpm" ]; then
+        # XPM 라이브러리 파일들 먼저 컴파일
+        echo "  - XPM 라이브러리 컴파일..."
+        $VLOG -sv -work xpm_lib --define SIMULATION --relax $GLBL_PATH $XPM_CDC_PATH $XPM_MEMORY_PATH $XPM_FIFO_PATH
+        if [ $? -ne 0 ]; then
+            echo "XPM 라이브러리 컴파일 실패!"
+            exit 1
+        fi
+    else
+        echo "  - 행동 모델 사용: XPM 라이브러리 컴파일 생략"
     fi
 
     # 디자인 파일들 컴파일
     echo "  - 디자인 파일들 컴파일..."
-    $VLOG -sv $DESIGN_FILES $TB_FILE
+    $VLOG -sv $DEFINES $DESIGN_FILES $TB_FILE
+elif [ "$SIMULATOR" = "icarus" ]; then
+    $VLOG -g2012 $DEFINES -s $TOP_MODULE -o ${TOP_MODULE}.vvp $DESIGN_FILES $TB_FILE
 fi
 if [ $? -ne 0 ]; then
     echo "컴파일 실패!"
@@ -146,7 +195,11 @@ fi
 # xsim의 경우 엘라보레이션 단계 추가
 if [ "$SIMULATOR" = "xsim" ]; then
     echo "2. 디자인 엘라보레이션..."
-    $XELAB -debug typical -L xpm_lib --define SIMULATION --relax $TOP_MODULE xpm_lib.glbl -s ${TOP_MODULE}_sim
+    if [ "$FIFO_MODEL" = "xpm" ]; then
+        $XELAB -debug typical -L xpm_lib --define SIMULATION --relax $TOP_MODULE xpm_lib.glbl -s ${TOP_MODULE}_sim
+    else
+        $XELAB -debug typical --relax $TOP_MODULE -s ${TOP_MODULE}_sim
+    fi
     if [ $? -ne 0 ]; then
         echo "엘라보레이션 실패!"
         exit 1
@@ -186,6 +239,10 @@ case $MODE in
         echo ""
         echo "VCD 파일이 생성되었습니다. GTKWave 등으로 확인하세요."
         ;;
+    "icarus")
+        echo "Icarus(vvp)로 시뮬레이션 실행..."
+        $VSIM ${TOP_MODULE}.vvp
+        ;;
     "batch"|*)
         echo "배치 모드로 시뮬레이션 실행..."
         $VSIM -c -do "run -all; quit" $TOP_MODULE
@@ -0,0 +1,328 @@
+"""
+AXIS FIFO example pipeline cocotb testbench
+
+axis_fifo_example_top chains axis_counter_src -> axis_fifo_xpm (u_fifo) ->
+axis_sink_checker. Two AxisProbes watch the FIFO input (s_t*) and output
+(m_t*) every clock:
+
+  - both streams are checked against the source pattern
+    {frame_id[23:0], beat_cnt[7:0]}, tlast on the last beat of each frame,
+    so a lost, duplicated or reordered beat is caught on whichever side it
+    happens
+  - beats are matched in order across the FIFO, which gives per-beat and
+    per-frame latency and the FIFO occupancy without any RTL probe
+  - the report gives the sustained beats/cycle on both sides, the cycles the
+    source was held back by s_tready (FIFO-induced stalls) and the cycles the
+    sink was ready with nothing to take
+
+axis_sink_checker makes the backpressure itself (SINK_READY=always|duty|lfsr|
+burst, see the Makefile) and keeps beat/stall/starve counters that are read
+once at the end. test_fifo_example_sink_pattern checks its tready cycle by
+cycle against the Python model (simlib.backpressure for duty and lfsr) and
+the counters against what was sampled.
+
+PACKET_FIFO=true puts u_fifo in store-and-forward mode: a frame leaves only
+once its tlast is stored, so the sink must never wait in the middle of a
+frame (bubble_cycles stays 0) while first-beat latency grows by about a
+frame. SRC_BEAT_GAP=N slows the source to one beat every N+1 cycles, which
+is what exposes the bubbles of the cut-through FIFO. sim/packet_fifo_sweep.py
+compares both modes over frame lengths and sink profiles.
+
+FIFO_EXAMPLE_CYCLES sets the run length, FIFO_REPORT=<file.json> writes the
+report for other tools.
+"""
+
+import json
+import os
+from collections import deque
+
+import cocotb
+import numpy as np
+from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge
+
+from simlib.axis_monitor import AxisProbe, read_int
+from simlib.backpressure import duty, lfsr
+from simlib.scoreboard import StreamScoreboard
+from simlib.tester import TesterBase
+
+
+CLK_NS = 10
+RUN_CYCLES = int(os.environ.get("FIFO_EXAMPLE_CYCLES", "20000"))
+FIFO_REPORT = os.environ.get("FIFO_REPORT")
+FIFO_MODEL = os.environ.get("FIFO_MODEL", "beh")
+PACKET_FIFO = os.environ.get("PACKET_FIFO", "false")
+
+RST_BUSY_CYCLES = 4     # axis_fifo_beh / xpm_fifo_axis s_axis_tready low after reset
+FIFO_CAPACITY = 1024 + 2    # u_fifo DEPTH + FWFT output stages
+PATTERN_CYCLES = 4000
+
+# axis_sink_checker READY_MODE values
+SINK_MODES = {0: "always", 1: "duty", 2: "lfsr", 3: "burst"}
+SINK_CONFIG = ("ready_mode", "duty_period", "duty_stall", "lfsr_seed", "stall_thresh",
+               "burst_beats", "burst_stall")
+SINK_COUNTERS = ("beat_total", "frame_rcv", "stall_cycles", "starve_cycles", "bubble_cycles",
+                 "active_cycles")
+
+
+def frame_pattern(frame_beats, width=32):
+    """Endless (tdata, tlast) stream of axis_counter_src"""
+    mask = (1 << width) - 1
+    frame = 0
+    while True:
+        for beat in range(frame_beats):
+            yield ((((frame & 0xFFFFFF) << 8) | (beat & 0xFF)) & mask, int(beat == frame_beats - 1))
+        frame += 1
+
+
+def sink_ready_model(config, valid):
+    """tready of axis_sink_checker for its first len(valid) active cycles
+
+    valid is the tvalid the sink saw in the same cycles (only the burst mode
+    depends on it).
+    """
+    n = len(valid)
+    mode = SINK_MODES.get(config["ready_mode"], "always")
+    if mode == "duty":
+        return duty(n, config["duty_period"], config["duty_stall"] / config["duty_period"])
+    if mode == "lfsr":
+        return lfsr(n, config["stall_thresh"] / 256, config["lfsr_seed"])
+    if mode == "burst":
+        ready = np.ones(n, dtype=np.uint8)
+        beats = stall = 0
+        for i in range(n):
+            if stall:
+                ready[i] = 0
+                stall -= 1
+            elif valid[i]:
+                beats += 1
+                if beats >= config["burst_beats"]:
+                    beats, stall = 0, config["burst_stall"]
+        return ready
+    return np.ones(n, dtype=np.uint8)
+
+
+def _stats(values):
+    if not len(values):
+        return {"min": None, "mean": None, "max": None}
+    values = np.asarray(values)
+    return {"min": int(values.min()), "mean": round(float(values.mean()), 2), "max": int(values.max())}
+
+
+class FifoExampleTester(TesterBase):
+    """Probes on both sides of u_fifo, pattern scoreboards and latency bookkeeping"""
+
+    def __init__(self, dut):
+        super().__init__(dut)
+        self.frame_beats = int(dut.FRAME_BEATS.value)
+        width = len(dut.s_tdata)
+        self.source_board = StreamScoreboard(frame_pattern(self.frame_beats, width), name="source", log=dut._log)
+        self.sink_board = StreamScoreboard(frame_pattern(self.frame_beats, width), name="sink", log=dut._log)
+        self.source = AxisProbe(self.clock, dut.s_tvalid, dut.s_tready, dut.s_tdata, dut.s_tlast,
+                                callback=self._on_source, width=width)
+        self.sink = AxisProbe(self.clock, dut.m_tvalid, dut.m_tready, dut.m_tdata, dut.m_tlast,
+                              callback=self._on_sink, width=width)
+
+        self._in_flight = deque()       # source cycle of every beat inside the FIFO
+        self._frame_in = deque()        # source cycle of the first beat of every open frame
+        self._source_beat = 0
+        self._sink_beat = 0
+        self.beat_latency = []          # sink cycle - source cycle, per beat
+        self.first_beat_latency = []    # first beat in -> first beat out, per frame
+        self.frame_latency = []         # first beat in -> last beat out, per frame
+        self.max_occupancy = 0
+        self.sink_warmup_starves = 0    # sink starve cycles before the first beat came out
+
+    def _on_source(self, beat):
+        cycle, data, tlast = beat
+        self.source_board.check((data, tlast))
+        self._in_flight.append(cycle)
+        if self._source_beat == 0:
+            self._frame_in.append(cycle)
+        self._source_beat = 0 if tlast else self._source_beat + 1
+        self.max_occupancy = max(self.max_occupancy, len(self._in_flight))
+
+    def _on_sink(self, beat):
+        cycle, data, tlast = beat
+        self.sink_board.check((data, tlast))
+        if self.sink.beats == 1:
+            self.sink_warmup_starves = self.sink.starves
+        if not self._in_flight:
+            # reported by the sink scoreboard as unexpected/mismatching
+            return
+        self.beat_latency.append(cycle - self._in_flight.popleft())
+        if self._sink_beat == 0 and self._frame_in:
+            self.first_beat_latency.append(cycle - self._frame_in[0])
+        if tlast and self._frame_in:
+            self.frame_latency.append(cycle - self._frame_in.popleft())
+        self._sink_beat = 0 if tlast else self._sink_beat + 1
+
+    def sink_config(self):
+        """tready pattern settings of u_sink (parameters or +SINK_* plusargs)"""
+        config = {name: read_int(getattr(self.dut.u_sink, name)) for name in SINK_CONFIG}
+        config["mode"] = SINK_MODES.get(config["ready_mode"], "always")
+        return config
+
+    def sink_counters(self):
+        """u_sink's cumulative counters, read once instead of sampling every cycle"""
+        return {name: read_int(getattr(self.dut.u_sink, name)) for name in SINK_COUNTERS}
+
+    async def reset(self, cycles=10):
+        self.dut.aresetn.value = 0
+        await ClockCycles(self.clock, cycles)
+        self.dut.aresetn.value = 1
+
+    async def run(self, cycles):
+        """Reset, then let the pipeline run for `cycles` clocks under both probes"""
+        self.start_clock(CLK_NS)
+        await self.reset()
+        tasks = [cocotb.start_soon(self.source.run()), cocotb.start_soon(self.sink.run())]
+        await ClockCycles(self.clock, cycles)
+        await RisingEdge(self.clock)
+        for task in tasks:
+            task.kill()
+
+    def summary(self):
+        """Measurement results as a flat-ish dict (also what FIFO_REPORT holds)"""
+        counters = self.sink_counters()
+        return {
+            "fifo_model": FIFO_MODEL,
+            "packet_fifo": PACKET_FIFO,
+            "frame_beats": self.frame_beats,
+            "src_beat_gap": read_int(self.dut.u_src.beat_gap),
+            "cycles": self.source.cycles,
+            "source_beats": self.source.beats,
+            "sink_beats": self.sink.beats,
+            "frames": len(self.frame_latency),
+            "source_beats_per_cycle": round(self.source.beats_per_cycle, 4),
+            "sink_beats_per_cycle": round(self.sink.beats_per_cycle, 4),
+            "fifo_stall_cycles": self.source.stalls,
+            "sink_starve_cycles": self.sink.starves,
+            "max_occupancy": self.max_occupancy,
+            "beat_latency": _stats(self.beat_latency),
+            "first_beat_latency": _stats(self.first_beat_latency),
+            "frame_latency": _stats(self.frame_latency),
+            "sink_mode": self.sink_config()["mode"],
+            "sink_counters": counters,
+            "bubbles_per_frame": round(counters["bubble_cycles"] / max(counters["frame_rcv"], 1), 3),
+        }
+
+    def report(self, summary=None):
+        summary = summary or self.summary()
+        log = self.dut._log
+        log.info(f"FIFO example ({summary['fifo_model']}, PACKET_FIFO={summary['packet_fifo']}, "
+                 f"FRAME_BEATS={self.frame_beats}, SRC_BEAT_GAP={summary['src_beat_gap']}, "
+                 f"sink {summary['sink_mode']}), {summary['cycles']} cycles:")
+        log.info(f"  beats/cycle         source {summary['source_beats_per_cycle']:.4f}  "
+                 f"sink {summary['sink_beats_per_cycle']:.4f}  ({summary['sink_beats']} beats, "
+                 f"{summary['frames']} frames)")
+        log.info(f"  stalls              source held by s_tready {summary['fifo_stall_cycles']} cycles, "
+                 f"sink starved {summary['sink_starve_cycles']} cycles")
+        counters = summary["sink_counters"]
+        log.info(f"  sink counters       {counters['beat_total']} beats, {counters['stall_cycles']} stall / "
+                 f"{counters['starve_cycles']} starve of {counters['active_cycles']} cycles")
+        log.info(f"  mid-frame bubbles   {counters['bubble_cycles']} cycles over {counters['frame_rcv']} frames "
+                 f"({summary['bubbles_per_frame']} per frame)")
+        log.info(f"  occupancy           max {summary['max_occupancy']} beats")
+        for name in ("beat_latency", "first_beat_latency", "frame_latency"):
+            s = summary[name]
+            log.info(f"  {name:<20}min {s['min']}  mean {s['mean']}  max {s['max']} cycles")
+        if FIFO_REPORT:
+            with open(FIFO_REPORT, "w") as f:
+                json.dump(summary, f, indent=1)
+                f.write("\n")
+        return summary
+
+    def check_streams(self):
+        for board in (self.source_board, self.sink_board):
+            board.report()
+            assert board.mismatches == 0 and board.unexpected == 0, \
+                f"{board.name}: {board.mismatches} mismatching, {board.unexpected} unexpected beats"
+
+
+@cocotb.test()
+async def test_fifo_example_frames(dut):
+    """{frame_id, beat} pattern and tlast intact on both sides of the FIFO, nothing lost"""
+    tester = FifoExampleTester(dut)
+    await tester.run(RUN_CYCLES)
+
+    tester.check_streams()
+    in_flight = tester.source.beats - tester.sink.beats
+    dut._log.info(f"{tester.sink.beats} beats through the FIFO, {in_flight} still inside")
+    assert tester.sink.beats > tester.frame_beats, "no complete frame reached the sink"
+    assert 0 <= in_flight <= FIFO_CAPACITY, \
+        f"{in_flight} beats inside a FIFO that holds {FIFO_CAPACITY}"
+    assert tester.sink.beats >= tester.source.beats - FIFO_CAPACITY, \
+        f"sink {tester.sink.beats} beats behind source {tester.source.beats} by more than the FIFO holds"
+
+
+@cocotb.test()
+async def test_fifo_example_throughput(dut):
+    """Sustained rate, latency and FIFO-induced stalls of the pipeline"""
+    tester = FifoExampleTester(dut)
+    await tester.run(RUN_CYCLES)
+    tester.check_streams()
+    summary = tester.report()
+
+    if summary["packet_fifo"] == "true":
+        # store-and-forward: a frame is released only when complete, so it
+        # reaches the sink without gaps whatever the source pacing
+        assert summary["sink_counters"]["bubble_cycles"] == 0, \
+            f"{summary['sink_counters']['bubble_cycles']} mid-frame bubbles in packet mode"
+    if summary["src_beat_gap"]:
+        # a paced source sets the rate; the checks below assume it never pauses
+        return
+    if summary["sink_mode"] == "always":
+        # source always valid, sink always ready: the FIFO must stream at full rate
+        # and hold the source back only while it leaves reset (rst_busy)
+        assert summary["sink_beats_per_cycle"] == 1.0, f"sink rate {summary['sink_beats_per_cycle']}"
+        assert summary["fifo_stall_cycles"] <= RST_BUSY_CYCLES, \
+            f"source stalled {summary['fifo_stall_cycles']} cycles with an always-ready sink"
+    else:
+        # the source never pauses, so once the first beat is through the FIFO the
+        # sink must find data on every cycle it is ready
+        starved = summary["sink_starve_cycles"] - tester.sink_warmup_starves
+        assert starved == 0, f"sink starved {starved} cycles behind an always-valid source"
+        assert summary["sink_counters"]["stall_cycles"] > 0, f"{summary['sink_mode']} sink never stalled"
+
+
+@cocotb.test()
+async def test_fifo_example_sink_pattern(dut):
+    """Sink tready follows its model cycle by cycle, end-of-test counters match"""
+    tester = FifoExampleTester(dut)
+    config = tester.sink_config()
+    sink = dut.u_sink
+    tester.start_clock(CLK_NS)
+    await tester.reset()
+
+    while not read_int(sink.active) & 1:
+        await FallingEdge(tester.clock)
+    valid = np.zeros(PATTERN_CYCLES, dtype=np.uint8)
+    ready = np.zeros(PATTERN_CYCLES, dtype=np.uint8)
+    last = np.zeros(PATTERN_CYCLES, dtype=np.uint8)
+    for i in range(PATTERN_CYCLES):
+        valid[i] = read_int(sink.s_axis_tvalid) & 1
+        ready[i] = read_int(sink.s_axis_tready) & 1
+        last[i] = read_int(sink.s_axis_tlast) & 1
+        await FallingEdge(tester.clock)
+    # counters now include the last sampled cycle
+    counters = tester.sink_counters()
+
+    expected = sink_ready_model(config, valid)
+    wrong = np.flatnonzero(ready != expected)
+    dut._log.info(f"sink {config['mode']}: {int(ready.sum())}/{PATTERN_CYCLES} ready cycles, "
+                  f"{len(wrong)} differ from the model; counters {counters}")
+    assert len(wrong) == 0, f"tready differs from the {config['mode']} model at cycles {wrong[:10].tolist()}"
+    beat = valid & ready
+    starve = (1 - valid) & ready
+    # a starve cycle is a bubble when part of a frame has already been taken
+    taken = np.cumsum(beat)
+    frame_end = np.maximum.accumulate(np.where(beat & last, taken, 0))   # beats up to the last tlast
+    in_frame = np.concatenate(([0], taken[:-1])) > np.concatenate(([0], frame_end[:-1]))
+    assert counters == {
+        "beat_total": int(beat.sum()),
+        "frame_rcv": int((beat & last).sum()),
+        "stall_cycles": int((valid & (1 - ready)).sum()),
+        "starve_cycles": int(starve.sum()),
+        "bubble_cycles": int((starve & in_frame).sum()),
+        "active_cycles": PATTERN_CYCLES,
+    }
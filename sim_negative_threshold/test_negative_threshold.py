@@ -9,6 +9,8 @@ from cocotb.triggers import Timer
 from cocotb.result import TestFailure
 import random
 
+from simlib import golden
+
 
 @cocotb.test()
 async def test_negative_threshold_basic(dut):
@@ -205,8 +207,9 @@ async def test_negative_threshold_random(dut):
         dut.data_in.value = data_in
         await Timer(10, units="ns")
 
-        expected_neg100 = 1 if data_in > -100 else 0
-        expected_neg50 = 1 if data_in > -50 else 0
+        expected = golden.negative_threshold_dataover(data_in)
+        expected_neg100 = int(expected["data_over_neg100"])
+        expected_neg50 = int(expected["data_over_neg50"])
         actual_neg100 = int(dut.data_over_neg100.value)
         actual_neg50 = int(dut.data_over_neg50.value)
 
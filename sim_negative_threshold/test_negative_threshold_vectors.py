@@ -0,0 +1,53 @@
+"""
+negative_threshold_dataover vector-engine testbench (make vectors)
+
+vec_negative_threshold_dataover puts sim/vec_player.sv in front of negative_threshold_dataover: the data_in
+vectors are generated and checked with NumPy and played in DEPTH-sized
+batches, one per clock, so a million signed comparisons run without
+per-vector GPI calls. VEC_COUNT sets the number of random vectors, VEC_SEED
+the generator seed.
+"""
+
+import os
+
+import cocotb
+import numpy as np
+
+from simlib import golden
+from simlib.vectors import VectorPlayer
+
+
+VEC_COUNT = int(os.environ.get("VEC_COUNT", "1000000"))
+VEC_SEED = int(os.environ.get("VEC_SEED", "1"))
+
+INT32_MIN, INT32_MAX = -(1 << 31), (1 << 31) - 1
+THRESHOLDS = golden.NEGATIVE_THRESHOLDS
+
+
+def vectors(count, seed):
+    """Extremes, every value within 4 of a threshold, then uniform random"""
+    rng = np.random.default_rng(seed)
+    edges = [INT32_MIN, INT32_MIN + 1, -1, 0, 1, INT32_MAX - 1, INT32_MAX]
+    edges += [t + d for t in THRESHOLDS.values() for d in range(-4, 5)]
+    rand = rng.integers(INT32_MIN, INT32_MAX, count, dtype=np.int64, endpoint=True)
+    return np.concatenate([np.array(edges, dtype=np.int64), rand])
+
+
+@cocotb.test()
+async def test_negative_threshold_dataover_vectors(dut):
+    """Each output == (data_in > its threshold), signed, for VEC_COUNT vectors"""
+    player = VectorPlayer(dut, inputs=[("data_in", 32)], outputs=[("data_over_neg100", 1), ("data_over_neg50", 1)])
+    player.start_clock()
+
+    data_in = vectors(VEC_COUNT, VEC_SEED)
+    out = await player.run({"data_in": data_in})
+
+    failed = 0
+    for name, expected in golden.negative_threshold_dataover(data_in).items():
+        bad = np.flatnonzero(out[name] != expected)
+        for i in bad[:10]:
+            dut._log.error(f"vector {i}: data_in={data_in[i]} expected {name}={expected[i]}, got {out[name][i]}")
+        failed += len(bad)
+    dut._log.info(f"{player.vectors} vectors in {player.batches} batches of up to {player.depth}, "
+                  f"{failed} mismatching outputs")
+    assert failed == 0, f"{failed} of {2 * len(data_in)} signed comparisons failed"
@@ -9,6 +9,8 @@ from cocotb.triggers import Timer
 from cocotb.result import TestFailure
 import random
 
+from simlib import golden
+
 
 @cocotb.test()
 async def test_two_dataover_basic(dut):
@@ -197,8 +199,9 @@ async def test_two_dataover_random(dut):
         dut.data_in.value = data_in
         await Timer(10, units="ns")
 
-        expected_100 = 1 if data_in > 100 else 0
-        expected_200 = 1 if data_in > 200 else 0
+        expected = golden.two_dataover(data_in)
+        expected_100 = int(expected["data_over_100"])
+        expected_200 = int(expected["data_over_200"])
         actual_100 = int(dut.data_over_100.value)
         actual_200 = int(dut.data_over_200.value)
 
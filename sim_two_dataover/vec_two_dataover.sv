@@ -0,0 +1,44 @@
+// vec_two_dataover.sv
+// Vector-engine wrapper for `make vectors` (sim/vectors.mk): sim/vec_player.sv
+// feeds two_dataover one data_in vector per clock.
+`timescale 1ns/1ps
+
+module vec_two_dataover #(
+    parameter integer DEPTH = 65536
+)(
+    input  wire        aclk,
+    input  wire        load,
+    input  wire        start,
+    input  wire        dump,
+    input  wire [31:0] count,
+    output wire        busy,
+    output wire        done
+);
+
+  wire [31:0] vec_in;
+  wire        data_over_100;
+  wire        data_over_200;
+
+  vec_player #(
+    .IN_W  (32),
+    .OUT_W (2),
+    .DEPTH (DEPTH)
+  ) u_player (
+    .aclk    (aclk),
+    .load    (load),
+    .start   (start),
+    .dump    (dump),
+    .count   (count),
+    .busy    (busy),
+    .done    (done),
+    .vec_in  (vec_in),
+    .vec_out ({data_over_100, data_over_200})
+  );
+
+  two_dataover u_dut (
+    .data_in       (vec_in),
+    .data_over_100 (data_over_100),
+    .data_over_200 (data_over_200)
+  );
+
+endmodule